@@ -1,6 +1,7 @@
-import argparse, pandas as pd, numpy as np, yfinance as yf, time
+import argparse, pandas as pd, numpy as np, yfinance as yf
 from pathlib import Path
-from tradingbot.data.yfinance_downloader import download_stock_data
+from tradingbot.data.bulk_downloader import download_universe
+from tradingbot.data.providers import set_provider, synthetic_universe
 from tradingbot.data.sp500_top50 import get_top100_symbols
 from tradingbot.data.market_benchmarks import get_spy_series, get_vix_series
 from tradingbot.config import strategies
@@ -11,6 +12,9 @@ def sharpe(r): return (r.mean()/r.std())*np.sqrt(252) if r.std() > 0 else 0.0
 def maxdd(eq): return (eq/eq.cummax()-1).min()
 
 def main(args):
+    if args.provider or args.n_tickers:
+        set_provider(args.provider or "synthetic")
+
     # Pre-load SPY and VIX series once to eliminate repeated downloads
     print("Pre-loading SPY and VIX series...")
     SPY_SERIES = get_spy_series()
@@ -19,33 +23,16 @@ def main(args):
     
     # Use top 100 S&P 500 stocks for more comprehensive simulation
     universe = get_top100_symbols()
+    if args.n_tickers:
+        universe = synthetic_universe(args.n_tickers)
     print(f"Downloading data for {len(universe)} symbols...")
     
-    price_data = {}
-    failed_count = 0
-    
-    # Download in smaller batches with delays to avoid rate limiting
-    batch_size = 10
-    for i in range(0, len(universe), batch_size):
-        batch = universe[i:i+batch_size]
-        print(f"Processing batch {i//batch_size + 1}/{(len(universe)-1)//batch_size + 1}: {batch[:3]}{'...' if len(batch) > 3 else ''}")
-        
-        for ticker in batch:
-            try:
-                df = download_stock_data(ticker, start=args.start, end=args.end)
-                if len(df) > 0:
-                    price_data[ticker] = df
-                    print(f"✓ {ticker}: {len(df)} rows")
-                else:
-                    print(f"✗ {ticker}: empty data")
-                    failed_count += 1
-            except Exception as e:
-                print(f"✗ {ticker}: {e}")
-                failed_count += 1
-        
-        # Brief delay between batches to respect rate limits
-        if i + batch_size < len(universe):
-            time.sleep(2)
+    # Cache misses are fetched concurrently through a shared rate limiter
+    price_data, failures = download_universe(universe, args.start, args.end)
+    price_data = {t: df for t, df in price_data.items() if len(df) > 0}
+    for ticker, reason in failures.items():
+        print(f"✗ {ticker}: {reason}")
+    failed_count = len(universe) - len(price_data)
     
     successful_count = len(price_data)
     print(f"\n=== DATA SUMMARY ===")
@@ -166,4 +153,12 @@ if __name__ == "__main__":
     ap.add_argument("--end",   default="2025-01-01")  # Extended to 2025
     ap.add_argument("--capital", type=float, default=100_000)
     ap.add_argument("--risk", type=float, default=0.0006)
-    main(ap.parse_args()) 
\ No newline at end of file
+    ap.add_argument("--provider", choices=["yfinance", "synthetic"],
+                    help="Market-data backend (default: config / TRADINGBOT_DATA_PROVIDER)")
+    ap.add_argument("--n_tickers", type=int,
+                    help="Profile on an N-stock synthetic universe (e.g. 50/500/5000)")
+    args = ap.parse_args()
+    if args.n_tickers and args.provider == "yfinance":
+        # SYN0000… names only exist in the synthetic market
+        ap.error("--n_tickers needs the synthetic provider, not --provider yfinance")
+    main(args) 
\ No newline at end of file
@@ -1,23 +1,27 @@
 # Trading Bot Package
+#
+# Public names are resolved lazily (PEP 562) so that ``import tradingbot``
+# stays cheap: vectorbt, yfinance and the broker SDK are only imported when
+# the attribute that needs them is first touched.
 
-# Sprint 9: Multi-ticker batch backtesting
-from tradingbot.backtest.aggregate import aggregate_metrics
-from tradingbot.backtest.batch_runner import grid_search_batch
+from importlib import import_module
+from importlib.util import find_spec
 
-# Sprint 10: Parameter persistence
-from tradingbot.backtest.save_params import load_saved_params, save_top_params
-from tradingbot.data.universe import DEFAULT_UNIVERSE, get_universe
+_LAZY = {
+    # Sprint 9: Multi-ticker batch backtesting
+    "aggregate_metrics": "tradingbot.backtest.aggregate",
+    "grid_search_batch": "tradingbot.backtest.batch_runner",
+    # Sprint 10: Parameter persistence
+    "load_saved_params": "tradingbot.backtest.save_params",
+    "save_top_params": "tradingbot.backtest.save_params",
+    "DEFAULT_UNIVERSE": "tradingbot.data.universe",
+    "get_universe": "tradingbot.data.universe",
+    # Sprint 11: Execution sandbox (optional dependencies)
+    "AlpacaClient": "tradingbot.exec.alpaca_client",
+    "DailySignalExecutor": "tradingbot.exec.order_router",
+}
 
-# Sprint 11: Execution sandbox (optional dependencies)
-try:
-    from tradingbot.exec.alpaca_client import AlpacaClient
-    from tradingbot.exec.order_router import DailySignalExecutor
-
-    _EXEC_AVAILABLE = True
-except ImportError:
-    AlpacaClient = None
-    DailySignalExecutor = None
-    _EXEC_AVAILABLE = False
+_EXEC_AVAILABLE = find_spec("alpaca") is not None
 
 __all__ = [
     "DEFAULT_UNIVERSE",
@@ -31,3 +35,20 @@ __all__ = [
 # Add execution classes only if available
 if _EXEC_AVAILABLE:
     __all__.extend(["DailySignalExecutor", "AlpacaClient"])
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(import_module(_LAZY[name]), name)
+    except ImportError:
+        if name not in ("AlpacaClient", "DailySignalExecutor"):
+            raise
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
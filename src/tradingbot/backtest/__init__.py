@@ -1,6 +1,22 @@
 # File: src/tradingbot/backtest/__init__.py
 
-from .metrics import backtest_metrics  # noqa: F401
-from .save_params import load_saved_params, save_top_params  # noqa: F401
-from .vbt_runner import run_backtest  # noqa: F401
-from .walkforward import walk_forward_optimize  # noqa: F401
+from importlib import import_module
+
+# Resolved on first access: run_backtest/backtest_metrics pull in vectorbt
+_LAZY = {
+    "backtest_metrics": ".metrics",
+    "load_saved_params": ".save_params",
+    "save_top_params": ".save_params",
+    "run_backtest": ".vbt_runner",
+    "walk_forward_optimize": ".walkforward",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
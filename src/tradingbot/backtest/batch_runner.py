@@ -2,69 +2,64 @@
 
 from __future__ import annotations
 
-from itertools import product
-from typing import Any, cast
+from typing import cast
 
 import pandas as pd
 
-from tradingbot.backtest.metrics import backtest_metrics
+from tradingbot.backtest.metrics import backtest_metrics_grid
+from tradingbot.data.panel import PricePanel
 from tradingbot.data.universe import get_universe
 from tradingbot.data.yfinance_downloader import download_stock_data
-from tradingbot.signals.mean_reversion import generate_mr_signal
-from tradingbot.signals.momentum import generate_mom_signal
+from tradingbot.signals.grid import expand_grid, mom_signal_grid, mr_signal_grid
 
 
 def grid_search_batch(
     start: str = "2022-01-03",
     end: str | None = None,
     universe: list[str] | None = None,
+    panel: PricePanel | None = None,
 ) -> pd.DataFrame:
     """
     Runs parameter grid across multiple tickers and returns aggregated metrics.
     SPRINT 14: Expanded grid to include looser thresholds for more trading activity.
+
+    If *panel* is given (e.g. a read-only ``open_memmap_panel`` export) each
+    ticker's bars are zero-copy views on it instead of per-ticker downloads.
     """
+    if panel is not None:
+        universe = universe or panel.tickers
     universe = get_universe(universe)
-    rows = []
     # SPRINT 14: Expanded MR grid to include looser -0.5 threshold
     mr_grid = dict(enter_thresh=[-0.5, -1.0], window=[20, 40])
     # SPRINT 14: Expanded momentum grid to include looser ±0.01 thresholds
     mom_grid = dict(long_thresh=[0.01, 0.05], short_thresh=[-0.01, -0.05], window=[21])
 
-    for symbol in universe:
-        df = download_stock_data(symbol, start=start, end=end)
-
-        for mr_params in product(*mr_grid.values()):
-            enter_thresh, window_mr = mr_params
-            sig_mr = generate_mr_signal(
-                df, enter_thresh=enter_thresh, window=int(window_mr)
-            )
+    mr_points = expand_grid(mr_grid)
+    mom_points = expand_grid(mom_grid)
+    # Every (MR point, momentum point) pair, MR outermost
+    params = mr_points.merge(mom_points.drop(columns="window"), how="cross")
 
-            for mom_params in product(*mom_grid.values()):
-                long_thresh, short_thresh, window_mom = mom_params
-                sig_mom = generate_mom_signal(
-                    df,
-                    long_thresh=long_thresh,
-                    short_thresh=short_thresh,
-                    window=int(window_mom),
-                )
-
-                # simple ensemble: average signals and round
-                combined = ((sig_mr + sig_mom) / 2).round().clip(-1, 1)
+    frames = []
+    for symbol in universe:
+        if panel is not None:
+            df = panel.ticker_frame(symbol)
+        else:
+            df = download_stock_data(symbol, start=start, end=end)
+        close_series = cast(pd.Series, df["Close"])
 
-                close_series = cast(pd.Series, df["Close"])
-                m = backtest_metrics(close_series, combined)
+        # (params, dates) signals for each grid, features shared per window
+        sig_mr = mr_signal_grid(
+            close_series, mr_points["enter_thresh"], mr_points["window"]
+        )[:, :, 0]
+        sig_mom = mom_signal_grid(
+            close_series, mom_points["long_thresh"], mom_points["window"]
+        )[:, :, 0]
+        # simple ensemble: average signals and round (0/1 signals: both long)
+        combined = (sig_mr[:, None] & sig_mom[None, :]).reshape(-1, len(df))
 
-                # Create result with proper types
-                result: dict[str, Any] = dict(m)
-                result.update(
-                    {
-                        "enter_thresh": enter_thresh,
-                        "window": int(window_mr),
-                        "long_thresh": long_thresh,
-                        "short_thresh": short_thresh,
-                        "Symbol": symbol,
-                    }
-                )
-                rows.append(result)
+        m = backtest_metrics_grid(close_series, combined)
+        frames.append(m.join(params).assign(Symbol=symbol))
 
-    return pd.DataFrame(rows)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
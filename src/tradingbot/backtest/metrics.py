@@ -1,5 +1,6 @@
 # File: src/tradingbot/backtest/metrics.py
 
+import numpy as np
 import pandas as pd
 
 from tradingbot.backtest.vbt_runner import run_backtest
@@ -40,3 +41,37 @@ def backtest_metrics(
         "Trades": int(trades),
         "Max_DD": float(max_dd),  # raw decimal (negative) for compatibility
     }
+
+
+def backtest_metrics_grid(price: pd.Series, signals: np.ndarray) -> pd.DataFrame:
+    """``backtest_metrics`` for each row of a ``(params, dates)`` signal array.
+
+    Distinct signal rows are simulated together as the columns of a single
+    portfolio, so repeated rows (grid points that trade identically) cost
+    nothing extra. Returns one row of metrics per input row.
+    """
+    signals = np.asarray(signals)
+    if not len(signals):
+        return pd.DataFrame(columns=_GRID_COLUMNS)
+    uniq, inverse = np.unique(signals, axis=0, return_inverse=True)
+    frame = pd.DataFrame(uniq.T.astype(float), index=price.index)
+    pf = run_backtest(price, frame)
+
+    total_return = np.asarray(pf.total_return(), dtype=float)
+    max_dd = np.asarray(pf.max_drawdown(), dtype=float)
+    days = len(price)
+    years = days / 252 if days else 1
+    metrics = pd.DataFrame(
+        {
+            "Return[%]": total_return * 100,
+            "CAGR": ((1 + total_return) ** (1 / years) - 1) * 100,
+            "Sharpe": np.asarray(pf.sharpe_ratio(), dtype=float),
+            "MaxDD[%]": max_dd * 100,
+            "Trades": np.asarray(pf.trades.count(), dtype=int),
+            "Max_DD": max_dd,
+        }
+    )
+    return metrics.iloc[inverse.ravel()].reset_index(drop=True)
+
+
+_GRID_COLUMNS = ["Return[%]", "CAGR", "Sharpe", "MaxDD[%]", "Trades", "Max_DD"]
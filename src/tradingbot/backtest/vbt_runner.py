@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pandas as pd
-import vectorbt as vbt
 
 from tradingbot.risk.position_sizer import atr_position_size
+from tradingbot.signals.events import SignalEvents
 
 DEFAULT_FEES_PCT = 0.0005  # 5 bp slippage
 DEFAULT_COMM_PER_SHARE = 0.005  # $0.005 commission
 
+if TYPE_CHECKING:
+    import vectorbt as vbt
+
 
 def run_backtest(
     price: pd.Series,
-    signal: pd.Series,
+    signal: pd.Series | SignalEvents,
     df_full: pd.DataFrame | None = None,
     fees_pct: float = DEFAULT_FEES_PCT,
     comm_per_share: float = DEFAULT_COMM_PER_SHARE,
@@ -25,7 +30,8 @@ def run_backtest(
     Args
     ----
     price   : Close price Series (index = datetime)
-    signal  : Position signal Series {-1,0,1} aligned with price
+    signal  : Position signal Series {-1,0,1} aligned with price, or its
+              SignalEvents encoding
     df_full : DataFrame for ATR position sizing
     fees_pct: Proportional slippage per trade (both sides)
     comm_per_share: Fixed commission per share
@@ -34,13 +40,24 @@ def run_backtest(
     -------
     vbt.Portfolio object with performance stats
     """
-    if not price.index.equals(signal.index):
-        signal = signal.reindex(price.index).fillna(0)
+    import vectorbt as vbt  # heavy (numba/scipy); only needed once we simulate
+
+    if isinstance(signal, SignalEvents):
+        # Walk the change events instead of differencing every day
+        up, down = signal.reindex(price.index).transitions()
+        entries = pd.Series(False, index=price.index)
+        exits = pd.Series(False, index=price.index)
+        entries.iloc[up] = True  # where we go from ≤0 to 1
+        exits.iloc[down] = True  # where we drop from ≥0 to 0/-1
+        short_entries, short_exits = exits, entries
+    else:
+        if not price.index.equals(signal.index):
+            signal = signal.reindex(price.index).fillna(0)
 
-    entries = signal.diff().fillna(0) > 0  # where we go from ≤0 to 1
-    exits = signal.diff() < 0  # where we drop from ≥0 to 0/-1
-    short_entries = signal.diff() < 0  # opening shorts
-    short_exits = signal.diff() > 0  # closing shorts
+        entries = signal.diff().fillna(0) > 0  # where we go from ≤0 to 1
+        exits = signal.diff() < 0  # where we drop from ≥0 to 0/-1
+        short_entries = signal.diff() < 0  # opening shorts
+        short_exits = signal.diff() > 0  # closing shorts
 
     if df_full is not None:
         size = atr_position_size(df_full).reindex(price.index).ffill()
@@ -19,17 +19,27 @@ def walk_forward_optimize(
     """
     Grid-search MR parameters on rolling IS window, test on next OOS window.
     Returns a DataFrame with OOS performance per fold.
+
+    *df* may be ``PricePanel.ticker_frame(t)`` of a memmap export; the IS/OOS
+    slices are then views on the shared mapping rather than private copies.
     """
     results = []
+    windows = [int(w) for w in param_grid.get("window", [20])]
     idx_start = 0
     while idx_start + is_days + oos_days <= len(df):
         is_slice = df.iloc[idx_start : idx_start + is_days]
         oos_slice = df.iloc[idx_start + is_days : idx_start + is_days + oos_days]
 
         best_param, best_sharpe = None, -9e9
+        stacked: dict[tuple, pd.DataFrame] = {}
         for params in product(*param_grid.values()):
             kwargs = dict(zip(param_grid.keys(), params))
-            sig_is = generate_mr_signal(is_slice, **kwargs)
+            # Signals for all windows come from one call per other-param combo
+            rest = {k: v for k, v in kwargs.items() if k != "window"}
+            key = tuple(rest.items())
+            if key not in stacked:
+                stacked[key] = generate_mr_signal(is_slice, window=windows, **rest)
+            sig_is = stacked[key][int(kwargs.get("window", 20))]
             m = backtest_metrics(is_slice["Close"], sig_is)
             if m["Sharpe"] > best_sharpe:
                 best_param, best_sharpe = kwargs, m["Sharpe"]
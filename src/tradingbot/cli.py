@@ -0,0 +1,148 @@
+# File: src/tradingbot/cli.py
+"""``tradingbot`` command line entry point.
+
+tradingbot cache stats
+tradingbot cache verify [--repair]
+tradingbot cache prune --max-bytes 2G [--dry-run]
+tradingbot cache migrate [--profile compact32] [--keep-csv]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_size(text: str) -> int:
+    """``"500M"`` → bytes; accepts plain integers and K/M/G/T (binary) suffixes."""
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*", text, re.IGNORECASE)
+    if not m:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+    return int(float(m.group(1)) * _UNITS[m.group(2).upper()])
+
+
+def _fmt_size(n: float) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if n < 1024:
+            return f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} TiB"
+
+
+def _fmt_time(ts: float | None) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M") if ts else "-"
+
+
+def _cache_stats(root: Path, args) -> int:
+    from tradingbot.data import cache_manifest
+
+    s = cache_manifest.stats(root)
+    print(f"Cache:    {root}")
+    print(f"Entries:  {s['entries']}")
+    print(f"Rows:     {s['rows']:,}")
+    print(f"Size:     {_fmt_size(s['bytes'])}")
+    print(
+        f"Accessed: {_fmt_time(s['oldest_access'])} … {_fmt_time(s['newest_access'])}"
+    )
+    return 0
+
+
+def _cache_verify(root: Path, args) -> int:
+    from tradingbot.data import cache_manifest
+
+    report = cache_manifest.verify(root, repair=args.repair)
+    for kind, paths in report.items():
+        for p in paths:
+            print(f"{kind:10s} {p}")
+    bad = len(report["missing"]) + len(report["corrupt"])
+    action = "repaired" if args.repair else "found"
+    print(f"{bad} problem(s) {action}, {len(report['unindexed'])} unindexed file(s)")
+    return 1 if bad and not args.repair else 0
+
+
+def _cache_prune(root: Path, args) -> int:
+    from tradingbot.data import cache_manifest
+
+    evicted = cache_manifest.prune(root, args.max_bytes, dry_run=args.dry_run)
+    for e in evicted:
+        print(f"evict {e.path}  {_fmt_size(e.bytes)}  {_fmt_time(e.last_access)}")
+    freed = sum(e.bytes for e in evicted)
+    verb = "would free" if args.dry_run else "freed"
+    print(f"{len(evicted)} file(s), {verb} {_fmt_size(freed)}")
+    return 0
+
+
+def _cache_migrate(root: Path, args) -> int:
+    from tradingbot.data import yfinance_downloader as ydl
+
+    ydl.CACHE_DIR = root
+    res = ydl.migrate_cache(args.profile, csv=not args.no_csv, keep_csv=args.keep_csv)
+    print(f"Rewrote {res['files']} parquet file(s), converted {res['csv']} CSV(s)")
+    print(f"{_fmt_size(res['bytes_before'])} → {_fmt_size(res['bytes_after'])}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="tradingbot")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    cache = sub.add_parser("cache", help="Inspect and maintain the price cache")
+    cache.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache root (default: the downloader's CACHE_DIR)",
+    )
+    cache_sub = cache.add_subparsers(dest="action", required=True)
+
+    p = cache_sub.add_parser("stats", help="Entry count, rows and size")
+    p.set_defaults(func=_cache_stats)
+
+    p = cache_sub.add_parser("verify", help="Check files against size and hash")
+    p.add_argument(
+        "--repair",
+        action="store_true",
+        help="Delete corrupt files and drop entries of missing ones",
+    )
+    p.set_defaults(func=_cache_verify)
+
+    p = cache_sub.add_parser("prune", help="Evict least-recently-used files")
+    p.add_argument(
+        "--max-bytes",
+        type=parse_size,
+        required=True,
+        help="Size cap, e.g. 500M or 2G",
+    )
+    p.add_argument("--dry-run", action="store_true", help="Only list evictions")
+    p.set_defaults(func=_cache_prune)
+
+    p = cache_sub.add_parser("migrate", help="Re-encode files with a storage profile")
+    p.add_argument(
+        "--profile",
+        choices=["legacy", "compact", "compact32"],
+        default=None,
+        help="Storage profile (default: data.cache_profile from the config)",
+    )
+    p.add_argument("--keep-csv", action="store_true", help="Keep converted CSVs")
+    p.add_argument("--no-csv", action="store_true", help="Skip legacy CSV files")
+    p.set_defaults(func=_cache_migrate)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    root = args.cache_dir
+    if root is None:
+        from tradingbot.data import yfinance_downloader
+
+        root = yfinance_downloader.CACHE_DIR
+    return args.func(Path(root), args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, List
 
-import yaml
-
 _cfg_path = Path("config/tradingbot.yaml")
 _default_cfg_path = Path(__file__).parent / "default.yaml"
 
 
+@lru_cache(maxsize=1)
 def _load_config() -> dict[str, Any]:
-    """Load config from tradingbot.yaml or fall back to default.yaml."""
+    """Load config from tradingbot.yaml or fall back to default.yaml.
+
+    Parsed once, on first access to one of the exported sections.
+    """
+    import yaml
+
     if _cfg_path.exists():
         cfg_path = _cfg_path
     elif _default_cfg_path.exists():
@@ -24,11 +29,20 @@ def _load_config() -> dict[str, Any]:
         return yaml.safe_load(f) or {}
 
 
-_cfg_dict = _load_config()
+strategies: List[dict[str, Any]]
+backtest: dict[str, Any]  # exported for convenience
+data: dict[str, Any]  # data provider selection
+features: dict[str, Any]  # feature store location
+
+_SECTIONS = {"strategies": list, "backtest": dict, "data": dict, "features": dict}
+
+
+def __getattr__(name: str):
+    if name not in _SECTIONS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _load_config().get(name) or _SECTIONS[name]()
+    globals()[name] = value
+    return value
 
-strategies: List[dict[str, Any]] = _cfg_dict.get(
-    "strategies", []
-)  # type: ignore[assignment]
-backtest = _cfg_dict.get("backtest", {})  # exported for convenience
 
-__all__: list[str] = ["strategies", "backtest"]
+__all__: list[str] = ["strategies", "backtest", "data", "features"]
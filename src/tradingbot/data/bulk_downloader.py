@@ -0,0 +1,161 @@
+# File: src/tradingbot/data/bulk_downloader.py
+"""Concurrent multi-ticker download on top of the range-aware cache."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from tradingbot.data import yfinance_downloader as ydl
+from tradingbot.data.providers import get_provider
+
+__all__ = ["TokenBucket", "download_universe"]
+
+
+class TokenBucket:
+    """Thread-safe token bucket: *rate* requests per second, bursts of *capacity*."""
+
+    def __init__(self, rate: float = 2.0, capacity: int = 4):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_s = (1 - self._tokens) / self.rate
+            time.sleep(wait_s)
+
+
+def _fetch_segment(limiter: TokenBucket | None, ticker: str, seg) -> pd.DataFrame:
+    if limiter is not None:
+        limiter.acquire()
+    start, end = seg
+    return ydl._dl(ticker, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+
+
+def download_universe(
+    tickers: list[str],
+    start: str,
+    end: Optional[str] = None,
+    *,
+    max_workers: int = 8,
+    rate: Optional[float] = None,
+    burst: int = 4,
+    max_retry: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+    """Load ``[start, end)`` bars for every ticker, downloading misses concurrently.
+
+    Cache hits are answered locally without touching the pool. Missing head/tail
+    segments are fetched by *max_workers* threads that share one
+    :class:`TokenBucket` (*rate* requests/s, bursts of *burst*; defaults to the
+    active provider's ``rate_limit``, unthrottled if it has none). A failed or empty
+    download is rescheduled after a jittered exponential backoff instead of
+    sleeping in the worker, so one flaky ticker never stalls the others.
+
+    Returns
+    -------
+    frames : dict[str, pd.DataFrame]
+        Ticker → OHLCV frame for every ticker that loaded.
+    failures : dict[str, str]
+        Ticker → reason for every ticker that did not.
+    """
+    end = ydl._resolve_end(end)
+    start_ts, end_ts = pd.Timestamp(start), pd.Timestamp(end)
+    if rate is None:
+        rate = getattr(get_provider(), "rate_limit", None)
+    limiter = TokenBucket(rate=rate, capacity=burst) if rate else None
+
+    frames: Dict[str, pd.DataFrame] = {}
+    failures: Dict[str, str] = {}
+    plans: dict[str, tuple] = {}
+    fresh: dict[str, dict[int, pd.DataFrame]] = {}
+
+    # (ready_at, seq, ticker, segment index, attempt)
+    pending: list[tuple[float, int, str, int, int]] = []
+    seq = itertools.count()
+    for ticker in dict.fromkeys(tickers):
+        try:
+            cached, cov, fetched_at, segments = ydl._plan(ticker, start_ts, end_ts)
+        except Exception as e:  # unreadable cache file
+            failures[ticker] = f"cache: {e}"
+            continue
+        if not segments:
+            frames[ticker] = ydl._slice(cached, start_ts, end_ts)
+            continue
+        plans[ticker] = (cached, cov, fetched_at, segments)
+        fresh[ticker] = {}
+        for k in range(len(segments)):
+            heapq.heappush(pending, (0.0, next(seq), ticker, k, 0))
+
+    running: dict[Future, tuple[str, int, int]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            now = time.monotonic()
+            while pending and pending[0][0] <= now and len(running) < max_workers:
+                _, _, ticker, k, attempt = heapq.heappop(pending)
+                if ticker in failures:
+                    continue
+                seg = plans[ticker][3][k]
+                fut = pool.submit(_fetch_segment, limiter, ticker, seg)
+                running[fut] = (ticker, k, attempt)
+
+            if not running:
+                if pending:
+                    time.sleep(max(0.0, pending[0][0] - time.monotonic()))
+                continue
+
+            timeout = max(0.0, pending[0][0] - now) if pending else None
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for fut in done:
+                ticker, k, attempt = running.pop(fut)
+                try:
+                    df = fut.result()
+                    error = None if len(df) else "empty response"
+                except Exception as e:
+                    df, error = None, str(e) or type(e).__name__
+
+                if error is None:
+                    fresh[ticker][k] = df
+                    cached, cov, fetched_at, segments = plans[ticker]
+                    if len(fresh[ticker]) == len(segments):
+                        parts = [fresh[ticker][i] for i in range(len(segments))]
+                        try:
+                            frames[ticker] = ydl._commit(
+                                ticker, cached, cov, fetched_at, parts, start_ts, end_ts
+                            )
+                        except Exception as e:
+                            failures[ticker] = f"cache: {e}"
+                    continue
+
+                if attempt + 1 >= max_retry:
+                    failures[ticker] = f"{error} after {max_retry} attempts"
+                    continue
+                delay = min(max_delay, base_delay * 2**attempt)
+                delay *= random.uniform(0.5, 1.5)
+                ready = time.monotonic() + delay
+                heapq.heappush(pending, (ready, next(seq), ticker, k, attempt + 1))
+
+    return frames, failures
@@ -0,0 +1,130 @@
+# File: src/tradingbot/data/cache_format.py
+"""On-disk encoding profiles for the per-ticker bar cache.
+
+=============  ===========  ==============  ==================================
+profile        compression  prices          date index
+=============  ===========  ==============  ==================================
+``legacy``     snappy       float64         plain (pyarrow defaults)
+``compact``    zstd         float64         delta-encoded int64 timestamps
+``compact32``  zstd         float32 [*]_    delta-encoded int64 timestamps
+=============  ===========  ==============  ==================================
+
+.. [*] Prices are stored as float32 only when every value survives the round
+   trip within :data:`PRICE_TOL` (half a cent). float32 keeps 24 significant
+   bits, so that holds for prices below ~131k; a series that fails the check
+   (BRK-A, say) is written as float64 instead. Readers always get float64.
+
+Volume stays int64 in every profile (split-adjusted volumes exceed 2**32).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+__all__ = [
+    "PRICE_TOL",
+    "PROFILES",
+    "CacheProfile",
+    "fits_float32",
+    "get_profile",
+    "read_bars",
+    "write_bars",
+]
+
+PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Adj Close")
+
+# Largest absolute price error accepted when narrowing to float32
+PRICE_TOL = 0.005
+
+
+@dataclass(frozen=True)
+class CacheProfile:
+    name: str
+    compression: str
+    compression_level: int | None = None
+    float32_prices: bool = False
+    delta_dates: bool = False
+
+
+PROFILES = {
+    "legacy": CacheProfile("legacy", "snappy"),
+    "compact": CacheProfile("compact", "zstd", 9, delta_dates=True),
+    "compact32": CacheProfile(
+        "compact32", "zstd", 9, float32_prices=True, delta_dates=True
+    ),
+}
+
+
+@lru_cache(maxsize=1)
+def _configured() -> str:
+    from tradingbot.config import data as data_cfg
+
+    return data_cfg.get("cache_profile", "compact")
+
+
+def get_profile(profile: str | CacheProfile | None = None) -> CacheProfile:
+    """Resolve *profile* (name, instance or ``None`` for the configured one)."""
+    if isinstance(profile, CacheProfile):
+        return profile
+    name = profile or _configured()
+    if name not in PROFILES:
+        known = ", ".join(PROFILES)
+        raise ValueError(f"Unknown cache profile {name!r}; expected one of {known}")
+    return PROFILES[name]
+
+
+def fits_float32(values: np.ndarray, tol: float = PRICE_TOL) -> bool:
+    """True if *values* round-trip through float32 within *tol*."""
+    values = np.asarray(values, dtype=np.float64)
+    err = np.abs(values.astype(np.float32).astype(np.float64) - values)
+    return bool(np.nanmax(err, initial=0.0) <= tol)
+
+
+def write_bars(
+    fp: Path,
+    df: pd.DataFrame,
+    metadata: dict[bytes, bytes],
+    profile: str | CacheProfile | None = None,
+) -> None:
+    """Write OHLCV *df* to *fp* using *profile*, adding *metadata* to the footer."""
+    profile = get_profile(profile)
+    prices = [c for c in PRICE_COLUMNS if c in df.columns]
+    if profile.float32_prices and prices and fits_float32(df[prices].to_numpy()):
+        df = df.astype({c: np.float32 for c in prices})
+
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    meta = dict(table.schema.metadata or {})
+    meta.update(metadata)
+    table = table.replace_schema_metadata(meta)
+
+    kwargs = {}
+    index_col = df.index.name or "__index_level_0__"
+    if profile.delta_dates and pa.types.is_timestamp(
+        table.schema.field(index_col).type
+    ):
+        # Daily timestamps have near-constant deltas: a few bits per row
+        kwargs["use_dictionary"] = [c for c in table.column_names if c != index_col]
+        kwargs["column_encoding"] = {index_col: "DELTA_BINARY_PACKED"}
+    pq.write_table(
+        table,
+        fp,
+        compression=profile.compression,
+        compression_level=profile.compression_level,
+        **kwargs,
+    )
+
+
+def read_bars(fp: Path) -> pd.DataFrame:
+    """Read a cache file written by :func:`write_bars`; prices come back float64."""
+    df = pd.read_parquet(fp)
+    narrow = [c for c in df.columns if df[c].dtype == np.float32]
+    if narrow:
+        df = df.astype({c: np.float64 for c in narrow})
+    return df
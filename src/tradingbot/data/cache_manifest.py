@@ -0,0 +1,302 @@
+# File: src/tradingbot/data/cache_manifest.py
+"""SQLite index of the per-ticker parquet cache.
+
+One row per cache file records what the downloader needs to plan a request
+(covered range, row count, last refresh) plus what housekeeping needs
+(content hash, byte size, last access). The manifest lives next to the files
+as ``<cache dir>/manifest.sqlite``; paths are stored relative to that dir so
+the cache can be moved as a whole.
+
+The manifest sits on the cached-load path, so it is kept cheap:
+
+* each thread keeps one open connection per cache root;
+* :func:`touch` only buffers the access time; buffered times are written in
+  one transaction per batch (by :func:`flush`, when a batch fills up, before
+  any LRU query and at interpreter exit);
+* :func:`record` stores size and range but not the content hash, which
+  :func:`verify` computes on its first pass over the file and checks on
+  every later one.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+__all__ = [
+    "MANIFEST_NAME",
+    "SELF_MANAGED",
+    "CacheEntry",
+    "file_digest",
+    "lookup",
+    "record",
+    "touch",
+    "flush",
+    "forget",
+    "entries",
+    "stats",
+    "verify",
+    "prune",
+]
+
+MANIFEST_NAME = "manifest.sqlite"
+# Marker file of a directory under the cache root whose parquet files belong
+# to another store (e.g. the feature store); verify() does not scan it
+SELF_MANAGED = ".self-managed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path        TEXT PRIMARY KEY,
+    ticker      TEXT NOT NULL,
+    start       TEXT NOT NULL,
+    "end"       TEXT NOT NULL,
+    rows        INTEGER NOT NULL,
+    sha256      TEXT NOT NULL,
+    bytes       INTEGER NOT NULL,
+    fetched_at  TEXT,
+    last_access REAL NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """One manifest row; *path* is relative to the cache root."""
+
+    path: str
+    ticker: str
+    start: str
+    end: str
+    rows: int
+    sha256: str
+    bytes: int
+    fetched_at: Optional[str]
+    last_access: float
+
+
+# Access times written per transaction by touch()
+_TOUCH_BATCH = 256
+
+_local = threading.local()  # .cons: {root: connection} of this thread
+_pending: dict[str, dict[str, float]] = {}  # root -> {path: access time}
+_pending_lock = threading.Lock()
+
+
+def _connect(root: Path) -> sqlite3.Connection:
+    """This thread's connection to the manifest of *root* (opened once)."""
+    cons = _local.__dict__.setdefault("cons", {})
+    con = cons.get(str(root))
+    if con is None:
+        root.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(root / MANIFEST_NAME, timeout=30)
+        con.execute(_SCHEMA)
+        cons[str(root)] = con
+    return con
+
+
+def _key(root: Path, fp: Path) -> str:
+    return fp.relative_to(root).as_posix()
+
+
+def file_digest(fp: Path) -> str:
+    """SHA-256 of the file contents."""
+    h = hashlib.sha256()
+    with fp.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def lookup(root: Path, fp: Path) -> CacheEntry | None:
+    """Manifest row for cache file *fp*, or ``None`` if it is not indexed."""
+    key = _key(root, fp)
+    row = _connect(root).execute("SELECT * FROM entries WHERE path = ?", (key,))
+    row = row.fetchone()
+    if not row:
+        return None
+    entry = CacheEntry(*row)
+    with _pending_lock:
+        access = _pending.get(str(root), {}).get(key)
+    if access is not None:
+        entry = CacheEntry(**{**entry.__dict__, "last_access": access})
+    return entry
+
+
+def record(
+    root: Path,
+    fp: Path,
+    ticker: str,
+    start: str,
+    end: str,
+    rows: int,
+    fetched_at: Optional[str] = None,
+) -> CacheEntry:
+    """Index (or re-index) *fp* after it has been written.
+
+    The content hash is left empty for :func:`verify` to fill in, so
+    indexing costs a ``stat`` rather than a read of the whole file.
+    """
+    entry = CacheEntry(
+        path=_key(root, fp),
+        ticker=ticker,
+        start=start,
+        end=end,
+        rows=int(rows),
+        sha256="",
+        bytes=fp.stat().st_size,
+        fetched_at=fetched_at,
+        last_access=time.time(),
+    )
+    with _pending_lock:
+        _pending.get(str(root), {}).pop(entry.path, None)
+    with _connect(root) as con:
+        con.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            tuple(entry.__dict__.values()),
+        )
+    return entry
+
+
+def touch(root: Path, fp: Path) -> None:
+    """Mark *fp* as just used (drives LRU eviction); written in batches."""
+    with _pending_lock:
+        batch = _pending.setdefault(str(root), {})
+        batch[_key(root, fp)] = time.time()
+        full = len(batch) >= _TOUCH_BATCH
+    if full:
+        flush(root)
+
+
+def flush(root: Path | None = None) -> None:
+    """Write the buffered access times of *root* (of every root if ``None``)."""
+    with _pending_lock:
+        roots = list(_pending) if root is None else [str(root)]
+        batches = {r: _pending.pop(r) for r in roots if _pending.get(r)}
+    for r, batch in batches.items():
+        with _connect(Path(r)) as con:
+            con.executemany(
+                "UPDATE entries SET last_access = ? WHERE path = ?",
+                [(t, path) for path, t in batch.items()],
+            )
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    # Roots removed meanwhile (temporary caches) are not recreated
+    with _pending_lock:
+        for r in [r for r in _pending if not (Path(r) / MANIFEST_NAME).exists()]:
+            del _pending[r]
+    try:
+        flush()
+    except sqlite3.Error:
+        pass
+
+
+def forget(root: Path, path: str) -> None:
+    """Drop the manifest row for the relative *path*."""
+    with _pending_lock:
+        _pending.get(str(root), {}).pop(path, None)
+    with _connect(root) as con:
+        con.execute("DELETE FROM entries WHERE path = ?", (path,))
+
+
+def entries(root: Path) -> Iterator[CacheEntry]:
+    """All manifest rows, least recently used first."""
+    flush(root)
+    con = _connect(root)
+    rows = con.execute("SELECT * FROM entries ORDER BY last_access").fetchall()
+    return (CacheEntry(*r) for r in rows)
+
+
+def stats(root: Path) -> dict:
+    """Entry count, total rows/bytes and the access-time span of the cache."""
+    flush(root)
+    n, rows, size, oldest, newest = (
+        _connect(root)
+        .execute(
+            "SELECT COUNT(*), SUM(rows), SUM(bytes), MIN(last_access), "
+            "MAX(last_access) FROM entries"
+        )
+        .fetchone()
+    )
+    return {
+        "entries": n,
+        "rows": rows or 0,
+        "bytes": size or 0,
+        "oldest_access": oldest,
+        "newest_access": newest,
+    }
+
+
+def verify(root: Path, repair: bool = False) -> dict[str, list[str]]:
+    """Check every indexed file against its recorded size and hash.
+
+    Files indexed since the last run are hashed and their hash recorded.
+    Returns ``{"missing": [...], "corrupt": [...], "unindexed": [...]}`` of
+    relative paths. With *repair*, rows of missing files are dropped and
+    corrupt files are deleted so the next request re-downloads them.
+    """
+    report: dict[str, list[str]] = {"missing": [], "corrupt": [], "unindexed": []}
+    indexed = set()
+    sealed = []
+    for e in entries(root):
+        indexed.add(e.path)
+        fp = root / e.path
+        if not fp.exists():
+            report["missing"].append(e.path)
+        elif fp.stat().st_size != e.bytes:
+            report["corrupt"].append(e.path)
+        elif not e.sha256:
+            sealed.append((file_digest(fp), e.path))
+        elif file_digest(fp) != e.sha256:
+            report["corrupt"].append(e.path)
+    if sealed:
+        with _connect(root) as con:
+            con.executemany("UPDATE entries SET sha256 = ? WHERE path = ?", sealed)
+
+    for fp in sorted(_cache_files(root)):
+        rel = _key(root, fp)
+        if rel not in indexed:
+            report["unindexed"].append(rel)
+
+    if repair:
+        for rel in report["missing"] + report["corrupt"]:
+            (root / rel).unlink(missing_ok=True)
+            forget(root, rel)
+    return report
+
+
+def _cache_files(root: Path) -> Iterator[Path]:
+    """Parquet files under *root*, skipping :data:`SELF_MANAGED` subtrees."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        if SELF_MANAGED in filenames:
+            dirnames.clear()
+            continue
+        for name in filenames:
+            if name.endswith(".parquet"):
+                yield Path(dirpath) / name
+
+
+def prune(root: Path, max_bytes: int, dry_run: bool = False) -> list[CacheEntry]:
+    """Evict least-recently-used files until the cache fits in *max_bytes*.
+
+    Returns the evicted entries (those that would be evicted with *dry_run*).
+    """
+    evicted = []
+    total = stats(root)["bytes"]
+    for e in entries(root):
+        if total <= max_bytes:
+            break
+        if not dry_run:
+            (root / e.path).unlink(missing_ok=True)
+            forget(root, e.path)
+        total -= e.bytes
+        evicted.append(e)
+    return evicted
@@ -0,0 +1,78 @@
+# File: src/tradingbot/data/calendar.py
+"""Shared trading calendar and one-pass alignment onto it.
+
+Engines that loop over days work on integer positions into one calendar
+instead of looking every ticker up by ``Timestamp``. Tickers that list
+mid-sample (ABNB, PLTR) simply have ``valid == False`` before their first
+bar instead of raising ``KeyError``.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["build_calendar", "align_columns"]
+
+
+def build_calendar(indexes: Iterable[pd.Index], how: str = "union") -> pd.DatetimeIndex:
+    """Sorted calendar of the union (or ``how="intersection"``) of *indexes*."""
+    indexes = [pd.DatetimeIndex(ix) for ix in indexes]
+    if not indexes:
+        return pd.DatetimeIndex([], name="Date")
+    if how == "union":
+        values = np.unique(np.concatenate([ix.asi8 for ix in indexes]))
+    elif how == "intersection":
+        values = indexes[0].asi8
+        for ix in indexes[1:]:
+            values = np.intersect1d(values, ix.asi8)
+        values = np.unique(values)
+    else:
+        raise ValueError(f"how must be 'union' or 'intersection', got {how!r}")
+    tz = indexes[0].tz
+    dates = pd.DatetimeIndex(values.view("datetime64[ns]"), name="Date")
+    return dates.tz_localize("UTC").tz_convert(tz) if tz is not None else dates
+
+
+def align_columns(
+    series: Mapping[str, pd.Series],
+    dates: pd.DatetimeIndex,
+    columns: Sequence[str] | None = None,
+    *,
+    fill_value: float = np.nan,
+    ffill: bool = False,
+    dtype=np.float64,
+) -> np.ndarray:
+    """Stack *series* into a ``(len(dates), len(columns))`` array on *dates*.
+
+    Series already on *dates* are copied straight in; the rest are reindexed
+    together in a single ``concat``. Columns missing from *series* and dates a
+    series lacks get *fill_value* (after forward-filling if *ffill*).
+    """
+    columns = list(series) if columns is None else list(columns)
+    out = np.full((len(dates), len(columns)), np.nan, dtype=dtype)
+
+    ragged = {}
+    for j, c in enumerate(columns):
+        s = series.get(c)
+        if s is None:
+            continue
+        if s.index.equals(dates):
+            out[:, j] = s.to_numpy(dtype=dtype, na_value=np.nan)
+        else:
+            ragged[j] = s
+    if ragged:
+        wide = pd.concat(
+            [s[~s.index.duplicated(keep="last")] for s in ragged.values()],
+            axis=1,
+            keys=list(ragged),
+        ).reindex(dates)
+        out[:, list(ragged)] = wide.to_numpy(dtype=dtype, na_value=np.nan)
+
+    if ffill:
+        out = pd.DataFrame(out).ffill().to_numpy()
+    if not (isinstance(fill_value, float) and np.isnan(fill_value)):
+        out[np.isnan(out)] = fill_value
+    return out
@@ -1,5 +1,4 @@
-from .yfinance_downloader import download_stock_data
-from datetime import datetime
+from .yfinance_downloader import download_latest, download_stock_data
 from functools import lru_cache
 
 
@@ -9,19 +8,20 @@ def get_spy(start, end):
 
 def get_vix(start="2010-01-01", end=None):
     if end is None:
-        end = datetime.now().strftime("%Y-%m-%d")
+        return download_latest("^VIX", start=start)["Close"]
     return download_stock_data("^VIX", start=start, end=end)["Close"]
 
 
 @lru_cache(maxsize=1)
 def get_spy_series(start="2010-01-01", end=None):
+    # end=None → rolling "latest" file, topped up at most once per day
     if end is None:
-        end = datetime.now().strftime("%Y-%m-%d")
+        return download_latest("SPY", start=start)["Close"]
     return download_stock_data("SPY", start=start, end=end)["Close"]
 
 
 @lru_cache(maxsize=1)
 def get_vix_series(start="2010-01-01", end=None):
     if end is None:
-        end = datetime.now().strftime("%Y-%m-%d")
+        return download_latest("^VIX", start=start)["Close"]
     return download_stock_data("^VIX", start=start, end=end)["Close"]
@@ -0,0 +1,90 @@
+# File: src/tradingbot/data/memmap_store.py
+"""Memory-mapped export of a PricePanel for zero-copy sharing across processes.
+
+Layout of an export directory::
+
+    <root>/Close.npy, High.npy, ...   one Fortran-ordered .npy memmap per field
+    <root>/dates.npy                  int64 nanosecond timestamps (rows)
+    <root>/index.json                 tickers (columns), fields, field dtypes
+
+Fortran order keeps each ticker's history contiguous, so per-ticker views
+handed to the single-ticker engines are contiguous slices of the mapping.
+Every process that opens the export maps the same pages of the OS page cache.
+``index.json`` is removed before any array is (re)written and replaced
+atomically once all of them are on disk, so a directory without it is an
+incomplete export.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from tradingbot.data.panel import PricePanel
+
+__all__ = ["export_memmap", "open_memmap_panel"]
+
+_INDEX = "index.json"
+
+
+def export_memmap(panel: PricePanel, root: str | Path, dtype=None) -> Path:
+    """Write *panel* to *root* as one memory-mappable ``.npy`` file per field."""
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    # A re-export invalidates the old index before touching its arrays
+    (root / _INDEX).unlink(missing_ok=True)
+
+    dtypes = {}
+    for field, arr in panel.fields.items():
+        mm = np.lib.format.open_memmap(
+            root / f"{field}.npy",
+            mode="w+",
+            dtype=dtype or arr.dtype,
+            shape=arr.shape,
+            fortran_order=True,
+        )
+        mm[:] = arr
+        mm.flush()
+        dtypes[field] = mm.dtype.str
+        del mm
+
+    np.save(root / "dates.npy", panel.dates.asi8)
+    # Index last, atomically: a directory without it is an incomplete export
+    index = {
+        "tickers": list(panel.tickers),
+        "fields": list(panel.fields),
+        "dtypes": dtypes,
+    }
+    tmp = root / f"{_INDEX}.tmp"
+    tmp.write_text(json.dumps(index))
+    os.replace(tmp, root / _INDEX)
+    return root
+
+
+def open_memmap_panel(
+    root: str | Path, fields: Optional[Sequence[str]] = None
+) -> PricePanel:
+    """Map an export made by :func:`export_memmap` as a read-only PricePanel.
+
+    Nothing is read up front beyond the ``.npy`` headers; pages are faulted in
+    on access and shared with every other process mapping the same files.
+    """
+    root = Path(root)
+    index_fp = root / _INDEX
+    if not index_fp.exists():
+        raise FileNotFoundError(f"No memmap export at {root} – run export_memmap")
+    index = json.loads(index_fp.read_text())
+
+    wanted = list(fields) if fields is not None else index["fields"]
+    missing = set(wanted) - set(index["fields"])
+    if missing:
+        raise KeyError(f"Fields not in export: {sorted(missing)}")
+
+    arrays = {f: np.load(root / f"{f}.npy", mmap_mode="r") for f in wanted}
+    dates = pd.DatetimeIndex(np.load(root / "dates.npy").view("M8[ns]"), name="Date")
+    return PricePanel(dates, list(index["tickers"]), arrays)
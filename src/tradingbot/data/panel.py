@@ -0,0 +1,184 @@
+# File: src/tradingbot/data/panel.py
+"""Universe-wide OHLCV panel: aligned (dates × tickers) arrays per field."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+__all__ = ["FIELDS", "PricePanel", "write_panel_dataset"]
+
+FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+_PARTITIONING = ds.partitioning(pa.schema([("ticker", pa.string())]), flavor="hive")
+
+
+@dataclass
+class PricePanel:
+    """OHLCV for a whole universe on one shared calendar.
+
+    Attributes
+    ----------
+    dates : pd.DatetimeIndex
+        Sorted calendar shared by every field (rows).
+    tickers : list[str]
+        Column order of every field array.
+    fields : dict[str, np.ndarray]
+        Field name → 2-D float array shaped ``(len(dates), len(tickers))``.
+        Bars a ticker does not have (pre-IPO, halts) are NaN.
+    """
+
+    dates: pd.DatetimeIndex
+    tickers: list[str]
+    fields: Dict[str, np.ndarray]
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_frames(
+        cls,
+        data: Dict[str, pd.DataFrame],
+        fields: Sequence[str] = FIELDS,
+        dtype=np.float64,
+    ) -> PricePanel:
+        """Align a ``ticker → DataFrame`` mapping on the union of their dates."""
+        if not data:
+            raise ValueError("data must contain at least one ticker")
+        tickers = list(data)
+        fields = [f for f in fields if all(f in df.columns for df in data.values())]
+        wide = pd.concat({t: data[t][fields] for t in tickers}, axis=1).sort_index()
+        arrays = {
+            f: wide.xs(f, axis=1, level=1)[tickers].to_numpy(dtype=dtype)
+            for f in fields
+        }
+        return cls(pd.DatetimeIndex(wide.index), tickers, arrays)
+
+    @classmethod
+    def load(
+        cls,
+        root: str | Path,
+        tickers: Optional[Iterable[str]] = None,
+        fields: Sequence[str] = ("Close",),
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        dtype=np.float64,
+    ) -> PricePanel:
+        """Read a dataset written by :func:`write_panel_dataset` in one scan.
+
+        Only the requested *fields* are read from disk (column projection), and
+        *tickers* / ``[start, end)`` are pushed down as partition/row filters.
+        """
+        dataset = ds.dataset(
+            root,
+            format="parquet",
+            partitioning=ds.HivePartitioning.discover(infer_dictionary=True),
+        )
+        flt = None
+        if tickers is not None:
+            tickers = list(tickers)
+            flt = ds.field("ticker").isin(tickers)
+        if start is not None:
+            cond = ds.field("Date") >= pd.Timestamp(start)
+            flt = cond if flt is None else flt & cond
+        if end is not None:
+            cond = ds.field("Date") < pd.Timestamp(end)
+            flt = cond if flt is None else flt & cond
+
+        table = dataset.to_table(columns=["Date", "ticker", *fields], filter=flt)
+        date_codes, dates = pd.factorize(table.column("Date").to_numpy(), sort=True)
+        # ticker is dictionary-encoded: its integer codes come for free
+        ticker_col = table.column("ticker").unify_dictionaries().combine_chunks()
+        tick_codes = ticker_col.indices.to_numpy(zero_copy_only=False)
+        names = ticker_col.dictionary.to_pylist()
+
+        # Keep the caller's ticker order when one was given
+        present = {names[c] for c in np.unique(tick_codes)}
+        if tickers is not None:
+            order = [t for t in tickers if t in present]
+        else:
+            order = sorted(present)
+        pos = {t: j for j, t in enumerate(order)}
+        col = np.array([pos.get(t, -1) for t in names], dtype=np.intp)[tick_codes]
+
+        arrays = {}
+        for f in fields:
+            arr = np.full((len(dates), len(order)), np.nan, dtype=dtype)
+            arr[date_codes, col] = table.column(f).to_numpy()
+            arrays[f] = arr
+        return cls(pd.DatetimeIndex(dates, name="Date"), order, arrays)
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.dates), len(self.tickers)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean ``(dates, tickers)`` mask of bars that exist (finite Close)."""
+        return np.isfinite(self.fields["Close"])
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.fields[field]
+
+    def frame(self, field: str = "Close") -> pd.DataFrame:
+        """One field as a ``dates × tickers`` DataFrame."""
+        return pd.DataFrame(self.fields[field], index=self.dates, columns=self.tickers)
+
+    def ticker_frame(self, ticker: str, dropna: bool = True) -> pd.DataFrame:
+        """OHLCV of one ticker in the usual per-ticker DataFrame layout.
+
+        Columns are views on the panel arrays (no copy) unless rows the ticker
+        has no bars for are dropped.
+        """
+        j = self.tickers.index(ticker)
+        df = pd.DataFrame(
+            {f: arr[:, j] for f, arr in self.fields.items()},
+            index=self.dates,
+            copy=False,
+        )
+        if dropna:
+            has_bar = df.notna().any(axis=1).to_numpy()
+            if not has_bar.all():
+                df = df.loc[has_bar]
+        return df
+
+    def to_frames(self) -> Dict[str, pd.DataFrame]:
+        """Compatibility adapter to the ``Dict[str, pd.DataFrame]`` engines."""
+        return {t: self.ticker_frame(t) for t in self.tickers}
+
+
+def write_panel_dataset(
+    data: Dict[str, pd.DataFrame] | PricePanel,
+    root: str | Path,
+    fields: Sequence[str] = FIELDS,
+) -> Path:
+    """Write the universe as one hive-partitioned (``ticker=XXX/``) dataset."""
+    if isinstance(data, PricePanel):
+        data = data.to_frames()
+    long = pd.concat(
+        {t: df[[f for f in fields if f in df.columns]] for t, df in data.items()},
+        names=["ticker", "Date"],
+    ).reset_index()
+    long["Date"] = pd.to_datetime(long["Date"])
+    table = pa.Table.from_pandas(long, preserve_index=False)
+
+    root = Path(root)
+    ds.write_dataset(
+        table,
+        root,
+        format="parquet",
+        partitioning=_PARTITIONING,
+        existing_data_behavior="delete_matching",
+    )
+    return root
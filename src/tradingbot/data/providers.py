@@ -0,0 +1,196 @@
+# File: src/tradingbot/data/providers.py
+"""Pluggable market-data backends behind ``download_stock_data``.
+
+``yfinance`` stays the default. ``synthetic`` produces deterministic seeded
+OHLCV so the whole pipeline can run (and be profiled) without a network.
+
+Selection, first match wins:
+  1. ``set_provider(...)`` from code
+  2. ``TRADINGBOT_DATA_PROVIDER`` / ``TRADINGBOT_DATA_SEED`` environment variables
+  3. ``data: {provider: ..., seed: ...}`` in ``config/tradingbot.yaml``
+"""
+
+from __future__ import annotations
+
+import os
+import zlib
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "YFinanceProvider",
+    "SyntheticProvider",
+    "get_provider",
+    "set_provider",
+    "synthetic_universe",
+]
+
+
+class YFinanceProvider:
+    """Daily adjusted bars from Yahoo Finance."""
+
+    name = "yfinance"
+    cache_key = "yfinance"  # cache sub-directory; the default lives at the root
+    rate_limit = 2.0  # requests/s used by download_universe
+
+    def fetch(self, ticker: str, start: str, end: Optional[str]) -> pd.DataFrame:
+        import yfinance as yf
+
+        raw = yf.download(
+            ticker, start=start, end=end, progress=False, auto_adjust=True
+        )
+        if isinstance(raw.columns, pd.MultiIndex):
+            raw.columns = raw.columns.get_level_values(0)
+        return raw
+
+
+class SyntheticProvider:
+    """Deterministic regime-switching GBM market.
+
+    A two-state (calm/turbulent) Markov chain drives a shared market factor;
+    every ticker loads on it with its own beta plus idiosyncratic noise.
+    ``SPY`` is the market itself and ``^VIX`` an implied-vol-like level that
+    jumps with the turbulent regime. Paths are generated on a business-day
+    calendar from a fixed epoch, so any sub-range of a ticker is identical no
+    matter which window was requested first.
+    """
+
+    name = "synthetic"
+    rate_limit = None  # local generation, nothing to throttle
+    EPOCH = pd.Timestamp("1990-01-02")
+
+    # calm, turbulent
+    _MU = np.array([0.0005, -0.0010])
+    _SIGMA = np.array([0.008, 0.025])
+    _STAY = np.array([0.99, 0.95])
+
+    def __init__(self, seed: int = 42):
+        self.seed = int(seed)
+
+    @property
+    def cache_key(self) -> str:
+        """Cache sub-directory: each seed is a different market."""
+        return f"{self.name}/seed{self.seed}"
+
+    # -- random streams -------------------------------------------------
+
+    def _rng(self, key: str, stream: int) -> np.random.Generator:
+        return _stream(self.seed, key, stream)
+
+    def _market(self, n: int) -> tuple[np.ndarray, np.ndarray]:
+        """Regime path (0 calm / 1 turbulent) and market log-returns."""
+        return _market_path(self.seed, n)
+
+    # -- bars -----------------------------------------------------------
+
+    def _calendar(self, end: pd.Timestamp) -> pd.DatetimeIndex:
+        return pd.bdate_range(self.EPOCH, end - pd.Timedelta(days=1), name="Date")
+
+    def _ohlcv(self, ticker: str, dates: pd.DatetimeIndex) -> pd.DataFrame:
+        n = len(dates)
+        regime, mkt = self._market(n)
+        params = self._rng(ticker, 0)
+        z = self._rng(ticker, 1).standard_normal((n, 4))
+
+        if ticker == "SPY":
+            beta, idio, p0 = 1.0, 0.001, 35.0
+        else:
+            beta = params.uniform(0.6, 1.5)
+            idio = params.uniform(0.005, 0.02)
+            p0 = params.uniform(5.0, 150.0)
+
+        log_ret = beta * mkt + idio * z[:, 0]
+        close = p0 * np.exp(np.cumsum(log_ret))
+        prev = np.concatenate([[p0], close[:-1]])
+        open_ = prev * np.exp(0.25 * self._SIGMA[regime] * z[:, 1])
+        spread = self._SIGMA[regime, None] * np.abs(z[:, 2:4])
+        high = np.maximum(open_, close) * (1 + spread[:, 0])
+        low = np.minimum(open_, close) * (1 - spread[:, 1])
+        volume = np.round(1e6 * np.exp(0.3 * z[:, 1] + regime))
+
+        if ticker == "^VIX":
+            # Implied-vol proxy: EW realised market vol in VIX points plus noise
+            realised = pd.Series(mkt**2).ewm(halflife=10).mean().to_numpy()
+            close = 100 * np.sqrt(252 * realised) * np.exp(0.05 * z[:, 0]) + 2.0
+            open_, high, low = close, close * (1 + spread[:, 0]), close
+            volume = np.zeros(n)
+
+        return pd.DataFrame(
+            {"Close": close, "High": high, "Low": low, "Open": open_, "Volume": volume},
+            index=dates,
+        )
+
+    def fetch(self, ticker: str, start: str, end: Optional[str]) -> pd.DataFrame:
+        if end is None:  # up to and including today, like yfinance
+            end = pd.Timestamp.now().normalize() + pd.Timedelta(days=1)
+        df = self._ohlcv(ticker, self._calendar(pd.Timestamp(end)))
+        return df.loc[df.index >= pd.Timestamp(start)]
+
+
+def _stream(seed: int, key: str, stream: int) -> np.random.Generator:
+    return np.random.default_rng([seed, zlib.crc32(key.encode()), stream])
+
+
+# Keyed on (seed, n) rather than on provider instances, so providers are not
+# kept alive by the cache and equal seeds share one path
+@lru_cache(maxsize=8)
+def _market_path(seed: int, n: int) -> tuple[np.ndarray, np.ndarray]:
+    u = _stream(seed, "__market__", 0).random(n)
+    z = _stream(seed, "__market__", 1).standard_normal(n)
+    stay = SyntheticProvider._STAY
+    regime = np.empty(n, dtype=np.int8)
+    state = 0
+    for i in range(n):
+        if u[i] > stay[state]:
+            state = 1 - state
+        regime[i] = state
+    ret = SyntheticProvider._MU[regime] + SyntheticProvider._SIGMA[regime] * z
+    regime.flags.writeable = ret.flags.writeable = False  # shared across callers
+    return regime, ret
+
+
+def synthetic_universe(n: int) -> list[str]:
+    """Ticker names for an *n*-stock synthetic universe (``SYN0000``…)."""
+    return [f"SYN{i:04d}" for i in range(n)]
+
+
+_PROVIDERS = {"yfinance": YFinanceProvider, "synthetic": SyntheticProvider}
+_override = None
+
+
+def set_provider(provider) -> None:
+    """Use *provider* (instance or registered name) for all downloads.
+
+    ``None`` drops the override and goes back to the env/config selection.
+    """
+    global _override
+    if isinstance(provider, str):
+        provider = _make(provider, None)
+    _override = provider
+    _configured.cache_clear()
+
+
+def _make(name: str, seed) -> object:
+    if name not in _PROVIDERS:
+        known = ", ".join(sorted(_PROVIDERS))
+        raise ValueError(f"Unknown data provider {name!r}; expected one of {known}")
+    if name == "synthetic":
+        return SyntheticProvider(seed=42 if seed is None else seed)
+    return _PROVIDERS[name]()
+
+
+@lru_cache(maxsize=1)
+def _configured():
+    from tradingbot.config import data as data_cfg
+
+    name = os.getenv("TRADINGBOT_DATA_PROVIDER") or data_cfg.get("provider", "yfinance")
+    seed = os.getenv("TRADINGBOT_DATA_SEED") or data_cfg.get("seed")
+    return _make(name, int(seed) if seed is not None else None)
+
+
+def get_provider():
+    """Return the active data provider."""
+    return _override if _override is not None else _configured()
@@ -1,23 +1,45 @@
 # File: src/tradingbot/data/yfinance_downloader.py
 
+import json
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import cast, Optional
-import pandas as pd, yfinance as yf, time, yaml
+import pandas as pd, time
+import pyarrow as pa
+import pyarrow.parquet as pq
 from loguru import logger
 
-# Load default backtest date range from config
-_cfg_path = Path("config/tradingbot.yaml")
-if _cfg_path.exists():
-    _cfg = yaml.safe_load(_cfg_path.read_text()) or {}
-    _bt_cfg = _cfg.get("backtest", {})
-    DEFAULT_START = _bt_cfg.get("start_date", "2015-01-01")
-    DEFAULT_END = _bt_cfg.get("end_date", None)
-else:
-    DEFAULT_START = "2015-01-01"
-    DEFAULT_END = None
+from tradingbot.data import cache_manifest
+from tradingbot.data.cache_format import get_profile, read_bars, write_bars
+from tradingbot.data.providers import get_provider
 
-CACHE_DIR = Path("data")
-CACHE_DIR.mkdir(exist_ok=True)
+CACHE_DIR = Path("data")  # created on first write, not at import
+
+# Parquet schema-metadata key holding the [start, end) range a cache file covers
+_RANGE_KEY = b"tradingbot.range"
+
+
+@lru_cache(maxsize=1)
+def _backtest_defaults() -> tuple[str, Optional[str]]:
+    """Default backtest date range from ``config/tradingbot.yaml``."""
+    cfg_path = Path("config/tradingbot.yaml")
+    if not cfg_path.exists():
+        return "2015-01-01", None
+    import yaml
+
+    bt_cfg = (yaml.safe_load(cfg_path.read_text()) or {}).get("backtest", {})
+    return bt_cfg.get("start_date", "2015-01-01"), bt_cfg.get("end_date", None)
+
+
+def __getattr__(name: str):
+    # DEFAULT_START / DEFAULT_END read the config on first access only
+    if name == "DEFAULT_START":
+        return _backtest_defaults()[0]
+    if name == "DEFAULT_END":
+        return _backtest_defaults()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_cache_path(symbol: str, interval: str) -> Path:
@@ -26,34 +48,329 @@ def get_cache_path(symbol: str, interval: str) -> Path:
 
 
 def _dl(ticker, start, end):
-    raw = yf.download(ticker, start=start, end=end, progress=False, auto_adjust=True)
-    if isinstance(raw.columns, pd.MultiIndex):
-        raw.columns = raw.columns.get_level_values(0)
-    return raw
+    return get_provider().fetch(ticker, start, end)
 
 
-def download_stock_data(
-    ticker: str, *, start: str, end: Optional[str] = None, refresh=False, max_retry=5
-) -> pd.DataFrame:
+# ---------------------------------------------------------------------------
+# Range-aware per-ticker cache
+# ---------------------------------------------------------------------------
+
+
+def _cache_file(ticker: str) -> Path:
+    """One parquet file per ticker; its metadata records the covered range.
+
+    Non-default providers get their own sub-directory (their ``cache_key``,
+    e.g. ``synthetic/seed42``) so synthetic bars never mix with real ones or
+    with another seed's.
     """
-    Load from parquet cache. If file exists but is EMPTY, treat as stale and refresh.
+    provider = get_provider()
+    key = getattr(provider, "cache_key", provider.name)
+    root = CACHE_DIR if key == "yfinance" else CACHE_DIR / key
+    root.mkdir(parents=True, exist_ok=True)
+    return root / f"{ticker}.parquet"
+
+
+def _read_meta(fp: Path) -> dict | None:
+    """Return the cache metadata stored in *fp*'s parquet footer, if any."""
+    if not fp.exists():
+        return None
+    try:
+        meta = pq.read_schema(fp).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    if _RANGE_KEY not in meta:
+        return None
+    return json.loads(meta[_RANGE_KEY])
+
+
+def _cached_range(fp: Path) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+    """Return the ``[start, end)`` range covered by *fp* (footer read only)."""
+    rng = _read_meta(fp)
+    if rng is None:
+        return None
+    return pd.Timestamp(rng["start"]), pd.Timestamp(rng["end"])
+
+
+def _write_cache(
+    fp: Path,
+    df: pd.DataFrame,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    fetched_at: pd.Timestamp | None = None,
+    profile=None,
+) -> None:
+    """Atomically write *df* to *fp* tagged with its covered range.
+
+    *fetched_at* marks when :func:`download_latest` last brought the series up
+    to date; other writers just carry the previous value forward. *profile*
+    selects the on-disk encoding (see :mod:`tradingbot.data.cache_format`).
     """
-    # Use default end date if not provided
-    if end is None:
-        end = DEFAULT_END or pd.Timestamp.now().strftime("%Y-%m-%d")
+    rng = {"start": start.strftime("%Y-%m-%d"), "end": end.strftime("%Y-%m-%d")}
+    if fetched_at is not None:
+        rng["fetched_at"] = fetched_at.isoformat()
 
-    fp = CACHE_DIR / f"{ticker}_{start}_{end}.parquet"
-    if fp.exists():
-        df = pd.read_parquet(fp)
-        if len(df) and not refresh:
-            return df
-        # cached but empty → force refresh
+    tmp = fp.with_name(f".{fp.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    write_bars(tmp, df, {_RANGE_KEY: json.dumps(rng).encode()}, profile)
+    os.replace(tmp, fp)
+    cache_manifest.record(
+        CACHE_DIR, fp, fp.stem, rng["start"], rng["end"], len(df), rng.get("fetched_at")
+    )
+
+
+def _load_cached(fp: Path):
+    """Return ``(cached, cov, fetched_at)`` for cache file *fp*.
+
+    The manifest answers "what range, how many rows, when refreshed" without
+    touching the parquet file; only non-empty hits are actually read. Files
+    written before the manifest existed are indexed from their footer on the
+    first visit.
+    """
+    entry = cache_manifest.lookup(CACHE_DIR, fp)
+    if entry is None:
+        meta = _read_meta(fp)
+        if meta is None:
+            return None, None, None
+        rows = pq.read_metadata(fp).num_rows
+        entry = cache_manifest.record(
+            CACHE_DIR,
+            fp,
+            fp.stem,
+            meta["start"],
+            meta["end"],
+            rows,
+            meta.get("fetched_at"),
+        )
+    if entry.rows == 0:
+        return None, None, None  # cached but empty → force refresh
+    try:
+        cached = read_bars(fp)
+    except FileNotFoundError:  # removed behind the manifest's back
+        cache_manifest.forget(CACHE_DIR, entry.path)
+        return None, None, None
+    cache_manifest.touch(CACHE_DIR, fp)
+    cov = pd.Timestamp(entry.start), pd.Timestamp(entry.end)
+    return cached, cov, entry.fetched_at
+
+
+def _slice(df: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Rows in ``[start, end)`` – same half-open convention as yfinance."""
+    return df.loc[(df.index >= start) & (df.index < end)]
+
+
+def _missing_segments(
+    cached: pd.DataFrame | None,
+    cov: tuple[pd.Timestamp, pd.Timestamp] | None,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+    """Return the ``[start, end)`` windows that must be downloaded.
+
+    Head/tail windows deliberately overlap the first/last cached bar so that a
+    successful download is never empty; an empty frame therefore always means
+    the request failed rather than "no trading days in the gap".
+    """
+    if cached is None or cov is None or cached.empty:
+        return [(start, end)]
+
+    segments = []
+    if start < cov[0]:
+        segments.append((start, cached.index[0] + pd.Timedelta(days=1)))
+    if end > cov[1]:
+        segments.append((cached.index[-1], end))
+    return segments
+
+
+def _merge(cached: pd.DataFrame | None, fresh: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate bars; freshly downloaded rows win on overlapping dates."""
+    frames = ([cached] if cached is not None else []) + fresh
+    merged = pd.concat(frames)
+    merged = merged[~merged.index.duplicated(keep="last")]
+    return merged.sort_index()
+
+
+def _now() -> pd.Timestamp:
+    return pd.Timestamp.now()
+
+
+def _fetch_with_retry(ticker, start, end, max_retry) -> pd.DataFrame:
+    """Download ``[start, end)``; ``end=None`` means "up to the latest bar"."""
+    end_str = end.strftime("%Y-%m-%d") if end is not None else None
     for k in range(max_retry):
-        df = _dl(ticker, start, end)
+        df = _dl(ticker, start.strftime("%Y-%m-%d"), end_str)
         if len(df):
-            df.to_parquet(fp, index=True)
             return df
         wait = 2**k
         print(f"⚠️  {ticker} empty – retrying in {wait}s")
         time.sleep(wait)
     raise RuntimeError(f"{ticker} empty after {max_retry} attempts")
+
+
+def _resolve_end(end: Optional[str]) -> str:
+    # Use default end date if not provided
+    if end is None:
+        end = _backtest_defaults()[1] or pd.Timestamp.now().strftime("%Y-%m-%d")
+    return end
+
+
+def _plan(ticker: str, start: pd.Timestamp, end: pd.Timestamp, refresh=False):
+    """Inspect the cache for a ``[start, end)`` request.
+
+    Returns ``(cached, cov, fetched_at, segments)``; an empty *segments* list
+    means the request can be answered from *cached* alone.
+    """
+    cached, cov, fetched_at = _load_cached(_cache_file(ticker))
+
+    if refresh and cov is not None:
+        # Keep the old bars only if the refreshed window joins up with them
+        if end < cov[0] or start > cov[1]:
+            cached, cov = None, None
+        segments = [(start, end)]
+    else:
+        segments = _missing_segments(cached, cov, start, end)
+    return cached, cov, fetched_at, segments
+
+
+def _commit(
+    ticker: str,
+    cached: pd.DataFrame | None,
+    cov: tuple[pd.Timestamp, pd.Timestamp] | None,
+    fetched_at: str | None,
+    fresh: list[pd.DataFrame],
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> pd.DataFrame:
+    """Merge downloaded segments into the cache and return ``[start, end)``."""
+    merged = _merge(cached, fresh)
+    new_cov = (
+        (min(start, cov[0]), max(end, cov[1])) if cov is not None else (start, end)
+    )
+    _write_cache(
+        _cache_file(ticker),
+        merged,
+        *new_cov,
+        fetched_at=pd.Timestamp(fetched_at) if fetched_at else None,
+    )
+    return _slice(merged, start, end)
+
+
+def download_stock_data(
+    ticker: str, *, start: str, end: Optional[str] = None, refresh=False, max_retry=5
+) -> pd.DataFrame:
+    """
+    Load *ticker* bars for ``[start, end)`` from the per-ticker parquet cache.
+
+    The cache manifest records the date range each file covers. Requests inside
+    that range are sliced locally; requests reaching beyond it download only the missing
+    head/tail and widen the cached range. ``refresh=True`` re-downloads the
+    requested window and overwrites the cached bars it overlaps.
+    """
+    start_ts, end_ts = pd.Timestamp(start), pd.Timestamp(_resolve_end(end))
+
+    cached, cov, fetched_at, segments = _plan(ticker, start_ts, end_ts, refresh)
+    if not segments:
+        return _slice(cached, start_ts, end_ts)
+
+    fresh = [_fetch_with_retry(ticker, s, e, max_retry) for s, e in segments]
+    return _commit(ticker, cached, cov, fetched_at, fresh, start_ts, end_ts)
+
+
+def download_latest(ticker: str, *, start: str, max_retry=5) -> pd.DataFrame:
+    """
+    Rolling "latest" series for *ticker* from *start* up to the newest bar.
+
+    Keeps a single cache file per ticker and only appends the bars after the
+    last cached date. The footer records when the series was last refreshed,
+    so repeat calls on the same calendar day never touch the network.
+    """
+    start_ts, now = pd.Timestamp(start), _now()
+    today = now.normalize()
+
+    fp = _cache_file(ticker)
+    cached, cov, fetched_at = _load_cached(fp)
+    fresh_today = fetched_at is not None and pd.Timestamp(fetched_at) >= today
+    if fresh_today and start_ts >= cov[0]:
+        return cached.loc[cached.index >= start_ts]
+
+    # Re-fetch from the last cached bar so a partial intraday bar gets replaced
+    if cached is None:
+        segments = [(start_ts, None)]
+    else:
+        segments = _missing_segments(cached, cov, start_ts, cov[1])
+        segments.append((cached.index[-1], None))
+
+    fresh = [_fetch_with_retry(ticker, s, e, max_retry) for s, e in segments]
+    merged = _merge(cached, fresh)
+    new_cov = (
+        (min(start_ts, cov[0]), max(today, cov[1]))
+        if cov is not None
+        else (start_ts, today)
+    )
+    _write_cache(fp, merged, *new_cov, fetched_at=now)
+    return merged.loc[merged.index >= start_ts]
+
+
+# ---------------------------------------------------------------------------
+# One-shot migration
+# ---------------------------------------------------------------------------
+
+
+def _read_legacy_csv(fp: Path) -> pd.DataFrame:
+    """Parse a ``get_cache_path`` CSV, including yfinance's multi-row headers."""
+    raw = pd.read_csv(fp, index_col=0)
+    idx = pd.to_datetime(raw.index, errors="coerce")
+    df = raw.loc[~idx.isna()].apply(pd.to_numeric, errors="coerce")
+    df.index = pd.DatetimeIndex(idx[~idx.isna()], name="Date")
+    return df.sort_index()
+
+
+def migrate_cache(profile=None, csv: bool = True, keep_csv: bool = False) -> dict:
+    """Rewrite every cached file under ``CACHE_DIR`` with *profile*.
+
+    Parquet files keep their range metadata. Legacy daily CSVs written under
+    :func:`get_cache_path` (``<SYMBOL>_1d.csv``) are merged into the
+    ticker's parquet file, covering ``[first bar, last bar + 1 day)``, and
+    then deleted unless *keep_csv* is set. Returns byte counts before and
+    after plus the number of files converted.
+    """
+    profile = get_profile(profile)
+    out = {"files": 0, "csv": 0, "bytes_before": 0, "bytes_after": 0}
+
+    for fp in sorted(CACHE_DIR.rglob("*.parquet")):
+        meta = _read_meta(fp)
+        if meta is None:
+            continue
+        out["bytes_before"] += fp.stat().st_size
+        fetched_at = meta.get("fetched_at")
+        _write_cache(
+            fp,
+            read_bars(fp),
+            pd.Timestamp(meta["start"]),
+            pd.Timestamp(meta["end"]),
+            fetched_at=pd.Timestamp(fetched_at) if fetched_at else None,
+            profile=profile,
+        )
+        out["bytes_after"] += fp.stat().st_size
+        out["files"] += 1
+
+    if csv:
+        for src in sorted(CACHE_DIR.glob("*_1d.csv")):
+            df = _read_legacy_csv(src)
+            if df.empty:
+                continue
+            ticker = src.name[: -len("_1d.csv")]
+            fp = CACHE_DIR / f"{ticker}.parquet"
+            start = df.index[0]
+            end = df.index[-1] + pd.Timedelta(days=1)
+            meta = _read_meta(fp)
+            if meta is not None:  # parquet bars win on overlapping dates
+                df = _merge(df, [read_bars(fp)])
+                start = min(start, pd.Timestamp(meta["start"]))
+                end = max(end, pd.Timestamp(meta["end"]))
+                out["bytes_after"] -= fp.stat().st_size  # replaced below
+            out["bytes_before"] += src.stat().st_size
+            _write_cache(fp, df, start, end, profile=profile)
+            out["bytes_after"] += fp.stat().st_size
+            out["csv"] += 1
+            if not keep_csv:
+                src.unlink()
+    return out
@@ -4,6 +4,8 @@ from typing import List, Tuple
 
 import pandas as pd
 
+from tradingbot import kernels
+from tradingbot.data.calendar import align_columns, build_calendar
 from tradingbot.data.yfinance_downloader import download_stock_data
 from tradingbot.data.market_benchmarks import get_spy
 from tradingbot.evaluation.metrics import (
@@ -54,37 +56,18 @@ def _simulate_simple_long_only(
     daily_ret : pd.Series
         Daily portfolio returns.
     """
-    # Use index from first ticker (assume aligned)
-    dates = price_data[universe[0]].index
-    # Align all Close series to the chosen date index (forward-fill gaps)
-    aligned_close = {
-        t: price_data[t]["Close"].reindex(dates).fillna(method="ffill")
-        for t in universe
-    }
-    equity = pd.Series(equity_init, index=dates, dtype=float)
-    daily_ret = pd.Series(0.0, index=dates, dtype=float)
-
-    for i in range(1, len(dates)):
-        date = dates[i]
-        prev_date = dates[i - 1]
-
-        # Determine tickers that were long over the holding period
-        held = [t for t in universe if signal_dict[t].get(prev_date, 0) > 0]
-        if held:
-            rets = []
-            for t in held:
-                price_today = aligned_close[t][date]
-                price_prev = aligned_close[t][prev_date]
-                if pd.isna(price_today) or pd.isna(price_prev):
-                    continue
-                rets.append(price_today / price_prev - 1.0)
-
-            avg_ret = sum(rets) / len(rets) if rets else 0.0
-        else:
-            avg_ret = 0.0
+    # One calendar for the whole universe; gaps carry the last close forward
+    dates = build_calendar(price_data[t].index for t in universe)
+    close = align_columns(
+        {t: price_data[t]["Close"] for t in universe}, dates, universe, ffill=True
+    )
+    sig = align_columns(signal_dict, dates, universe, fill_value=0.0)
 
-        daily_ret.iloc[i] = avg_ret
-        equity.iloc[i] = equity.iloc[i - 1] * (1 + avg_ret)
+    # Held over (prev, today] if long at the previous close; average the
+    # returns of held tickers that have both prices
+    daily, growth = kernels.equal_weight_long_only(close, sig)
+    daily_ret = pd.Series(daily, index=dates)
+    equity = pd.Series(equity_init * growth, index=dates)
 
     return equity, daily_ret
 
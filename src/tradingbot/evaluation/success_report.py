@@ -7,6 +7,7 @@ import pandas as pd
 from tabulate import tabulate
 
 from tradingbot.config import strategies
+from tradingbot.data.providers import set_provider, synthetic_universe
 from tradingbot.evaluation.benchmark_compare import benchmark_comparison
 
 # Fallback universe helper
@@ -24,14 +25,18 @@ OUT_PATH = Path("reports/success_report.csv")
 TARGETS = {"sharpe": 0.70, "max_dd": -0.15, "excess_periods": 2}
 
 
-def evaluate_all(risk_pct: float = 0.0006, stop_mult: float = 2.0) -> pd.DataFrame:
+def evaluate_all(
+    risk_pct: float = 0.0006,
+    stop_mult: float = 2.0,
+    universe: list[str] | None = None,
+) -> pd.DataFrame:
     rows: list[dict] = []
     for cfg in strategies:
         name = cfg.get("name", "<unnamed>")
         print(f"Running {name} …")
         metrics = benchmark_comparison(
             cfg,
-            UNIVERSE,
+            universe or UNIVERSE,
             risk_pct=risk_pct,
             stop_mult=stop_mult,
             use_atr_overlay=True,  # Use ATR overlay for position sizing
@@ -80,8 +85,27 @@ if __name__ == "__main__":
         default=2.0,
         help="ATR stop multiplier (default: 2.0)",
     )
+    parser.add_argument(
+        "--provider",
+        choices=["yfinance", "synthetic"],
+        help="Market-data backend (default: config / TRADINGBOT_DATA_PROVIDER)",
+    )
+    parser.add_argument(
+        "--n_tickers",
+        type=int,
+        help="Use an N-stock synthetic universe instead of the top-50 list",
+    )
     args = parser.parse_args()
 
+    _universe = None
+    if args.provider or args.n_tickers:
+        # A synthetic universe only makes sense with the synthetic provider
+        set_provider(args.provider or "synthetic")
+    if args.n_tickers:
+        _universe = synthetic_universe(args.n_tickers)
+
     print(f"Running with risk_pct={args.risk_pct}, stop_mult={args.stop_mult}")
-    _df = evaluate_all(risk_pct=args.risk_pct, stop_mult=args.stop_mult)
+    _df = evaluate_all(
+        risk_pct=args.risk_pct, stop_mult=args.stop_mult, universe=_universe
+    )
     print_summary(_df)
@@ -1,41 +1,71 @@
 # File: src/tradingbot/exec/order_router.py
 from datetime import datetime
 from pathlib import Path
+from typing import Dict
 
 import pandas as pd
 
 from tradingbot.exec.alpaca_client import AlpacaClient
-from tradingbot.risk.position_sizer import atr_position_size
+from tradingbot.features.online import OnlineATR, OnlineState
+from tradingbot.risk.position_sizer import atr_position_size_at
 
 LOG_PATH = Path("data/fill_log.csv")
 
 
 class DailySignalExecutor:
-    def __init__(self):
+    def __init__(self, state_path: str | Path | None = None):
+        """
+        *state_path* keeps per-symbol ATR state between daily runs, so each
+        run only feeds the new bar. Without it the state lives in memory and
+        the first call for a symbol replays *df*. :meth:`execute` only
+        updates the state; :meth:`flush` (or :meth:`run_daily`) writes it
+        once per run.
+        """
         self.client = AlpacaClient()
+        self.state = OnlineState(state_path, lambda: {"atr": OnlineATR()})
+
+    def run_daily(
+        self, data: Dict[str, pd.DataFrame], signals: Dict[str, pd.Series]
+    ) -> None:
+        """Execute today's signal of every symbol, then save the ATR state once."""
+        try:
+            for symbol, signal in signals.items():
+                self.execute(data[symbol], signal, symbol)
+        finally:
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist the per-symbol ATR state (a no-op without *state_path*)."""
+        self.state.save()
 
-    def execute(self, df: pd.DataFrame, signal: pd.Series):
+    def execute(self, df: pd.DataFrame, signal: pd.Series, symbol: str | None = None):
         """
         For today's signal {-1,0,1}, send market order at market open.
-        Assumes df index is daily and last row = today.
+        Assumes df index is daily and last row = today. *symbol* defaults to
+        ``df.name``; one of them is required because the ATR state is kept
+        per symbol.
         """
+        symbol = symbol or getattr(df, "name", None)
+        if not symbol:
+            raise ValueError("execute() needs a symbol (argument or df.name)")
+
         today = df.index[-1]  # type: ignore
         if hasattr(today, "date"):
             today = today.date()  # type: ignore
         price_today = df["Close"].iloc[-1]
         sig = int(signal.iloc[-1])
 
+        # Keep the ATR state current even on flat days: O(1) per new bar
+        atr = self.state.advance(symbol, df)["atr"].value
+
         if sig == 0:
             return  # nothing to do
 
         side = "buy" if sig > 0 else "sell"
-        qty = int(abs(atr_position_size(df).iloc[-1]))
+        qty = abs(atr_position_size_at(price_today, atr))
         if qty == 0:
             return
 
-        # Get symbol name from DataFrame name or use a default
-        symbol = getattr(df, "name", "UNKNOWN")
-
         order = self.client.submit_order(symbol, qty, side)
         order_id = getattr(order, "id", "unknown")
 
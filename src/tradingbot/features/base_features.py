@@ -1,7 +1,11 @@
-from typing import cast
+from typing import Sequence, cast
 
+import numpy as np
 import pandas as pd
 
+from tradingbot.features import panel_features
+from tradingbot.features.store import cached_feature
+
 
 def compute_daily_returns(df: pd.DataFrame) -> pd.Series:
     """
@@ -18,21 +22,26 @@ def compute_daily_returns(df: pd.DataFrame) -> pd.Series:
     return cast(pd.Series, df["Close"].pct_change().fillna(0))
 
 
-def compute_rolling_zscore(series: pd.Series, window: int = 20) -> pd.Series:
+@cached_feature("rolling_zscore", version=2)
+def compute_rolling_zscore(
+    series: pd.Series, window: int | Sequence[int] = 20
+) -> pd.Series | pd.DataFrame:
     """
     Compute rolling z-score for a given series.
 
     Args:
         series: Input series (e.g., Close prices)
-        window: Rolling window size for mean and std calculation
+        window: Rolling window size for mean and std calculation, or a list
+            of sizes (computed from shared prefix sums)
 
     Returns:
-        Series with rolling z-scores
+        Series with rolling z-scores; for a list of windows, a DataFrame
+        with one column per window
     """
-    rolling_mean = series.rolling(window=window).mean()
-    rolling_std = series.rolling(window=window).std()
-
-    # Avoid division by zero
-    zscore = (series - rolling_mean) / rolling_std
+    x = series.to_numpy(dtype=float)
+    if np.ndim(window):
+        stacked = panel_features.rolling_zscore_multi(x, window)[:, :, 0]
+        return panel_features.window_frame(stacked, series.index, window)
     # rolling_std can be zero initially; resulting NaNs are expected.
-    return cast(pd.Series, zscore)
+    z = panel_features.rolling_zscore(x, window)
+    return pd.Series(z[:, 0], index=series.index, name=series.name)
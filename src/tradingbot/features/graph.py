@@ -0,0 +1,220 @@
+# File: src/tradingbot/features/graph.py
+"""Declarative feature graph shared by every strategy in a run.
+
+A :class:`Node` names an operation, its parameters and its input nodes.
+Nodes are frozen dataclasses, so two strategies asking for, say,
+``cumulative_return(21)`` build *equal* nodes and a :class:`FeatureGraph`
+keeps one of them:
+
+>>> graph = FeatureGraph()
+>>> graph.request(vol_adj_momentum(21), cumulative_return(21))
+>>> len(graph.nodes())  # Close, returns, rolling std, cum. return, ratio
+5
+
+:meth:`FeatureGraph.evaluate` binds the graph to ``(dates × tickers)``
+field arrays and returns a :class:`GraphRun`. The run computes each node at
+most once, on first :meth:`~GraphRun.get`, with the vectorised functions in
+:mod:`tradingbot.features.panel_features`. Every node carries a count of
+pending uses (consumer nodes plus external requests). An intermediate is
+dropped as soon as its last consumer has been computed, and a requested node
+when the last requester calls :meth:`~GraphRun.release`. Memory therefore
+holds only the features that are still needed.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Mapping
+
+import numpy as np
+
+from tradingbot.features import panel_features as pf
+
+__all__ = [
+    "Node",
+    "FeatureGraph",
+    "GraphRun",
+    "field",
+    "daily_returns",
+    "rolling_mean",
+    "rolling_std",
+    "rolling_zscore",
+    "cumulative_return",
+    "vol_adj_momentum",
+    "trailing_return",
+    "true_range",
+    "atr",
+]
+
+
+@dataclass(frozen=True)
+class Node:
+    """One feature: operation name, parameters and input nodes."""
+
+    op: str
+    params: tuple = ()
+    inputs: tuple["Node", ...] = ()
+
+    def __repr__(self) -> str:
+        args = [repr(i) for i in self.inputs] + [repr(p) for p in self.params]
+        return f"{self.op}({', '.join(args)})"
+
+
+# ---------------------------------------------------------------------------
+# Node builders
+# ---------------------------------------------------------------------------
+
+
+def field(name: str = "Close") -> Node:
+    return Node("field", (name,))
+
+
+def daily_returns(close: Node | None = None) -> Node:
+    return Node("daily_returns", (), (close or field(),))
+
+
+def rolling_mean(x: Node, window: int) -> Node:
+    return Node("rolling_mean", (int(window),), (x,))
+
+
+def rolling_std(x: Node, window: int) -> Node:
+    return Node("rolling_std", (int(window),), (x,))
+
+
+def rolling_zscore(window: int = 20, x: Node | None = None) -> Node:
+    return Node("rolling_zscore", (int(window),), (x or field(),))
+
+
+def cumulative_return(window: int = 21, close: Node | None = None) -> Node:
+    return Node("cumulative_return", (int(window),), (close or field(),))
+
+
+def vol_adj_momentum(window: int = 21, close: Node | None = None) -> Node:
+    close = close or field()
+    return Node(
+        "ratio",
+        (),
+        (
+            cumulative_return(window, close),
+            rolling_std(daily_returns(close), window),
+        ),
+    )
+
+
+def trailing_return(window: int = 60, close: Node | None = None) -> Node:
+    """``close.pct_change(window)``, NaN until a full window (ranked metric)."""
+    return Node("trailing_return", (int(window),), (close or field(),))
+
+
+def true_range() -> Node:
+    return Node("true_range", (), (field("High"), field("Low"), field("Close")))
+
+
+def atr(window: int = 14) -> Node:
+    return Node("bfill", (), (rolling_mean(true_range(), window),))
+
+
+# ---------------------------------------------------------------------------
+# Operations on (dates × tickers) arrays
+# ---------------------------------------------------------------------------
+
+
+def _ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    den = np.where(den == 0, np.nan, den)
+    return num / den
+
+
+_OPS: dict[str, Callable[..., np.ndarray]] = {
+    "daily_returns": pf.daily_returns,
+    "rolling_mean": lambda x, w: pf.rolling_mean_std(x, w, with_std=False)[0],
+    "rolling_std": lambda x, w: pf.rolling_mean_std(x, w)[1],
+    "rolling_zscore": pf.rolling_zscore,
+    "cumulative_return": pf.cumulative_return,
+    "ratio": _ratio,
+    "trailing_return": lambda x, w: pf.trailing_return(x, w, fill_value=None),
+    "true_range": pf.true_range,
+    "bfill": pf._bfill,
+}
+
+
+# ---------------------------------------------------------------------------
+# Graph and evaluation
+# ---------------------------------------------------------------------------
+
+
+class FeatureGraph:
+    """Deduplicated set of requested feature nodes and their inputs."""
+
+    def __init__(self) -> None:
+        self.requests: Counter[Node] = Counter()
+
+    def request(self, *nodes: Node) -> None:
+        """Register one use of each of *nodes* (release it once per request)."""
+        self.requests.update(nodes)
+
+    def nodes(self) -> list[Node]:
+        """Every distinct node reachable from the requests, inputs first."""
+        order: list[Node] = []
+        seen: set[Node] = set()
+
+        def visit(node: Node) -> None:
+            if node in seen:
+                return
+            seen.add(node)
+            for inp in node.inputs:
+                visit(inp)
+            order.append(node)
+
+        for node in self.requests:
+            visit(node)
+        return order
+
+    def evaluate(self, fields: Mapping[str, Any]) -> GraphRun:
+        """Bind the graph to field arrays (e.g. ``PricePanel.fields``)."""
+        return GraphRun(self, fields)
+
+
+class GraphRun:
+    """Lazy, reference-counted evaluation of a :class:`FeatureGraph`."""
+
+    def __init__(self, graph: FeatureGraph, fields: Mapping[str, Any]):
+        self.fields = fields
+        self.pending: Counter[Node] = Counter(graph.requests)
+        for node in graph.nodes():
+            self.pending.update(set(node.inputs))
+        self.values: dict[Node, np.ndarray] = {}
+        self.computed = 0  # nodes evaluated so far
+        self.peak = 0  # most arrays held at once
+
+    def get(self, node: Node) -> np.ndarray:
+        """Value of *node*, computed (with its inputs) on first access."""
+        if node in self.values:
+            return self.values[node]
+        if not self.pending[node]:
+            raise KeyError(f"{node!r} was not requested from this graph")
+        if node.op == "field":
+            value = pf._as2d(self.fields[node.params[0]])
+        else:
+            args = [self.get(inp) for inp in node.inputs]
+            value = _OPS[node.op](*args, *node.params)
+        self.values[node] = value
+        self.computed += 1
+        self.peak = max(self.peak, len(self.values))
+        for inp in set(node.inputs):
+            self._consume(inp)
+        return value
+
+    def release(self, node: Node) -> None:
+        """Give back one request for *node*; its array goes with the last."""
+        self._consume(node)
+
+    def release_all(self, nodes: Iterable[Node]) -> None:
+        for node in nodes:
+            self._consume(node)
+
+    def _consume(self, node: Node) -> None:
+        self.pending[node] -= 1
+        if self.pending[node] <= 0:
+            del self.pending[node]
+            self.values.pop(node, None)
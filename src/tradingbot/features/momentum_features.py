@@ -1,23 +1,43 @@
 # File: src/tradingbot/features/momentum_features.py
 
+from typing import Sequence
+
 import numpy as np
 import pandas as pd
 
-from tradingbot.features.base_features import compute_daily_returns
+from tradingbot.features import panel_features
+from tradingbot.features.store import cached_feature
+
 
+@cached_feature("cumulative_return", columns=["Close"], version=3)
+def compute_cumulative_return(
+    df: pd.DataFrame, window: int | Sequence[int] = 21
+) -> pd.Series | pd.DataFrame:
+    """Rolling cumulative return over `window` days.
 
-def compute_cumulative_return(df: pd.DataFrame, window: int = 21) -> pd.Series:
-    """Rolling cumulative return over `window` days."""
-    returns = compute_daily_returns(df)
-    return (1 + returns).rolling(window).apply(np.prod, raw=True) - 1
+    A list of windows returns a DataFrame with one column per window.
+    """
+    close = df["Close"].to_numpy(dtype=float)
+    if np.ndim(window):
+        stacked = panel_features.cumulative_return_multi(close, window)[:, :, 0]
+        return panel_features.window_frame(stacked, df.index, window)
+    cum = panel_features.cumulative_return(close, window)
+    return pd.Series(cum[:, 0], index=df.index, name=df["Close"].name)
 
 
-def compute_vol_adj_momentum(df: pd.DataFrame, window: int = 21) -> pd.Series:
+@cached_feature("vol_adj_momentum", columns=["Close"], version=3)
+def compute_vol_adj_momentum(
+    df: pd.DataFrame, window: int | Sequence[int] = 21
+) -> pd.Series | pd.DataFrame:
     """
     Volatility-adjusted momentum (Sharpe proxy):
         cumulative_return / rolling_std(returns)
+
+    A list of windows returns a DataFrame with one column per window.
     """
-    returns = compute_daily_returns(df)
-    cum_ret = compute_cumulative_return(df, window)
-    vol = returns.rolling(window).std()
-    return cum_ret / vol.replace(0, np.nan)
+    close = df["Close"].to_numpy(dtype=float)
+    if np.ndim(window):
+        stacked = panel_features.vol_adj_momentum_multi(close, window)[:, :, 0]
+        return panel_features.window_frame(stacked, df.index, window)
+    mom = panel_features.vol_adj_momentum(close, window)
+    return pd.Series(mom[:, 0], index=df.index, name=df["Close"].name)
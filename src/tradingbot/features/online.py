@@ -0,0 +1,538 @@
+# File: src/tradingbot/features/online.py
+"""Streaming indicators for the live daily run.
+
+Each indicator consumes one bar at a time through ``update(bar)`` and exposes
+its current reading as ``value``, doing O(1) work per bar. After the same
+history has been fed in, ``value`` equals the last row of the batch function:
+
+=========================  ===============================================
+indicator                  batch equivalent
+=========================  ===============================================
+:class:`RollingStats`      ``compute_rolling_zscore`` (plus mean/std)
+:class:`OnlineATR`         ``calc_atr`` once *window* bars have been seen
+:class:`CumulativeReturn`  ``compute_cumulative_return``
+:class:`VolAdjMomentum`    ``compute_vol_adj_momentum``
+:class:`OnlineRSI`         RSI (the ``rsi_14`` column)
+:class:`OnlineMACD`        MACD histogram (the ``macd_diff`` column)
+:class:`PercentileRank`    ``panel_features.pct_rank``
+:class:`OnlineRegime`      ``compute_regime(..., causal=True)``
+=========================  ===============================================
+
+``bar`` is a mapping with ``Close`` (and ``High``/``Low`` for ATR), such as a
+row of a price frame, or a bare float taken as the close.
+
+All state is plain JSON (``to_dict``/:func:`from_dict`); :class:`OnlineState`
+keeps one set of indicators per ticker on disk and feeds each only the bars
+it has not seen yet.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+import pandas as pd
+
+__all__ = [
+    "RollingStats",
+    "OnlineATR",
+    "CumulativeReturn",
+    "VolAdjMomentum",
+    "OnlineRSI",
+    "OnlineMACD",
+    "PercentileRank",
+    "OnlineRegime",
+    "OnlineState",
+    "from_dict",
+]
+
+NAN = float("nan")
+
+
+def _field(bar, name: str = "Close") -> float:
+    if isinstance(bar, (int, float)):
+        return float(bar)
+    value = bar[name]
+    return NAN if value is None else float(value)
+
+
+class _Indicator:
+    """Shared (de)serialisation: every attribute in ``_state`` is JSON data."""
+
+    _state: tuple[str, ...] = ()
+    _children: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        d: dict[str, Any] = {"kind": type(self).__name__}
+        for name in self._state:
+            value = getattr(self, name)
+            d[name] = list(value) if isinstance(value, deque) else value
+        for name in self._children:
+            d[name] = getattr(self, name).to_dict()
+        return d
+
+    @classmethod
+    def _restore(cls, d: Mapping[str, Any]):
+        obj = cls.__new__(cls)
+        for name in cls._state:
+            setattr(obj, name, d[name])
+        for name in cls._children:
+            setattr(obj, name, from_dict(d[name]))
+        obj._after_restore()
+        return obj
+
+    def _after_restore(self) -> None:
+        pass
+
+
+class RollingStats(_Indicator):
+    """Rolling mean/std over the last *window* values (sliding Welford).
+
+    ``value`` is the z-score of the latest value. The mean and sum of squared
+    deviations are updated in O(1) as values enter and leave a ring buffer,
+    and recomputed exactly from the buffer once per *window* updates so
+    rounding does not drift. A window containing NaN reads NaN; a window of
+    identical values has std 0 (and a NaN z-score), as in pandas.
+    """
+
+    _state = ("window", "ddof", "field", "buf", "mean", "m2", "nans", "same", "age")
+
+    def __init__(self, window: int = 20, ddof: int = 1, field: str = "Close"):
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self.window, self.ddof, self.field = window, ddof, field
+        self.buf: deque = deque(maxlen=window)
+        self.mean = self.m2 = 0.0
+        self.nans = 0  # NaNs currently in the buffer
+        self.same = 0  # run length of identical trailing values
+        self.age = 0  # updates since the last exact recompute
+
+    def _after_restore(self) -> None:
+        self.buf = deque(self.buf, maxlen=self.window)
+
+    def _recompute(self) -> None:
+        vals = [v for v in self.buf if not math.isnan(v)]
+        n = len(vals)
+        self.mean = sum(vals) / n if n else 0.0
+        self.m2 = sum((v - self.mean) ** 2 for v in vals)
+        self.age = 0
+
+    def update(self, bar) -> float:
+        x = _field(bar, self.field)
+        last = self.buf[-1] if self.buf else NAN
+        self.same = self.same + 1 if x == last else 1
+        old = self.buf[0] if len(self.buf) == self.window else None
+        old_nan = old is not None and math.isnan(old)
+        self.buf.append(x)
+        self.nans += math.isnan(x) - old_nan
+
+        self.age += 1
+        if self.nans or old_nan or self.age >= self.window:
+            self._recompute()
+            return self.value
+
+        n = len(self.buf)
+        if old is None:  # growing: plain Welford step
+            d = x - self.mean
+            self.mean += d / n
+            self.m2 += d * (x - self.mean)
+        else:  # full: replace the oldest value
+            prev = self.mean
+            self.mean += (x - old) / n
+            self.m2 += (x - old) * (x - self.mean + old - prev)
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return len(self.buf) == self.window and self.nans == 0
+
+    @property
+    def rolling_mean(self) -> float:
+        return self.mean if self.ready else NAN
+
+    @property
+    def std(self) -> float:
+        if not self.ready or self.window <= self.ddof:
+            return NAN
+        if self.same >= self.window:
+            return 0.0
+        return math.sqrt(max(self.m2, 0.0) / (self.window - self.ddof))
+
+    @property
+    def value(self) -> float:
+        std = self.std
+        if math.isnan(std) or std == 0:
+            return NAN
+        return (self.buf[-1] - self.mean) / std
+
+
+class OnlineATR(_Indicator):
+    """Simple-average true range, as :func:`tradingbot.risk.atr.calc_atr`.
+
+    The batch version back-fills NaN rows (the first ``window - 1``, and any
+    window touching a missing bar) with a later value; a stream cannot, so
+    ``value`` stays NaN there until *window* complete bars are in.
+    """
+
+    _state = ("prev_close",)
+    _children = ("tr",)
+
+    def __init__(self, window: int = 14):
+        self.prev_close = NAN
+        self.tr = RollingStats(window)
+
+    def update(self, bar) -> float:
+        high, low, close = _field(bar, "High"), _field(bar, "Low"), _field(bar)
+        parts = [high - low, abs(high - self.prev_close), abs(low - self.prev_close)]
+        parts = [p for p in parts if not math.isnan(p)]
+        self.tr.update(max(parts) if parts else NAN)
+        self.prev_close = close
+        return self.value
+
+    @property
+    def value(self) -> float:
+        return self.tr.rolling_mean
+
+
+class CumulativeReturn(_Indicator):
+    """Trailing *window*-day return of forward-filled closes."""
+
+    _state = ("window", "closes", "seen", "last")
+
+    def __init__(self, window: int = 21):
+        self.window = window
+        self.closes: deque = deque(maxlen=window + 1)
+        self.seen = 0
+        self.last = NAN  # last finite close
+
+    def _after_restore(self) -> None:
+        self.closes = deque(self.closes, maxlen=self.window + 1)
+
+    def update(self, bar) -> float:
+        close = _field(bar)
+        if not math.isnan(close):
+            if math.isnan(self.last):  # pre-listing bars count as flat
+                self.closes = deque([close] * len(self.closes), maxlen=self.window + 1)
+            self.last = close
+        self.closes.append(self.last)
+        self.seen += 1
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self.seen < self.window:
+            return NAN
+        ret = self.closes[-1] / self.closes[0] - 1.0
+        return 0.0 if math.isnan(ret) else ret
+
+
+class VolAdjMomentum(_Indicator):
+    """Cumulative return over the rolling std of daily returns."""
+
+    _state = ("last",)
+    _children = ("cum", "vol")
+
+    def __init__(self, window: int = 21):
+        self.cum = CumulativeReturn(window)
+        self.vol = RollingStats(window)
+        self.last = NAN
+
+    def update(self, bar) -> float:
+        close = _field(bar)
+        ret = close / self.last - 1.0 if not math.isnan(close) else 0.0
+        self.vol.update(0.0 if math.isnan(ret) else ret)
+        if not math.isnan(close):
+            self.last = close
+        self.cum.update(close)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        vol = self.vol.std
+        if math.isnan(vol) or vol == 0:
+            return NAN
+        return self.cum.value / vol
+
+
+class _EWM(_Indicator):
+    """``Series.ewm(alpha=..., adjust=False, min_periods=...).mean()``, streamed.
+
+    Follows pandas' weighting across NaN gaps (``ignore_na=False``): the old
+    weight keeps decaying while observations are missing.
+    """
+
+    _state = ("alpha", "min_periods", "mean", "old_wt", "nobs")
+
+    def __init__(self, alpha: float, min_periods: int):
+        self.alpha, self.min_periods = alpha, min_periods
+        self.mean = NAN
+        self.old_wt = 1.0
+        self.nobs = 0
+
+    def update(self, x: float) -> float:
+        observed = not math.isnan(x)
+        if self.nobs == 0:
+            if observed:
+                self.mean, self.nobs = x, 1
+        else:
+            self.old_wt *= 1.0 - self.alpha
+            if observed:
+                self.nobs += 1
+                if self.mean != x:
+                    w = self.old_wt
+                    self.mean = (w * self.mean + self.alpha * x) / (w + self.alpha)
+                self.old_wt = 1.0
+        return self.value
+
+    @property
+    def value(self) -> float:
+        return self.mean if self.nobs >= self.min_periods else NAN
+
+
+class OnlineRSI(_Indicator):
+    """Wilder RSI, as :func:`tradingbot.features.panel_features.rsi`."""
+
+    _state = ("prev",)
+    _children = ("up", "down")
+
+    def __init__(self, window: int = 14):
+        self.prev = NAN
+        self.up = _EWM(1.0 / window, window)
+        self.down = _EWM(1.0 / window, window)
+
+    def update(self, bar) -> float:
+        close = _field(bar)
+        if self.up.nobs == 0 and math.isnan(close):
+            return self.value  # not listed yet
+        diff = close - self.prev
+        self.up.update(diff if diff > 0 else 0.0)
+        self.down.update(-diff if diff < 0 else 0.0)
+        self.prev = close
+        return self.value
+
+    @property
+    def value(self) -> float:
+        up, down = self.up.value, self.down.value
+        if down == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + up / down)
+
+
+class OnlineMACD(_Indicator):
+    """MACD histogram (``macd - signal``), as ``ta.trend.MACD.macd_diff``."""
+
+    _children = ("fast", "slow", "signal")
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = _EWM(2.0 / (fast + 1), fast)
+        self.slow = _EWM(2.0 / (slow + 1), slow)
+        self.signal = _EWM(2.0 / (signal + 1), signal)
+
+    def update(self, bar) -> float:
+        close = _field(bar)
+        self.fast.update(close)
+        self.slow.update(close)
+        self.signal.update(self.macd)
+        return self.value
+
+    @property
+    def macd(self) -> float:
+        return self.fast.value - self.slow.value
+
+    @property
+    def value(self) -> float:
+        return self.macd - self.signal.value
+
+
+class PercentileRank(_Indicator):
+    """Percentile rank of the latest value in its expanding or rolling history.
+
+    Keeps the history in a sorted list, so each update is a binary search
+    plus one list insert (and, when rolling, one delete). Ties take their
+    average rank; NaN values read NaN and are not added.
+    """
+
+    _state = ("window", "min_periods", "field", "ordered", "buf", "last")
+
+    def __init__(
+        self,
+        window: int | None = None,
+        min_periods: int | None = None,
+        field: str = "Close",
+    ):
+        self.window, self.field = window, field
+        self.min_periods = (window or 1) if min_periods is None else min_periods
+        self.ordered: list[float] = []
+        self.buf: deque = deque(maxlen=window)  # unused when expanding
+        self.last = NAN
+
+    def _after_restore(self) -> None:
+        self.buf = deque(self.buf, maxlen=self.window)
+
+    def update(self, bar) -> float:
+        x = _field(bar, self.field)
+        if self.window:
+            if len(self.buf) == self.window and not math.isnan(self.buf[0]):
+                del self.ordered[bisect.bisect_left(self.ordered, self.buf[0])]
+            self.buf.append(x)
+        self.last = x
+        if not math.isnan(x):
+            bisect.insort(self.ordered, x)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        n = len(self.ordered)
+        if math.isnan(self.last) or n < self.min_periods:
+            return NAN
+        less = bisect.bisect_left(self.ordered, self.last)
+        equal = bisect.bisect_right(self.ordered, self.last) - less
+        return (less + (equal + 1) / 2) / n
+
+
+class OnlineRegime(_Indicator):
+    """Causal calm/normal/turbulent label from ``VIX`` and ``SPY_vol`` fields.
+
+    Bars missing either field are skipped (``compute_regime`` drops them) and
+    leave the label unchanged.
+    """
+
+    _children = ("vix", "vol")
+
+    def __init__(self, window: int | None = None):
+        self.vix = PercentileRank(window, field="VIX")
+        self.vol = PercentileRank(window, field="SPY_vol")
+
+    def update(self, bar) -> str:
+        if not (math.isnan(_field(bar, "VIX")) or math.isnan(_field(bar, "SPY_vol"))):
+            self.vix.update(bar)
+            self.vol.update(bar)
+        return self.value
+
+    @property
+    def value(self) -> str:
+        vix, vol = self.vix.value, self.vol.value
+        if vix > 0.66 or vol > 0.66:
+            return "turbulent"
+        if vix < 0.33 and vol < 0.33:
+            return "calm"
+        return "normal"
+
+
+_KINDS = {
+    cls.__name__: cls
+    for cls in (
+        RollingStats,
+        OnlineATR,
+        CumulativeReturn,
+        VolAdjMomentum,
+        OnlineRSI,
+        OnlineMACD,
+        PercentileRank,
+        OnlineRegime,
+        _EWM,
+    )
+}
+
+
+def from_dict(d: Mapping[str, Any]) -> _Indicator:
+    """Rebuild an indicator from its ``to_dict()`` output."""
+    return _KINDS[d["kind"]]._restore(d)
+
+
+def _revised(close: float | None, bar) -> bool:
+    """True if *bar* no longer has the stored *close* (NaN matches NaN)."""
+    if close is None or "Close" not in bar:  # no Close, or saved before them
+        return False
+    now = _field(bar, "Close")
+    if math.isnan(close) or math.isnan(now):
+        return math.isnan(close) != math.isnan(now)
+    return not math.isclose(now, close, rel_tol=1e-9)
+
+
+class OnlineState:
+    """Per-ticker indicator sets persisted as one JSON file.
+
+    Parameters
+    ----------
+    path : path, optional
+        File to load from and :meth:`save` to; ``None`` keeps state in memory.
+    factory : callable
+        Returns a fresh ``{name: indicator}`` dict for a ticker seen first.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        factory: Callable[[], dict[str, _Indicator]],
+    ):
+        self.path = Path(path) if path is not None else None
+        self.factory = factory
+        self._tickers: dict[str, dict[str, Any]] = {}
+        if self.path is not None and self.path.exists():
+            raw = json.loads(self.path.read_text())
+            for ticker, entry in raw.items():
+                self._tickers[ticker] = {
+                    "last": entry["last"],
+                    "close": entry.get("close"),
+                    "indicators": {
+                        k: from_dict(v) for k, v in entry["indicators"].items()
+                    },
+                }
+
+    def advance(self, ticker: str, df: pd.DataFrame) -> dict[str, _Indicator]:
+        """Feed the rows of *df* newer than the last bar seen for *ticker*.
+
+        The first call for a ticker replays all of *df*; afterwards a daily
+        run passes one new bar. If *df* does not extend the stored history
+        (its first row is newer than the last bar seen, or the data was
+        revised: the last bar seen has a different ``Close``, as after a
+        split or dividend re-adjustment), the ticker is rebuilt from *df*.
+        """
+        entry = self._tickers.get(ticker)
+        rows = df
+        if entry is not None:
+            last = pd.Timestamp(entry["last"])
+            if (
+                len(df)
+                and df.index[0] <= last
+                and last in df.index
+                and not _revised(entry.get("close"), df.loc[last])
+            ):
+                rows = df.loc[df.index > last]
+            else:
+                entry = None
+        if entry is None:
+            entry = {"last": None, "close": None, "indicators": self.factory()}
+            self._tickers[ticker] = entry
+
+        indicators = entry["indicators"]
+        for bar in rows.to_dict("records"):
+            for ind in indicators.values():
+                ind.update(bar)
+        if len(rows):
+            entry["last"] = pd.Timestamp(rows.index[-1]).isoformat()
+            bar = rows.iloc[-1]
+            entry["close"] = _field(bar, "Close") if "Close" in bar else None
+        return indicators
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        raw = {
+            ticker: {
+                "last": entry["last"],
+                "close": entry["close"],
+                "indicators": {k: v.to_dict() for k, v in entry["indicators"].items()},
+            }
+            for ticker, entry in self._tickers.items()
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(raw))
+        os.replace(tmp, self.path)
@@ -0,0 +1,381 @@
+# File: src/tradingbot/features/panel_features.py
+"""Vectorised features over a whole ``(dates × tickers)`` price matrix.
+
+Every function takes 2-D arrays (rows = dates, columns = tickers; a 1-D
+array is treated as one column) and returns a float64 array of the same
+shape, computed in NumPy passes over all tickers at once. Semantics match
+the single-ticker pandas functions in :mod:`tradingbot.features`, which
+are now thin wrappers around these:
+
+* a window containing NaN yields NaN (pandas ``min_periods=window``);
+* returns are taken on forward-filled closes with the first return 0
+  (``pct_change().fillna(0)``).
+
+Columns are computed independently, so on a union calendar a ticker's
+missing bars only affect its own windows.
+
+The ``*_multi`` variants take a list of windows and return a stacked
+``(windows, dates, tickers)`` array. They share one set of prefix sums
+(:class:`RollingMoments`) across all windows, so a parameter grid costs
+O(T) per window instead of a full pandas rolling pass each.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from tradingbot import kernels
+
+__all__ = [
+    "daily_returns",
+    "rolling_mean_std",
+    "rolling_zscore",
+    "cumulative_return",
+    "vol_adj_momentum",
+    "trailing_return",
+    "true_range",
+    "atr",
+    "rsi",
+    "macd",
+    "wilder_atr",
+    "pct_rank",
+    "as_frame",
+    "RollingMoments",
+    "rolling_zscore_multi",
+    "cumulative_return_multi",
+    "vol_adj_momentum_multi",
+    "window_frame",
+]
+
+# Upper bound on the (rows × cols × window) scratch space of one block
+_BLOCK_ELEMS = 1 << 22
+
+
+def _as2d(x) -> np.ndarray:
+    arr = np.asarray(x, dtype=np.float64)
+    return arr[:, None] if arr.ndim == 1 else arr
+
+
+def _ffill(x: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs down each column."""
+    idx = np.where(np.isnan(x), 0, np.arange(len(x))[:, None])
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    return x[idx, np.arange(x.shape[1])]
+
+
+def _bfill(x: np.ndarray) -> np.ndarray:
+    return _ffill(x[::-1])[::-1]
+
+
+def daily_returns(close) -> np.ndarray:
+    """Simple returns of forward-filled closes; first row and pre-listing 0."""
+    c = _ffill(_as2d(close))
+    out = np.zeros_like(c)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[1:] = c[1:] / c[:-1] - 1.0
+    out[np.isnan(out)] = 0.0
+    return out
+
+
+def rolling_mean_std(
+    x, window: int, ddof: int = 1, with_std: bool = True
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Rolling mean and standard deviation over trailing *window* rows.
+
+    Two-pass (mean, then centred squares) per window, processed in column
+    blocks so the scratch space stays bounded on wide panels. The std is
+    skipped (``None``) unless *with_std*.
+    """
+    x = _as2d(x)
+    n_rows, n_cols = x.shape
+    mean = np.full(x.shape, np.nan)
+    std = np.full(x.shape, np.nan) if with_std else None
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    if n_rows < window:
+        return mean, std
+
+    step = max(1, _BLOCK_ELEMS // max(1, (n_rows - window + 1) * window))
+    for j in range(0, n_cols, step):
+        blk = sliding_window_view(x[:, j : j + step], window, axis=0)
+        m = blk.mean(axis=-1)
+        mean[window - 1 :, j : j + step] = m
+        if with_std and window > ddof:
+            dev = blk - m[..., None]
+            var = np.einsum("...i,...i->...", dev, dev) / (window - ddof)
+            # A flat window's mean can round off its value; its std is 0
+            var[blk.max(axis=-1) == blk.min(axis=-1)] = 0.0
+            std[window - 1 :, j : j + step] = np.sqrt(var)
+    return mean, std
+
+
+def rolling_zscore(x, window: int = 20) -> np.ndarray:
+    """``(x - rolling_mean) / rolling_std`` (sample std, as pandas)."""
+    return kernels.rolling_zscore(_as2d(x), window)
+
+
+def cumulative_return(close, window: int = 21) -> np.ndarray:
+    """Trailing *window*-day compounded return, as a ratio of closes.
+
+    ``prod(1 + r)`` over the window telescopes to ``close[t] / close[t-w]``;
+    on the first full window the base is the first close (its return is
+    0). Closes are forward-filled, and bars before a ticker's first close
+    count as flat.
+    """
+    c = _ffill(_as2d(close))
+    c = np.where(np.isnan(c), _bfill(c), c)  # pre-listing: flat at first close
+    out = np.full(c.shape, np.nan)
+    if len(c) < window:
+        return out
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[window - 1] = c[window - 1] / c[0] - 1.0
+        out[window:] = c[window:] / c[:-window] - 1.0
+    rows = out[window - 1 :]
+    rows[np.isnan(rows)] = 0.0  # no closes at all → no movement
+    return out
+
+
+def vol_adj_momentum(close, window: int = 21) -> np.ndarray:
+    """Cumulative return divided by the rolling std of daily returns."""
+    _, vol = rolling_mean_std(daily_returns(close), window)
+    vol[vol == 0] = np.nan
+    return cumulative_return(close, window) / vol
+
+
+def trailing_return(
+    close, window: int = 60, fill_value: float | None = 0.0
+) -> np.ndarray:
+    """``pct_change(window)`` of forward-filled closes, NaN as *fill_value*.
+
+    The cross-sectional metric of ``compute_return_matrix``: unlike
+    :func:`cumulative_return` there is no partial first window. Dates
+    without a full window (warm-up, not yet listed) are NaN before the
+    fill; ``fill_value=None`` keeps them NaN.
+    """
+    c = _ffill(_as2d(close))
+    out = np.full(c.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[window:] = c[window:] / c[:-window] - 1.0
+    if fill_value is not None:
+        out[np.isnan(out)] = fill_value
+    return out
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """Row-wise max of ``H-L``, ``|H-Cprev|``, ``|L-Cprev|`` skipping NaNs."""
+    high, low, close = _as2d(high), _as2d(low), _as2d(close)
+    prev = np.full(close.shape, np.nan)
+    prev[1:] = close[:-1]
+    return np.fmax(np.fmax(high - low, np.abs(high - prev)), np.abs(low - prev))
+
+
+def atr(high, low, close, window: int = 14) -> np.ndarray:
+    """Simple-average true range, back-filled over the warm-up rows."""
+    mean, _ = rolling_mean_std(true_range(high, low, close), window, with_std=False)
+    return _bfill(mean)
+
+
+def _ewm(x: np.ndarray, alpha: float, min_periods: int = 0) -> np.ndarray:
+    """Column-wise ``ewm(alpha=..., adjust=False).mean()``; leading NaNs skipped."""
+    ewm = pd.DataFrame(x).ewm(alpha=alpha, adjust=False, min_periods=min_periods)
+    return ewm.mean().to_numpy()
+
+
+def rsi(close, window: int = 14) -> np.ndarray:
+    """Wilder RSI, as ``ta.momentum.RSIIndicator(close, window).rsi()``.
+
+    Each column starts at its first close (pre-listing rows are NaN rather
+    than counted as flat days).
+    """
+    c = _as2d(close)
+    diff = np.full(c.shape, np.nan)
+    diff[1:] = c[1:] - c[:-1]
+    listed = np.maximum.accumulate(~np.isnan(c), axis=0)
+    up = np.where(listed, np.where(diff > 0, diff, 0.0), np.nan)
+    down = np.where(listed, np.where(diff < 0, -diff, 0.0), np.nan)
+    ema_up = _ewm(up, 1.0 / window, window)
+    ema_down = _ewm(down, 1.0 / window, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 100.0 - 100.0 / (1.0 + ema_up / ema_down)
+    out[ema_down == 0] = 100.0
+    return out
+
+
+def macd(
+    close, fast: int = 12, slow: int = 26, signal: int = 9
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram, as ``ta.trend.MACD``."""
+    c = _as2d(close)
+    line = _ewm(c, 2.0 / (fast + 1), fast) - _ewm(c, 2.0 / (slow + 1), slow)
+    sig = _ewm(line, 2.0 / (signal + 1), signal)
+    return line, sig, line - sig
+
+
+def wilder_atr(high, low, close, window: int = 14) -> np.ndarray:
+    """Wilder ATR, as ``ta.volatility.AverageTrueRange(..., window)``.
+
+    Zero until the seed row ``window - 1`` (counted from a column's first
+    bar), which holds the mean true range so far; after that
+    ``atr = (prev * (window - 1) + tr) / window``. Unlike ``ta``, a missing
+    bar is skipped instead of turning the rest of the series into NaN.
+    """
+    tr = true_range(high, low, close)
+    n_rows, n_cols = tr.shape
+    out = np.zeros(tr.shape)
+    finite = ~np.isnan(tr)
+    seed_row = np.argmax(finite, axis=0) + window - 1
+    cols = np.flatnonzero(finite.any(axis=0) & (seed_row < n_rows))
+    if not len(cols):
+        return out
+
+    rows = seed_row[cols]
+    seed = np.nancumsum(tr, axis=0)[rows, cols] / np.cumsum(finite, axis=0)[rows, cols]
+    # The recursion is an adjust=False EWM with alpha 1/window started at seed
+    after = np.arange(n_rows)[:, None] > seed_row[None, :]
+    y = np.where(after, tr, np.nan)
+    y[rows, cols] = seed
+    smoothed = _ewm(y, 1.0 / window)
+    started = np.arange(n_rows)[:, None] >= seed_row[None, :]
+    out[started] = smoothed[started]
+    return out
+
+
+def pct_rank(x, window: int | None = None, min_periods: int | None = None):
+    """Causal percentile rank of each value among the values up to it.
+
+    ``window=None`` ranks against the expanding history, like
+    ``expanding().rank(pct=True)``; an int ranks within the trailing window,
+    like ``rolling(window).rank(pct=True)``. Ties share their average rank.
+    *min_periods* defaults to 1 (expanding) or *window* (rolling).
+
+    Values are coded by sort order once, then each column is ranked by
+    :func:`tradingbot.kernels.percentile_rank` with a Fenwick tree of counts,
+    O(T log T) instead of re-ranking the history every day.
+    """
+    x = _as2d(x)
+    if min_periods is None:
+        min_periods = window or 1
+    out = np.empty(x.shape)
+    for j in range(x.shape[1]):
+        col = x[:, j]
+        valid = ~np.isnan(col)
+        uniq, inv = np.unique(col[valid], return_inverse=True)
+        codes = np.zeros(len(col), dtype=np.int64)
+        codes[valid] = inv + 1
+        out[:, j] = kernels.percentile_rank(codes, len(uniq), window or 0, min_periods)
+    return out
+
+
+def _prefix_sum(x: np.ndarray) -> np.ndarray:
+    """Prefix sums along axis 0 with a leading zero row, error-compensated.
+
+    ``np.cumsum`` adds sequentially, so the rounding error of every step is
+    recovered exactly (Knuth's TwoSum) and the running total of those errors
+    is added back: the result is as accurate as a Kahan-summed prefix.
+    """
+    out = np.zeros((len(x) + 1,) + x.shape[1:])
+    s = np.cumsum(x, axis=0)
+    if len(x) > 1:
+        a, b, t = s[:-1], x[1:], s[1:]
+        bb = t - a
+        err = (a - (t - bb)) + (b - bb)
+        s[1:] += np.cumsum(err, axis=0)
+    out[1:] = s
+    return out
+
+
+class RollingMoments:
+    """Rolling mean/std/z-score for any number of windows from shared sums.
+
+    Prefix sums of ``x - k`` and ``(x - k)²`` are built once, where ``k`` is
+    each column's first finite value (shifting keeps the sum of squares
+    small, limiting cancellation). Every window is then a difference of two
+    rows. Windows containing NaN yield NaN, as in pandas.
+    """
+
+    def __init__(self, x, ddof: int = 1):
+        x = _as2d(x)
+        self.x, self.ddof = x, ddof
+        nan = np.isnan(x)
+        first = np.argmax(~nan, axis=0)
+        self._shift = x[first, np.arange(x.shape[1])]
+        self._shift[np.isnan(self._shift)] = 0.0
+        d = np.where(nan, 0.0, x - self._shift)
+        self._s1 = _prefix_sum(d)
+        self._s2 = _prefix_sum(d * d)
+        self._nans = np.concatenate(
+            [np.zeros((1, x.shape[1]), dtype=np.int64), np.cumsum(nan, axis=0)]
+        )
+
+    def _window(self, prefix: np.ndarray, window: int) -> np.ndarray:
+        out = np.full(self.x.shape, np.nan)
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        if len(self.x) >= window:
+            diff = prefix[window:] - prefix[:-window]
+            ok = (self._nans[window:] - self._nans[:-window]) == 0
+            out[window - 1 :] = np.where(ok, diff, np.nan)
+        return out
+
+    def mean(self, window: int) -> np.ndarray:
+        return self._window(self._s1, window) / window + self._shift
+
+    def var(self, window: int) -> np.ndarray:
+        if window <= self.ddof:
+            return np.full(self.x.shape, np.nan)
+        s1 = self._window(self._s1, window)
+        s2 = self._window(self._s2, window)
+        ss = s2 - s1 * s1 / window
+        # Anything below the cancellation error of the two prefix rows is a
+        # flat window: report an exact 0, as pandas does.
+        tol = np.full(self.x.shape, np.inf)
+        tol[window - 1 :] = (self._s2[window:] + self._s2[:-window]) * 1e-13
+        ss[ss <= tol] = 0.0
+        return ss / (window - self.ddof)
+
+    def std(self, window: int) -> np.ndarray:
+        return np.sqrt(self.var(window))
+
+    def zscore(self, window: int) -> np.ndarray:
+        std = self.std(window)
+        std[std == 0] = np.nan  # flat window: 0/0 in the exact arithmetic
+        return (self.x - self.mean(window)) / std
+
+
+def rolling_zscore_multi(x, windows: Sequence[int]) -> np.ndarray:
+    """:func:`rolling_zscore` for each of *windows*, stacked on axis 0."""
+    moments = RollingMoments(x)
+    return np.stack([moments.zscore(w) for w in windows])
+
+
+def cumulative_return_multi(close, windows: Sequence[int]) -> np.ndarray:
+    """:func:`cumulative_return` for each of *windows*, stacked on axis 0."""
+    return np.stack([cumulative_return(close, w) for w in windows])
+
+
+def vol_adj_momentum_multi(close, windows: Sequence[int]) -> np.ndarray:
+    """:func:`vol_adj_momentum` for each of *windows*, stacked on axis 0."""
+    moments = RollingMoments(daily_returns(close))
+    out = []
+    for w in windows:
+        vol = moments.std(w)
+        vol[vol == 0] = np.nan
+        out.append(cumulative_return(close, w) / vol)
+    return np.stack(out)
+
+
+def window_frame(stacked: np.ndarray, index: pd.Index, windows) -> pd.DataFrame:
+    """One column per window from a single-ticker ``(windows, dates)`` stack."""
+    columns = pd.Index([int(w) for w in windows], name="window")
+    return pd.DataFrame(np.asarray(stacked).T, index=index, columns=columns)
+
+
+def as_frame(values: np.ndarray, like: pd.DataFrame | pd.Series) -> pd.DataFrame:
+    """Wrap a result array with the index (and columns) of *like*."""
+    if isinstance(like, pd.Series):
+        return pd.DataFrame(values, index=like.index, columns=[like.name])
+    return pd.DataFrame(values, index=like.index, columns=like.columns)
@@ -0,0 +1,329 @@
+# File: src/tradingbot/features/store.py
+"""Content-addressed cache for computed features.
+
+A feature result is keyed by ``(name, version, params, hash of the input
+columns)``: the same indicator over the same bars is computed once and then
+served from an in-process LRU, or from a parquet file under the store
+directory in later runs. Changing the bars, the parameters or the feature's
+*version* yields a new key, so stale results are never returned.
+
+Functions opt in with :func:`cached_feature`; callers do not change.
+
+Every new bar changes the input hash and so writes new files; the disk layer
+is therefore capped at *max_bytes*. Reads refresh a file's mtime, and once
+the store outgrows the cap the least recently used files are deleted. The
+store directory carries the :data:`~tradingbot.data.cache_manifest.SELF_MANAGED`
+marker, so the price-cache manifest leaves its files alone.
+
+Selection, first match wins:
+  1. ``set_feature_store(...)`` from code (``None`` resets, ``False`` disables)
+  2. ``TRADINGBOT_FEATURE_STORE`` environment variable (a directory, or ``off``
+     to keep results in memory only)
+  3. ``features: {store_dir: ..., memory_items: ..., max_bytes: ...}`` in the
+     config
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from tradingbot.data.cache_manifest import SELF_MANAGED
+
+__all__ = [
+    "FeatureStore",
+    "cached_feature",
+    "data_digest",
+    "get_feature_store",
+    "set_feature_store",
+]
+
+_KIND_KEY = b"tradingbot.feature"
+
+
+def data_digest(obj: pd.Series | pd.DataFrame) -> str:
+    """Stable hash of the index and values of *obj* (not of its identity)."""
+    h = hashlib.blake2b(digest_size=16)
+    index = obj.index
+    if isinstance(index, pd.DatetimeIndex):
+        h.update(np.ascontiguousarray(index.asi8).data)
+    else:
+        h.update(pd.util.hash_pandas_object(index).to_numpy().data)
+    frame = obj.to_frame() if isinstance(obj, pd.Series) else obj
+    for name in frame.columns:
+        col = frame[name]
+        h.update(repr((name, str(col.dtype))).encode())
+        if col.dtype == object:
+            h.update(pd.util.hash_pandas_object(col, index=False).to_numpy().data)
+        else:
+            h.update(np.ascontiguousarray(col.to_numpy()).data)
+    return h.hexdigest()
+
+
+class FeatureStore:
+    """In-process LRU over an optional on-disk parquet store.
+
+    Parameters
+    ----------
+    root : path, optional
+        Directory for persisted results (``<root>/<name>/<key>.parquet``).
+        ``None`` keeps results in memory only.
+    memory_items : int, default 512
+        Number of results kept in the in-process LRU.
+    max_bytes : int, default 1 GiB
+        Size cap of the on-disk store; ``None`` for no cap.
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        memory_items: int = 512,
+        max_bytes: int | None = 1 << 30,
+    ):
+        self.root = Path(root) if root is not None else None
+        self.memory_items = memory_items
+        self.max_bytes = max_bytes
+        self._lru: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes: int | None = None  # running total, scanned on first save
+        self.hits = self.misses = 0
+
+    # -- keys -----------------------------------------------------------
+
+    @staticmethod
+    def key(name: str, params: dict, inputs, version: int = 1) -> str:
+        spec = json.dumps(
+            {"name": name, "version": version, "params": params},
+            sort_keys=True,
+            default=repr,
+        )
+        h = hashlib.blake2b(spec.encode(), digest_size=16)
+        h.update(data_digest(inputs).encode())
+        return f"{name}-{h.hexdigest()}"
+
+    def _path(self, key: str) -> Path:
+        return self.root / key.split("-", 1)[0] / f"{key}.parquet"
+
+    # -- memory layer ---------------------------------------------------
+
+    def _remember(self, key: str, value) -> None:
+        with self._lock:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.memory_items:
+                self._lru.popitem(last=False)
+
+    def _recall(self, key: str):
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+            return value
+
+    # -- disk layer -----------------------------------------------------
+
+    def _load(self, key: str):
+        if self.root is None:
+            return None
+        fp = self._path(key)
+        try:
+            table = pq.read_table(fp)
+            os.utime(fp)  # recency for eviction
+        except (FileNotFoundError, OSError, pa.ArrowInvalid):
+            return None
+        kind = json.loads((table.schema.metadata or {}).get(_KIND_KEY, b"{}"))
+        df = table.to_pandas()
+        if kind.get("series"):
+            return df.iloc[:, 0].rename(kind.get("name"))
+        return df
+
+    def _save(self, key: str, value) -> None:
+        if self.root is None:
+            return
+        if isinstance(value, pd.Series):
+            kind = {"series": True, "name": value.name}
+            frame = value.to_frame("value")
+        else:
+            kind, frame = {"series": False}, value
+        table = pa.Table.from_pandas(frame, preserve_index=True)
+        meta = dict(table.schema.metadata or {})
+        meta[_KIND_KEY] = json.dumps(kind, default=str).encode()
+        table = table.replace_schema_metadata(meta)
+
+        fp = self._path(key)
+        fp.parent.mkdir(parents=True, exist_ok=True)
+        marker = self.root / SELF_MANAGED
+        if not marker.exists():
+            marker.touch()
+        tmp = fp.with_name(f".{fp.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, fp)
+
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._files())
+            else:
+                self._disk_bytes += fp.stat().st_size
+            over = self._disk_bytes > self.max_bytes
+        if over:
+            self.evict(keep=fp)
+
+    def _files(self) -> list[tuple[float, int, Path]]:
+        """``(mtime, size, path)`` of every stored result."""
+        out = []
+        for fp in self.root.glob("*/*.parquet"):
+            try:
+                st = fp.stat()
+            except FileNotFoundError:  # evicted by another process
+                continue
+            out.append((st.st_mtime, st.st_size, fp))
+        return out
+
+    def evict(self, max_bytes: int | None = None, keep: Path | None = None) -> int:
+        """Delete least recently used files until the store fits in *max_bytes*.
+
+        Evicts down to 90% of the cap so that the next few saves do not
+        trigger another scan. Returns the number of bytes freed.
+        """
+        cap = self.max_bytes if max_bytes is None else max_bytes
+        if self.root is None or cap is None:
+            return 0
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        target, freed = int(cap * 0.9), 0
+        for _, size, fp in files:
+            if total - freed <= target:
+                break
+            if fp == keep:
+                continue
+            fp.unlink(missing_ok=True)
+            freed += size
+        with self._lock:
+            self._disk_bytes = total - freed
+        return freed
+
+    # -- public ---------------------------------------------------------
+
+    def get_or_compute(
+        self,
+        name: str,
+        params: dict,
+        inputs: pd.Series | pd.DataFrame,
+        compute: Callable[[], Any],
+        version: int = 1,
+    ):
+        """Return the cached result for this key, computing it on a miss.
+
+        Results are returned as copies so callers may mutate them freely.
+        """
+        key = self.key(name, params, inputs, version)
+        value = self._recall(key)
+        if value is None:
+            value = self._load(key)
+            if value is not None:
+                self._remember(key, value)
+        if value is not None:
+            self.hits += 1
+            return value.copy()
+
+        self.misses += 1
+        value = compute()
+        self._remember(key, value)
+        self._save(key, value)
+        return value.copy()
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._lru.clear()
+
+
+# ---------------------------------------------------------------------------
+# Active store
+# ---------------------------------------------------------------------------
+
+_override: FeatureStore | bool | None = None
+
+
+def set_feature_store(store: FeatureStore | bool | None) -> None:
+    """Use *store* for all cached features.
+
+    ``False`` disables caching entirely; ``None`` goes back to the env/config
+    selection.
+    """
+    global _override
+    _override = store
+    _configured.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _configured() -> FeatureStore:
+    from tradingbot.config import features as feat_cfg
+
+    root = os.getenv("TRADINGBOT_FEATURE_STORE")
+    if root is None:
+        root = feat_cfg.get("store_dir")
+    if root in ("", "off", "none"):
+        root = None
+    max_bytes = feat_cfg.get("max_bytes", 1 << 30)
+    return FeatureStore(
+        root,
+        int(feat_cfg.get("memory_items", 512)),
+        int(max_bytes) if max_bytes is not None else None,
+    )
+
+
+def get_feature_store() -> FeatureStore | None:
+    """Return the active store, or ``None`` when caching is disabled."""
+    if _override is False:
+        return None
+    if isinstance(_override, FeatureStore):
+        return _override
+    return _configured()
+
+
+def cached_feature(
+    name: str, columns: Sequence[str] | None = None, version: int = 1
+) -> Callable:
+    """Route a ``fn(data, *params)`` feature function through the store.
+
+    *columns* lists the DataFrame columns the feature reads (only those are
+    hashed); for Series inputs the whole series is hashed. Bump *version*
+    whenever the feature's math changes. The undecorated function stays
+    available as ``fn.compute``.
+    """
+
+    def deco(fn: Callable) -> Callable:
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(data, *args, **kwargs):
+            store = get_feature_store()
+            if store is None:
+                return fn(data, *args, **kwargs)
+            bound = sig.bind(data, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(list(bound.arguments.items())[1:])
+            inputs = data[list(columns)] if columns is not None else data
+            return store.get_or_compute(
+                name, params, inputs, lambda: fn(data, *args, **kwargs), version
+            )
+
+        wrapper.compute = fn
+        return wrapper
+
+    return deco
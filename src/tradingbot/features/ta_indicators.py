@@ -1,5 +1,17 @@
+import numpy as np
 import pandas as pd
-import ta
+
+from tradingbot.features import panel_features
+from tradingbot.features.store import cached_feature
+
+_PRICE_COLS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _is_clean(df: pd.DataFrame) -> bool:
+    """True for frames straight from the cache: a DatetimeIndex, numeric bars."""
+    return isinstance(df.index, pd.DatetimeIndex) and all(
+        pd.api.types.is_numeric_dtype(df[c]) for c in _PRICE_COLS if c in df.columns
+    )
 
 
 def add_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
@@ -7,34 +19,43 @@ def add_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
 
     The function is robust to CSVs saved by yfinance which include leading
     metadata rows (Price/Ticker/Date). Columns are coerced to numeric before
-    indicator computation.
+    indicator computation; frames that are already clean (DatetimeIndex,
+    numeric columns) skip the coercion and index parsing.
     """
+    if _is_clean(df):
+        # Fast path (e.g. straight from the Parquet cache): nothing to coerce
+        indicators = _ta_columns(df)
+        return df.assign(**{c: indicators[c] for c in indicators.columns})
+
     df = df.copy()
 
     # Ensure price columns are numeric
-    numeric_cols = [
-        c for c in ["Open", "High", "Low", "Close", "Volume"] if c in df.columns
-    ]
+    numeric_cols = [c for c in _PRICE_COLS if c in df.columns]
     df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
 
     # Some cached CSVs include header rows ("Price", "Ticker", "Date").
     # Keep only rows whose index parses to a datetime.
-    mask = pd.to_datetime(df.index, errors="coerce").notna()
-    df = df.loc[mask].copy()
-    df.index = pd.to_datetime(df.index)
+    dates = pd.to_datetime(df.index, errors="coerce")
+    df = df.loc[dates.notna()].copy()
+    df.index = dates[dates.notna()]
 
-    # --- Technical indicators -------------------------------------------------
-    # `ta` library doesn't ship with type stubs, so we silence the type checker
-    df["rsi_14"] = ta.momentum.RSIIndicator(  # type: ignore[attr-defined]
-        close=df["Close"], window=14
-    ).rsi()
+    indicators = _ta_columns(df)
+    df[list(indicators.columns)] = indicators
+    return df  # type: ignore[return-value]
 
-    macd = ta.trend.MACD(close=df["Close"])  # type: ignore[attr-defined]
-    df["macd_diff"] = macd.macd_diff()
 
-    atr = ta.volatility.AverageTrueRange(  # type: ignore[attr-defined]
-        high=df["High"], low=df["Low"], close=df["Close"], window=14
-    )
-    df["atr_14"] = atr.average_true_range()
+@cached_feature("ta_rsi_macd_atr", columns=["High", "Low", "Close"], version=2)
+def _ta_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """RSI(14), MACD histogram and ATR(14) as a DataFrame on *df*'s index.
 
-    return df  # type: ignore[return-value]
+    Native NumPy versions of the ``ta`` indicators (see
+    :mod:`tradingbot.features.panel_features`), matching them on clean bars.
+    """
+    close = df["Close"].to_numpy(dtype=np.float64)
+    high = df["High"].to_numpy(dtype=np.float64)
+    low = df["Low"].to_numpy(dtype=np.float64)
+    out = pd.DataFrame(index=df.index)
+    out["rsi_14"] = panel_features.rsi(close, 14)[:, 0]
+    out["macd_diff"] = panel_features.macd(close)[2][:, 0]
+    out["atr_14"] = panel_features.wilder_atr(high, low, close, 14)[:, 0]
+    return out
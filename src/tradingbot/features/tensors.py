@@ -0,0 +1,228 @@
+# File: src/tradingbot/features/tensors.py
+"""``(samples × lookback × features)`` design tensors for an ML overlay.
+
+A sample is one ticker on one date *t*. Its input is the last *lookback*
+rows of per-bar features up to and including *t*, and its label is the
+forward return ``close[t + horizon] / close[t] - 1``. Inputs therefore
+only see bars up to the close of *t*, and labels start strictly after it.
+Samples with a missing bar in the window or no label are dropped.
+
+:class:`WindowTensorBuilder` works through the universe in ticker chunks:
+
+* each chunk's features are computed once into a ``(tickers, dates,
+  features)`` array in the requested dtype (float32 by default);
+* :meth:`~WindowTensorBuilder.windows` exposes every window of a chunk as a
+  ``sliding_window_view`` of that array, without copying;
+* :meth:`~WindowTensorBuilder.batches` gathers at most *batch_size* valid
+  samples at a time.
+
+Peak memory is one chunk plus one batch, whatever the universe size. With a
+memory-mapped panel (:func:`tradingbot.data.memmap_store.open_memmap_panel`)
+only the current chunk's columns are paged in. A fully materialised tensor
+for 500 tickers, 20 years and a 60-bar lookback would be several GB per
+feature; here the default chunk of 64 tickers over 5000 dates with four
+float32 features is about 5 MB.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterator, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from tradingbot.data.panel import PricePanel
+
+__all__ = ["FEATURES", "WindowBatch", "WindowTensorBuilder"]
+
+
+def _prev(x: np.ndarray) -> np.ndarray:
+    out = np.full(x.shape, np.nan)
+    out[1:] = x[:-1]
+    return out
+
+
+def _ret(fields: Mapping[str, np.ndarray]) -> np.ndarray:
+    close = fields["Close"]
+    return close / _prev(close) - 1.0
+
+
+def _range(fields: Mapping[str, np.ndarray]) -> np.ndarray:
+    return (fields["High"] - fields["Low"]) / fields["Close"]
+
+
+def _gap(fields: Mapping[str, np.ndarray]) -> np.ndarray:
+    return fields["Open"] / _prev(fields["Close"]) - 1.0
+
+
+def _volume_change(fields: Mapping[str, np.ndarray]) -> np.ndarray:
+    logv = np.log1p(fields["Volume"])
+    return logv - _prev(logv)
+
+
+# Per-bar features: name -> function of the (dates × tickers) float64 fields.
+# Missing bars must come out NaN so windows touching them are dropped.
+FEATURES: dict[str, Callable[[Mapping[str, np.ndarray]], np.ndarray]] = {
+    "return": _ret,
+    "range": _range,
+    "gap": _gap,
+    "volume_change": _volume_change,
+}
+
+
+class _ChunkFields(dict):
+    """Panel fields for one column slice, read (as float64) on first use."""
+
+    def __init__(self, panel: PricePanel, cols: slice):
+        super().__init__()
+        self.panel, self.cols = panel, cols
+
+    def __missing__(self, name: str) -> np.ndarray:
+        value = np.asarray(self.panel.fields[name][:, self.cols], dtype=np.float64)
+        self[name] = value
+        return value
+
+
+@dataclass
+class WindowBatch:
+    """One batch of samples.
+
+    Attributes
+    ----------
+    X : np.ndarray
+        ``(samples, lookback, features)`` inputs, oldest bar first.
+    y : np.ndarray
+        ``(samples,)`` forward returns.
+    tickers : np.ndarray
+        Ticker of each sample.
+    dates : pd.DatetimeIndex
+        Date *t* of each sample (the last bar of its window).
+    """
+
+    X: np.ndarray
+    y: np.ndarray
+    tickers: np.ndarray
+    dates: pd.DatetimeIndex
+
+
+class WindowTensorBuilder:
+    """Sliding-window design tensors over a :class:`PricePanel`.
+
+    Parameters
+    ----------
+    panel : PricePanel
+        Price panel; only the fields the *features* read are touched.
+    lookback : int, default 60
+        Bars per sample window.
+    horizon : int, default 1
+        Label horizon in bars (forward return from *t* to ``t + horizon``).
+    features : sequence of str, default all of :data:`FEATURES`
+        Feature names, in the order of the last tensor axis.
+    dtype : default np.float32
+        Dtype of the tensors (features are computed in float64 first).
+    tickers_per_chunk : int, default 64
+        Tickers whose features are held in memory at once.
+    """
+
+    def __init__(
+        self,
+        panel: PricePanel,
+        lookback: int = 60,
+        horizon: int = 1,
+        features: Sequence[str] | None = None,
+        dtype=np.float32,
+        tickers_per_chunk: int = 64,
+    ):
+        if lookback < 1 or horizon < 1 or tickers_per_chunk < 1:
+            raise ValueError("lookback, horizon and tickers_per_chunk must be >= 1")
+        self.panel = panel
+        self.lookback = lookback
+        self.horizon = horizon
+        self.features = list(features or FEATURES)
+        unknown = [f for f in self.features if f not in FEATURES]
+        if unknown:
+            raise ValueError(f"Unknown feature: {unknown[0]}")
+        self.dtype = np.dtype(dtype)
+        self.tickers_per_chunk = tickers_per_chunk
+
+    def chunks(self) -> Iterator[slice]:
+        """Column slices of the panel, *tickers_per_chunk* at a time."""
+        n = len(self.panel.tickers)
+        for start in range(0, n, self.tickers_per_chunk):
+            yield slice(start, min(start + self.tickers_per_chunk, n))
+
+    def base(self, cols: slice) -> tuple[np.ndarray, np.ndarray]:
+        """Features ``(tickers, dates, features)`` and labels ``(tickers, dates)``.
+
+        Row *t* of the labels is the forward return of the sample ending at
+        *t* (NaN for the last *horizon* dates).
+        """
+        fields = _ChunkFields(self.panel, cols)
+        n_dates = len(self.panel.dates)
+        n_tick = cols.stop - cols.start
+        feats = np.empty((n_tick, n_dates, len(self.features)), dtype=self.dtype)
+        for k, name in enumerate(self.features):
+            feats[:, :, k] = FEATURES[name](fields).T
+        close = fields["Close"]
+        label = np.full(close.shape, np.nan)
+        if self.horizon < n_dates:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                fwd = close[self.horizon :] / close[: -self.horizon]
+            label[: n_dates - self.horizon] = fwd - 1.0
+        return feats, label.T.astype(self.dtype)
+
+    def windows(self, feats: np.ndarray) -> np.ndarray:
+        """Every lookback window of *feats*, ``(tickers, samples, lookback, features)``.
+
+        A read-only view: sample *s* ends on date ``s + lookback - 1``.
+        """
+        view = sliding_window_view(feats, self.lookback, axis=1)
+        return np.moveaxis(view, -1, 2)
+
+    def valid(self, feats: np.ndarray, label: np.ndarray) -> np.ndarray:
+        """``(tickers, samples)`` mask of complete windows with a label."""
+        bad = ~np.isfinite(feats).all(axis=-1)
+        count = np.zeros((bad.shape[0], bad.shape[1] + 1), dtype=np.int64)
+        np.cumsum(bad, axis=1, out=count[:, 1:])
+        in_window = count[:, self.lookback :] - count[:, : -self.lookback]
+        return (in_window == 0) & np.isfinite(label[:, self.lookback - 1 :])
+
+    def batches(self, batch_size: int = 65_536) -> Iterator[WindowBatch]:
+        """Valid samples in ``(ticker chunk, ticker, date)`` order."""
+        tickers = np.asarray(self.panel.tickers)
+        for cols in self.chunks():
+            feats, label = self.base(cols)
+            if feats.shape[1] < self.lookback:
+                continue
+            windows = self.windows(feats)
+            tick_idx, samp_idx = np.nonzero(self.valid(feats, label))
+            for start in range(0, len(tick_idx), batch_size):
+                ti = tick_idx[start : start + batch_size]
+                si = samp_idx[start : start + batch_size]
+                rows = si + self.lookback - 1
+                yield WindowBatch(
+                    X=windows[ti, si],
+                    y=label[ti, rows],
+                    tickers=tickers[cols][ti],
+                    dates=self.panel.dates[rows],
+                )
+
+    def build(self) -> WindowBatch:
+        """All valid samples in one batch (small universes and tests)."""
+        parts = list(self.batches())
+        if not parts:
+            n_feat = len(self.features)
+            return WindowBatch(
+                np.empty((0, self.lookback, n_feat), dtype=self.dtype),
+                np.empty(0, dtype=self.dtype),
+                np.empty(0, dtype=object),
+                pd.DatetimeIndex([]),
+            )
+        return WindowBatch(
+            np.concatenate([p.X for p in parts]),
+            np.concatenate([p.y for p in parts]),
+            np.concatenate([p.tickers for p in parts]),
+            pd.DatetimeIndex(np.concatenate([p.dates.to_numpy() for p in parts])),
+        )
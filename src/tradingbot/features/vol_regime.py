@@ -3,21 +3,19 @@ import os
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from tradingbot.data.providers import get_provider
+from tradingbot.features.panel_features import pct_rank
 
 
 def load_vix(start: str = "2015-01-01") -> pd.Series:
     """Fetch daily VIX close."""
     try:
-        data = yf.download("^VIX", start=start)
+        data = get_provider().fetch("^VIX", start, None)
         if data is None or data.empty:
             raise ValueError("VIX data is empty")
 
-        # Handle multi-level columns from yfinance
-        if isinstance(data.columns, pd.MultiIndex):
-            vix = data[("Close", "^VIX")]
-        else:
-            vix = data["Close"]
+        vix = data["Close"]
 
         # Ensure it's a Series and set name
         vix = pd.Series(vix, index=vix.index, name="VIX")
@@ -41,15 +39,11 @@ def load_vix(start: str = "2015-01-01") -> pd.Series:
 def load_spy_vol(start: str = "2015-01-01", window: int = 21) -> pd.Series:
     """Rolling stdev of SPY returns, annualised."""
     try:
-        data = yf.download("SPY", start=start)
+        data = get_provider().fetch("SPY", start, None)
         if data is None or data.empty:
             raise ValueError("SPY data is empty")
 
-        # Handle multi-level columns from yfinance
-        if isinstance(data.columns, pd.MultiIndex):
-            spy = data[("Close", "SPY")]
-        else:
-            spy = data["Close"]
+        spy = data["Close"]
 
         # Ensure it's a Series
         spy = pd.Series(spy, index=spy.index)
@@ -91,16 +85,30 @@ def load_spy_vol_cached(
     return vol
 
 
-def compute_regime(vix: pd.Series, spy_vol: pd.Series) -> pd.Series:
+def compute_regime(
+    vix: pd.Series,
+    spy_vol: pd.Series,
+    causal: bool = False,
+    window: int | None = None,
+) -> pd.Series:
     """
     Regime:
       calm        – VIX < 33rd pct & SPY_vol < 33rd pct
       turbulent   – VIX > 66th pct | SPY_vol > 66th pct
       normal      – otherwise
+
+    By default percentiles are ranked over the whole sample, which looks
+    ahead. ``causal=True`` ranks each day against the days up to it only
+    (expanding, or the trailing *window* days; "normal" until a window fills).
     """
     joined = pd.concat([vix, spy_vol], axis=1).dropna()
-    vix_pctl = joined["VIX"].rank(pct=True)
-    vol_pctl = joined["SPY_vol"].rank(pct=True)
+    if causal or window is not None:
+        ranks = pct_rank(joined[["VIX", "SPY_vol"]].to_numpy(), window)
+        vix_pctl = pd.Series(ranks[:, 0], index=joined.index)
+        vol_pctl = pd.Series(ranks[:, 1], index=joined.index)
+    else:
+        vix_pctl = joined["VIX"].rank(pct=True)
+        vol_pctl = joined["SPY_vol"].rank(pct=True)
 
     regime = pd.Series("normal", index=joined.index)
     regime[(vix_pctl < 0.33) & (vol_pctl < 0.33)] = "calm"
@@ -0,0 +1,593 @@
+# File: src/tradingbot/kernels.py
+"""Optional Numba-compiled kernels for hot rolling and path-dependent loops.
+
+Each kernel has two implementations with identical arithmetic:
+
+* ``kernel.py_func`` - a plain scalar loop, compiled with ``numba.njit`` on
+  first call when numba is installed;
+* ``kernel.numpy`` - a NumPy version, used when numba is missing or disabled
+  with ``TRADINGBOT_NUMBA=0``.
+
+Calling the kernel picks the compiled loop if it can, else the NumPy path.
+Sums are accumulated left to right in both (``np.cumsum`` rather than the
+pairwise ``np.sum``), so the two paths return bit-identical results.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+__all__ = [
+    "numba_available",
+    "Kernel",
+    "rolling_zscore",
+    "mr_hold_signal",
+    "equal_weight_long_only",
+    "atr_stop_backtest",
+    "atr_stop_events",
+    "percentile_rank",
+]
+
+
+@lru_cache(maxsize=1)
+def _numba():
+    if os.getenv("TRADINGBOT_NUMBA", "1").lower() in ("0", "off", "false"):
+        return None
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba
+
+
+def numba_available() -> bool:
+    """True if kernels run compiled (numba importable and not disabled)."""
+    return _numba() is not None
+
+
+class Kernel:
+    """A scalar loop (JIT-compiled when possible) with a NumPy fallback."""
+
+    def __init__(self, loop: Callable, vectorised: Callable):
+        self.py_func = loop
+        self.numpy = vectorised
+        self.__doc__ = vectorised.__doc__
+        self._jit = None
+
+    @property
+    def jit(self) -> Callable | None:
+        """The compiled loop, or ``None`` without numba."""
+        if self._jit is None and _numba() is not None:
+            njit = _numba().njit(cache=True, error_model="numpy")
+            self._jit = njit(self.py_func)
+        return self._jit
+
+    def __call__(self, *args):
+        return (self.jit or self.numpy)(*args)
+
+
+def _kernel(vectorised: Callable) -> Callable[[Callable], Kernel]:
+    return lambda loop: Kernel(loop, vectorised)
+
+
+# ---------------------------------------------------------------------------
+# Rolling z-score
+# ---------------------------------------------------------------------------
+
+# Upper bound on the (rows x cols x window) scratch space of one block
+_BLOCK_ELEMS = 1 << 22
+
+
+def _rolling_zscore_numpy(x: np.ndarray, window: int) -> np.ndarray:
+    """``(x - rolling_mean) / rolling_std`` (sample std) down each column.
+
+    Windows with NaN, and flat windows (std 0), give NaN.
+    """
+    n_rows, n_cols = x.shape
+    out = np.full(x.shape, np.nan)
+    if n_rows < window:
+        return out
+    step = max(1, _BLOCK_ELEMS // max(1, (n_rows - window + 1) * window))
+    for j in range(0, n_cols, step):
+        blk = sliding_window_view(x[:, j : j + step], window, axis=0)
+        mean = np.cumsum(blk, axis=-1)[..., -1] / window
+        dev = blk - mean[..., None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std = np.sqrt(np.cumsum(dev * dev, axis=-1)[..., -1] / (window - 1))
+            std[blk.max(axis=-1) == blk.min(axis=-1)] = np.nan
+            out[window - 1 :, j : j + step] = (
+                x[window - 1 :, j : j + step] - mean
+            ) / std
+    return out
+
+
+@_kernel(_rolling_zscore_numpy)
+def rolling_zscore(x, window):
+    n_rows, n_cols = x.shape
+    out = np.full(x.shape, np.nan)
+    for j in range(n_cols):
+        for t in range(window - 1, n_rows):
+            s = 0.0
+            flat = True
+            for k in range(t - window + 1, t + 1):
+                s += x[k, j]
+                flat = flat and x[k, j] == x[t, j]
+            mean = s / window
+            ss = 0.0
+            for k in range(t - window + 1, t + 1):
+                d = x[k, j] - mean
+                ss += d * d
+            if flat or window < 2:
+                continue
+            out[t, j] = (x[t, j] - mean) / np.sqrt(ss / (window - 1))
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Mean-reversion enter/exit state machine
+# ---------------------------------------------------------------------------
+
+
+def _mr_hold_numpy(z: np.ndarray, enter: float, exit_: float) -> np.ndarray:
+    """Long from ``z < enter`` until ``z > exit_``; NaN z keeps the state.
+
+    Needs ``enter <= exit_`` so that no bar is both an entry and an exit.
+    """
+    event = np.where(z < enter, 1.0, np.where(z > exit_, 0.0, np.nan))
+    idx = np.where(np.isnan(event), 0, np.arange(1, len(z) + 1)[:, None])
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    padded = np.vstack([np.zeros((1, z.shape[1])), event])
+    return padded[idx, np.arange(z.shape[1])].astype(np.int8)
+
+
+@_kernel(_mr_hold_numpy)
+def mr_hold_signal(z, enter, exit_):
+    n_rows, n_cols = z.shape
+    out = np.zeros(z.shape, dtype=np.int8)
+    for j in range(n_cols):
+        state = 0
+        for t in range(n_rows):
+            if state == 0 and z[t, j] < enter:
+                state = 1
+            elif state == 1 and z[t, j] > exit_:
+                state = 0
+            out[t, j] = state
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Equal-weight long-only simulator
+# ---------------------------------------------------------------------------
+
+
+def _equal_weight_numpy(close: np.ndarray, sig: np.ndarray):
+    """Daily return and growth of an equal-weight book of the longs.
+
+    A ticker counts on day ``t`` if ``sig[t-1] > 0`` and both closes exist.
+    Returns ``(daily_ret, growth)`` with ``growth = cumprod(1 + daily_ret)``.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rets = close[1:] / close[:-1] - 1.0
+    held = (sig[:-1] > 0) & np.isfinite(rets)
+    n_held = held.sum(axis=1)
+    total = np.cumsum(np.where(held, rets, 0.0), axis=1)[:, -1] if len(rets) else rets
+    daily = np.zeros(len(close))
+    if len(rets):
+        np.divide(total, n_held, out=daily[1:], where=n_held > 0)
+    return daily, np.cumprod(1.0 + daily)
+
+
+@_kernel(_equal_weight_numpy)
+def equal_weight_long_only(close, sig):
+    n_rows, n_cols = close.shape
+    daily = np.zeros(n_rows)
+    growth = np.ones(n_rows)
+    g = 1.0
+    for t in range(n_rows):
+        if t > 0:
+            total = 0.0
+            n = 0
+            for j in range(n_cols):
+                r = close[t, j] / close[t - 1, j] - 1.0
+                if sig[t - 1, j] > 0 and np.isfinite(r):
+                    total += r
+                    n += 1
+            if n > 0:
+                daily[t] = total / n
+        g *= 1.0 + daily[t]
+        growth[t] = g
+    return daily, growth
+
+
+# ---------------------------------------------------------------------------
+# ATR-sized trailing-stop simulation
+# ---------------------------------------------------------------------------
+# Fill rows: ticker column, entry position, exit position, entry price,
+# exit price, quantity.
+
+
+def _atr_stop_numpy(
+    close, atr, valid, mark, sig, entry_order, risk, start_equity, stop_mult
+):
+    """Day loop of :func:`tradingbot.strategy.runner.backtest_with_atr`.
+
+    All inputs are ``(days, tickers)`` arrays on one calendar; *risk* is the
+    per-day risk fraction, *entry_order* the ticker columns in the order
+    entries are funded. Returns ``(equity, fills)``.
+    """
+    n_days, n_tick = close.shape
+    equity = np.full(n_days, float(start_equity))
+    cash = float(start_equity)
+    qty = np.zeros(n_tick, dtype=np.int64)
+    entry_price = np.full(n_tick, np.nan)
+    entry_pos = np.full(n_tick, -1, dtype=np.int64)
+    fills = []
+
+    for i in range(1, n_days):
+        # 1) trailing-stop exits, only on days the ticker has a bar
+        held = qty != 0
+        if held.any():
+            px, band = close[i], stop_mult * atr[i]
+            with np.errstate(invalid="ignore"):
+                hit = (
+                    held
+                    & valid[i]
+                    & np.isfinite(band)
+                    & (
+                        ((qty > 0) & (px < entry_price - band))
+                        | ((qty < 0) & (px > entry_price + band))
+                    )
+                )
+            for j in np.flatnonzero(hit):
+                fills.append((j, entry_pos[j], i, entry_price[j], px[j], qty[j]))
+                cash += qty[j] * px[j]
+                qty[j] = 0
+                entry_price[j] = np.nan
+                entry_pos[j] = -1
+
+        # 2) entries from the previous day's signals
+        sig_prev = sig[i - 1, entry_order]
+        for j in entry_order[(sig_prev != 0) & (qty[entry_order] == 0)]:
+            atr_prev = atr[i - 1, j]
+            if not valid[i - 1, j] or not np.isfinite(atr_prev):
+                continue
+            base_qty = 0
+            if atr_prev > 0 and equity[i - 1] > 0:
+                base_qty = max(int(equity[i - 1] * risk[i - 1] / (2.0 * atr_prev)), 0)
+            q = int(base_qty * sig[i - 1, j])
+            if q == 0:
+                continue
+            price_prev = close[i - 1, j]
+            cost = abs(q) * price_prev
+            if cost <= cash or q < 0:  # allow proceeds to fund shorts
+                cash += cost if q < 0 else -cost
+                qty[j] = q
+                entry_price[j] = price_prev
+                entry_pos[j] = i - 1
+
+        # 3) mark to market
+        held = np.flatnonzero(qty)
+        total = np.cumsum(qty[held] * mark[i, held])[-1] if len(held) else 0.0
+        equity[i] = cash + total
+
+    if n_days:
+        for j in np.flatnonzero(qty):
+            fills.append(
+                (j, entry_pos[j], n_days - 1, entry_price[j], mark[-1, j], qty[j])
+            )
+    return equity, np.array(fills, dtype=np.float64).reshape(-1, 6)
+
+
+@_kernel(_atr_stop_numpy)
+def atr_stop_backtest(
+    close, atr, valid, mark, sig, entry_order, risk, start_equity, stop_mult
+):
+    n_days, n_tick = close.shape
+    equity = np.full(n_days, float(start_equity))
+    cash = float(start_equity)
+    qty = np.zeros(n_tick, dtype=np.int64)
+    entry_price = np.full(n_tick, np.nan)
+    entry_pos = np.full(n_tick, -1, dtype=np.int64)
+    # Every fill closes one entry, and every entry needs a non-zero signal
+    fills = np.empty((np.count_nonzero(sig) + n_tick, 6))
+    n_fills = 0
+
+    for i in range(1, n_days):
+        for j in range(n_tick):
+            q = qty[j]
+            if q == 0 or not valid[i, j]:
+                continue
+            band = stop_mult * atr[i, j]
+            if not np.isfinite(band):
+                continue
+            px = close[i, j]
+            if (q > 0 and px < entry_price[j] - band) or (
+                q < 0 and px > entry_price[j] + band
+            ):
+                fills[n_fills, 0], fills[n_fills, 1] = j, entry_pos[j]
+                fills[n_fills, 2], fills[n_fills, 3] = i, entry_price[j]
+                fills[n_fills, 4], fills[n_fills, 5] = px, q
+                n_fills += 1
+                cash += q * px
+                qty[j] = 0
+                entry_price[j] = np.nan
+                entry_pos[j] = -1
+
+        for k in range(len(entry_order)):
+            j = entry_order[k]
+            s = sig[i - 1, j]
+            if s == 0 or qty[j] != 0:
+                continue
+            atr_prev = atr[i - 1, j]
+            if not valid[i - 1, j] or not np.isfinite(atr_prev):
+                continue
+            base_qty = 0
+            if atr_prev > 0 and equity[i - 1] > 0:
+                base_qty = max(int(equity[i - 1] * risk[i - 1] / (2.0 * atr_prev)), 0)
+            q = int(base_qty * s)
+            if q == 0:
+                continue
+            price_prev = close[i - 1, j]
+            cost = abs(q) * price_prev
+            if cost <= cash or q < 0:
+                if q < 0:
+                    cash += cost
+                else:
+                    cash -= cost
+                qty[j] = q
+                entry_price[j] = price_prev
+                entry_pos[j] = i - 1
+
+        total = 0.0
+        for j in range(n_tick):
+            if qty[j] != 0:
+                total += qty[j] * mark[i, j]
+        equity[i] = cash + total
+
+    if n_days:
+        for j in range(n_tick):
+            if qty[j] != 0:
+                fills[n_fills, 0], fills[n_fills, 1] = j, entry_pos[j]
+                fills[n_fills, 2], fills[n_fills, 3] = n_days - 1, entry_price[j]
+                fills[n_fills, 4], fills[n_fills, 5] = mark[-1, j], qty[j]
+                n_fills += 1
+    return equity, fills[:n_fills]
+
+
+def _events_to_dense(n_days, n_tick, ev_day, ev_tick, ev_val):
+    """``(days, tickers)`` signal matrix from day-major change events."""
+    sig = np.zeros((n_days, n_tick))
+    order = np.lexsort((ev_day, ev_tick))
+    day, tick, val = ev_day[order], ev_tick[order], ev_val[order]
+    for j in np.unique(tick):
+        rows = np.flatnonzero(tick == j)
+        bounds = np.append(day[rows], n_days)
+        sig[bounds[0] :, j] = np.repeat(val[rows], np.diff(bounds))
+    return sig
+
+
+def _atr_stop_events_numpy(
+    close, atr, valid, mark, ev_day, ev_tick, ev_val, entry_order, risk, *rest
+):
+    """:func:`atr_stop_backtest` with the signals given as change events.
+
+    ``(ev_day[k], ev_tick[k], ev_val[k])`` sets the signal of column
+    ``ev_tick[k]`` to ``ev_val[k]`` from day ``ev_day[k]`` on (all signals
+    start at 0); events are sorted by day. The compiled loop keeps the
+    non-zero signals and the open positions in two sorted lists, so a day
+    costs its events plus its active tickers rather than the universe. The
+    NumPy path expands the events and runs the dense simulation.
+    """
+    sig = _events_to_dense(len(close), close.shape[1], ev_day, ev_tick, ev_val)
+    return _atr_stop_numpy(close, atr, valid, mark, sig, entry_order, risk, *rest)
+
+
+@_kernel(_atr_stop_events_numpy)
+def atr_stop_events(
+    close,
+    atr,
+    valid,
+    mark,
+    ev_day,
+    ev_tick,
+    ev_val,
+    entry_order,
+    risk,
+    start_equity,
+    stop_mult,
+):
+    n_days, n_tick = close.shape
+    equity = np.full(n_days, float(start_equity))
+    cash = float(start_equity)
+    qty = np.zeros(n_tick, dtype=np.int64)
+    entry_price = np.full(n_tick, np.nan)
+    entry_pos = np.full(n_tick, -1, dtype=np.int64)
+    cur = np.zeros(n_tick)
+    rank = np.full(n_tick, -1, dtype=np.int64)
+    for k in range(len(entry_order)):
+        rank[entry_order[k]] = k
+    active = np.empty(len(entry_order), dtype=np.int64)  # ranks, ascending
+    n_active = 0
+    held = np.empty(n_tick, dtype=np.int64)  # columns, ascending
+    n_held = 0
+    fills = np.empty((n_tick + 16, 6))
+    n_fills = 0
+    e = 0
+
+    for i in range(1, n_days):
+        # signals in force on day i - 1
+        while e < len(ev_day) and ev_day[e] < i:
+            j, v = ev_tick[e], ev_val[e]
+            e += 1
+            r = rank[j]
+            if r < 0 or (cur[j] != 0) == (v != 0):
+                cur[j] = v
+                continue
+            cur[j] = v
+            k = 0
+            while k < n_active and active[k] < r:
+                k += 1
+            if v != 0:
+                active[k + 1 : n_active + 1] = active[k:n_active].copy()
+                active[k] = r
+                n_active += 1
+            else:
+                active[k : n_active - 1] = active[k + 1 : n_active].copy()
+                n_active -= 1
+
+        if n_fills + n_held > len(fills):
+            grown = np.empty((2 * (n_fills + n_held), 6))
+            grown[:n_fills] = fills[:n_fills]
+            fills = grown
+        k = 0
+        while k < n_held:
+            j = held[k]
+            q = qty[j]
+            band = stop_mult * atr[i, j]
+            px = close[i, j]
+            if (
+                valid[i, j]
+                and np.isfinite(band)
+                and (
+                    (q > 0 and px < entry_price[j] - band)
+                    or (q < 0 and px > entry_price[j] + band)
+                )
+            ):
+                fills[n_fills, 0], fills[n_fills, 1] = j, entry_pos[j]
+                fills[n_fills, 2], fills[n_fills, 3] = i, entry_price[j]
+                fills[n_fills, 4], fills[n_fills, 5] = px, q
+                n_fills += 1
+                cash += q * px
+                qty[j] = 0
+                entry_price[j] = np.nan
+                entry_pos[j] = -1
+                held[k : n_held - 1] = held[k + 1 : n_held].copy()
+                n_held -= 1
+            else:
+                k += 1
+
+        for a in range(n_active):
+            j = entry_order[active[a]]
+            if qty[j] != 0:
+                continue
+            atr_prev = atr[i - 1, j]
+            if not valid[i - 1, j] or not np.isfinite(atr_prev):
+                continue
+            base_qty = 0
+            if atr_prev > 0 and equity[i - 1] > 0:
+                base_qty = max(int(equity[i - 1] * risk[i - 1] / (2.0 * atr_prev)), 0)
+            q = int(base_qty * cur[j])
+            if q == 0:
+                continue
+            price_prev = close[i - 1, j]
+            cost = abs(q) * price_prev
+            if cost <= cash or q < 0:
+                if q < 0:
+                    cash += cost
+                else:
+                    cash -= cost
+                qty[j] = q
+                entry_price[j] = price_prev
+                entry_pos[j] = i - 1
+                k = 0
+                while k < n_held and held[k] < j:
+                    k += 1
+                held[k + 1 : n_held + 1] = held[k:n_held].copy()
+                held[k] = j
+                n_held += 1
+
+        total = 0.0
+        for k in range(n_held):
+            j = held[k]
+            total += qty[j] * mark[i, j]
+        equity[i] = cash + total
+
+    if n_days:
+        if n_fills + n_held > len(fills):
+            grown = np.empty((n_fills + n_held, 6))
+            grown[:n_fills] = fills[:n_fills]
+            fills = grown
+        for k in range(n_held):
+            j = held[k]
+            fills[n_fills, 0], fills[n_fills, 1] = j, entry_pos[j]
+            fills[n_fills, 2], fills[n_fills, 3] = n_days - 1, entry_price[j]
+            fills[n_fills, 4], fills[n_fills, 5] = mark[-1, j], qty[j]
+            n_fills += 1
+    return equity, fills[:n_fills]
+
+
+# ---------------------------------------------------------------------------
+# Expanding / rolling percentile rank
+# ---------------------------------------------------------------------------
+# Values arrive as dense codes 1..n_codes (0 = NaN) so the loop can keep
+# counts in a Fenwick tree: O(log n) per day instead of re-ranking history.
+
+
+def _percentile_rank_numpy(codes, n_codes, window, min_periods):
+    """Percentile rank of each value among the values seen so far.
+
+    Matches ``expanding().rank(pct=True)`` (``window`` 0) or
+    ``rolling(window).rank(pct=True)``: ties take their average rank, NaN
+    codes read NaN, as do days with fewer than *min_periods* valid values.
+    """
+    n = len(codes)
+    out = np.full(n, np.nan)
+    step = max(1, _BLOCK_ELEMS // max(1, window if window else n))
+    for a in range(0, n, step):
+        b = min(a + step, n)
+        lo = max(0, a - window + 1) if window else 0
+        t = np.arange(a, b)[:, None]
+        j = np.arange(lo, b)[None, :]
+        seen = (j <= t) & (codes[lo:b] > 0)
+        if window:
+            seen &= j > t - window
+        ct = codes[a:b, None]
+        less = np.count_nonzero(seen & (codes[lo:b] < ct), axis=1)
+        eq = np.count_nonzero(seen & (codes[lo:b] == ct), axis=1)
+        count = np.count_nonzero(seen, axis=1)
+        ok = (codes[a:b] > 0) & (count >= min_periods)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rank = (less + (eq + 1) / 2) / count
+        out[a:b] = np.where(ok, rank, np.nan)
+    return out
+
+
+@_kernel(_percentile_rank_numpy)
+def percentile_rank(codes, n_codes, window, min_periods):
+    n = len(codes)
+    out = np.full(n, np.nan)
+    tree = np.zeros(n_codes + 1, dtype=np.int64)
+    count = 0
+    for t in range(n):
+        c = codes[t]
+        if c > 0:
+            i = c
+            while i <= n_codes:
+                tree[i] += 1
+                i += i & -i
+            count += 1
+        if window and t >= window and codes[t - window] > 0:
+            i = codes[t - window]
+            while i <= n_codes:
+                tree[i] -= 1
+                i += i & -i
+            count -= 1
+        if c == 0 or count < min_periods:
+            continue
+        less = 0
+        i = c - 1
+        while i > 0:
+            less += tree[i]
+            i -= i & -i
+        upto = 0
+        i = c
+        while i > 0:
+            upto += tree[i]
+            i -= i & -i
+        out[t] = (less + (upto - less + 1) / 2) / count
+    return out
@@ -2,12 +2,16 @@
 
 import pandas as pd
 
+from tradingbot.features import panel_features
+from tradingbot.features.store import cached_feature
+
 __all__ = [
     "calc_atr",
     "position_size",
 ]
 
 
+@cached_feature("atr", columns=["High", "Low", "Close"], version=2)
 def calc_atr(df: pd.DataFrame, window: int = 14) -> pd.Series:
     """Calculate the Average True Range (ATR).
 
@@ -18,19 +22,13 @@ def calc_atr(df: pd.DataFrame, window: int = 14) -> pd.Series:
     window : int, default 14
         Rolling window length.
     """
-    high = df["High"]
-    low = df["Low"]
-    close = df["Close"]
-
-    prev_close = close.shift()
-
-    tr1 = high - low
-    tr2 = (high - prev_close).abs()
-    tr3 = (low - prev_close).abs()
-
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = tr.rolling(window).mean().bfill()
-    return atr
+    atr = panel_features.atr(
+        df["High"].to_numpy(dtype=float),
+        df["Low"].to_numpy(dtype=float),
+        df["Close"].to_numpy(dtype=float),
+        window,
+    )
+    return pd.Series(atr[:, 0], index=df.index)
 
 
 def position_size(equity: float, atr: float, risk_pct: float = 0.003) -> int:
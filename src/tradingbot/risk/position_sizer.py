@@ -22,3 +22,19 @@ def atr_position_size(
     max_shares = init_equity * kelly_frac / df["Close"]
     shares = np.minimum(shares, max_shares)
     return shares.fillna(0).round().astype(int)
+
+
+def atr_position_size_at(
+    close: float,
+    atr: float,
+    risk_per_trade: float = 0.01,
+    kelly_frac: float = 0.25,
+    init_equity: float = 1_000_000,
+) -> int:
+    """:func:`atr_position_size` for a single bar, e.g. from a streamed ATR."""
+    if not atr > 0:  # zero or NaN
+        return 0
+    shares = np.minimum(
+        risk_per_trade * init_equity / (2 * atr), init_equity * kelly_frac / close
+    )
+    return 0 if np.isnan(shares) else int(np.round(shares))
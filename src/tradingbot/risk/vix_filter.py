@@ -1,4 +1,6 @@
 from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from tradingbot.data.market_benchmarks import get_vix_series
 
@@ -54,3 +56,18 @@ def throttle_risk_pct(base_risk: float, date, vix_series=None) -> float:
     except Exception:
         # Fallback to base risk if VIX data unavailable
         return base_risk
+
+
+def throttle_risk_series(base_risk: float, dates, vix_series=None) -> np.ndarray:
+    """:func:`throttle_risk_pct` for every date in *dates*, loading VIX once."""
+    dates = pd.DatetimeIndex(dates)
+    try:
+        vix_data = cached_vix_series() if vix_series is None else vix_series
+        vix_val = vix_data.asof(dates).to_numpy(dtype=float)
+    except Exception:
+        return np.full(len(dates), float(base_risk))
+    return np.select(
+        [vix_val > 30, vix_val > 20],
+        [base_risk * 0.5, base_risk * 0.75],
+        default=base_risk,
+    )
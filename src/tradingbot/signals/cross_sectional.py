@@ -1,12 +1,22 @@
-from typing import Dict
+from dataclasses import dataclass
+from typing import Dict, Sequence
 
+import numpy as np
 import pandas as pd
 
+from tradingbot.data.panel import PricePanel
+from tradingbot.features.panel_features import trailing_return
+
 __all__ = [
     "rank_top_n_df",
     "compute_return_matrix",
+    "TopNSelection",
+    "select_top_n",
 ]
 
+# Upper bound on the (rows × tickers) scratch arrays of one selection block
+_BLOCK_ELEMS = 1 << 22
+
 
 def rank_top_n_df(
     metric_df: pd.DataFrame, n: int, highest: bool = True
@@ -41,13 +51,117 @@ def universe_momentum_ok(metric_df: pd.DataFrame) -> pd.Series:
 
 
 def compute_return_matrix(
-    price_data: Dict[str, pd.DataFrame], window: int = 60
+    price_data: Dict[str, pd.DataFrame] | PricePanel,
+    window: int = 60,
+    fill_value: float | None = 0.0,
 ) -> pd.DataFrame:
-    """Compute trailing return matrix for each ticker over *window* days."""
-    returns = {}
-    for ticker, df in price_data.items():
-        if "Close" not in df.columns:
-            raise KeyError(f"Data for {ticker} missing 'Close' column")
-        close = df["Close"]
-        returns[ticker] = close.pct_change(window)
-    return pd.DataFrame(returns).fillna(0.0)
+    """Compute trailing return matrix for each ticker over *window* days.
+
+    Dates without a full window (warm-up, not yet listed) are filled with
+    *fill_value*; pass ``None`` to keep them NaN, which :func:`select_top_n`
+    never selects.
+    """
+    if isinstance(price_data, PricePanel):
+        close = price_data.frame("Close")
+        returns = close.pct_change(window, fill_method=None)
+    else:
+        for ticker, df in price_data.items():
+            if "Close" not in df.columns:
+                raise KeyError(f"Data for {ticker} missing 'Close' column")
+        frames = list(price_data.values())
+        if frames and all(df.index.equals(frames[0].index) for df in frames[1:]):
+            # One calendar: a single array pass instead of a Series per ticker
+            close = np.column_stack(
+                [df["Close"].to_numpy(dtype=float) for df in frames]
+            )
+            return pd.DataFrame(
+                trailing_return(close, window, fill_value),
+                index=frames[0].index,
+                columns=list(price_data),
+            )
+        returns = pd.DataFrame(
+            {t: df["Close"].pct_change(window) for t, df in price_data.items()}
+        )
+    return returns if fill_value is None else returns.fillna(fill_value)
+
+
+@dataclass
+class TopNSelection:
+    """Selected tickers per date in compressed-row (CSR) form.
+
+    The ticker ids chosen on date ``t`` are
+    ``indices[indptr[t]:indptr[t + 1]]``, in ascending order.
+    """
+
+    dates: pd.Index
+    tickers: list[str]
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    def pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        """``(date_ids, ticker_ids)`` of every selection."""
+        rows = np.repeat(np.arange(len(self.dates)), np.diff(self.indptr))
+        return rows, self.indices
+
+    def to_dense(self) -> pd.DataFrame:
+        """0/1 ``dates × tickers`` frame, as returned by ``rank_top_n_df``."""
+        dense = np.zeros((len(self.dates), len(self.tickers)), dtype=int)
+        dense[self.pairs()] = 1
+        return pd.DataFrame(dense, index=self.dates, columns=self.tickers)
+
+    def to_csr(self):
+        """``scipy.sparse.csr_matrix`` of the selection (needs scipy)."""
+        from scipy import sparse
+
+        data = np.ones(len(self.indices), dtype=np.int8)
+        shape = (len(self.dates), len(self.tickers))
+        return sparse.csr_matrix((data, self.indices, self.indptr), shape=shape)
+
+
+def select_top_n(
+    metric: pd.DataFrame | np.ndarray,
+    n: int,
+    highest: bool = True,
+    dates: pd.Index | None = None,
+    tickers: Sequence[str] | None = None,
+) -> TopNSelection:
+    """Exactly ``min(n, available)`` tickers per date, best *metric* first.
+
+    Candidates are found with ``np.argpartition`` in O(tickers) per date.
+    Ties at the cut-off go to the lowest ticker ids, so the result is
+    deterministic, and NaN metrics are never selected. *dates* and
+    *tickers* default to the frame's index and columns.
+    """
+    if n <= 0:
+        raise ValueError("n must be positive")
+    if isinstance(metric, pd.DataFrame):
+        dates = metric.index if dates is None else dates
+        tickers = list(metric.columns) if tickers is None else tickers
+        metric = metric.to_numpy(dtype=float)
+    metric = np.asarray(metric, dtype=float)
+    n_rows, n_cols = metric.shape
+    dates = pd.RangeIndex(n_rows) if dates is None else dates
+    tickers = list(range(n_cols)) if tickers is None else list(tickers)
+
+    k = min(n, n_cols)
+    counts = np.zeros(n_rows, dtype=np.int64)
+    chunks = []
+    step = max(1, _BLOCK_ELEMS // max(1, n_cols))
+    for a in range(0, n_rows if k else 0, step):
+        m = metric[a : a + step]
+        missing = np.isnan(m)
+        key = np.where(missing, np.inf, -m if highest else m)
+        part = np.argpartition(key, k - 1, axis=1)[:, k - 1 : k]
+        cut = np.take_along_axis(key, part, axis=1)
+        better = key < cut
+        tie = key == cut
+        need = k - better.sum(axis=1, keepdims=True)
+        chosen = (better | (tie & (np.cumsum(tie, axis=1) <= need))) & ~missing
+        rows, cols = np.nonzero(chosen)
+        counts[a : a + step] = np.bincount(rows, minlength=len(m))
+        chunks.append(cols.astype(np.int32))
+
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    indices = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int32)
+    return TopNSelection(dates, tickers, indptr, indices)
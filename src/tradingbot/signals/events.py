@@ -0,0 +1,166 @@
+# File: src/tradingbot/signals/events.py
+"""Run-length (change event) encoding of position signals.
+
+A dense signal Series repeats its value every day although it changes only
+on a handful of them. :class:`SignalEvents` keeps just the changes: the
+sorted positions where the value differs from the day before (the value
+before the first day counts as 0) and the new value at each. Memory is
+proportional to the number of trades, not the length of the calendar, and
+consumers walk the events instead of the days:
+
+* :meth:`SignalEvents.transitions` gives the up and down moves that
+  ``run_backtest`` turns into vectorbt entries and exits;
+* :func:`day_major` lays a whole universe out as one day-sorted event list
+  for :func:`tradingbot.kernels.atr_stop_events`.
+
+>>> s = pd.Series([0, 1, 1, 1, 0, 0], index=pd.bdate_range("2024-01-01", periods=6))
+>>> ev = SignalEvents.from_dense(s)
+>>> ev.positions.tolist(), ev.values.tolist()
+([1, 4], [1, 0])
+>>> ev.to_dense().equals(s)
+True
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Hashable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "SignalEvents",
+    "as_events",
+    "encode_signals",
+    "decode_signals",
+    "day_major",
+]
+
+
+@dataclass(frozen=True)
+class SignalEvents:
+    """Change events of one signal on *index*.
+
+    Attributes
+    ----------
+    index : pd.Index
+        Calendar of the dense signal (shared, not copied).
+    positions : np.ndarray
+        Strictly increasing int64 positions in *index* where the value changes.
+    values : np.ndarray
+        Value from each position until the next one.
+    name : hashable, optional
+        Name of the dense Series (usually the ticker).
+    """
+
+    index: pd.Index
+    positions: np.ndarray
+    values: np.ndarray
+    name: Hashable = None
+
+    @classmethod
+    def from_dense(cls, signal: pd.Series) -> SignalEvents:
+        """Encode a dense Series (NaN is kept as a value of its own)."""
+        dense = signal.to_numpy()
+        changed = np.empty(len(dense), dtype=bool)
+        if len(dense):
+            changed[0] = dense[0] != 0
+            np.not_equal(dense[1:], dense[:-1], out=changed[1:])
+            if dense.dtype.kind == "f":  # a NaN run is one event, not one a day
+                nan = np.isnan(dense)
+                changed[1:] &= ~(nan[1:] & nan[:-1])
+        positions = np.flatnonzero(changed)
+        return cls(signal.index, positions, dense[positions], signal.name)
+
+    def to_dense(self) -> pd.Series:
+        """The dense Series this encodes."""
+        dense = np.zeros(len(self.index), dtype=self.values.dtype)
+        if len(self.positions):
+            bounds = np.append(self.positions, len(self.index))
+            dense[bounds[0] :] = np.repeat(self.values, np.diff(bounds))
+        return pd.Series(dense, index=self.index, name=self.name)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def value_at(self, pos: int) -> float:
+        """Signal value at position *pos* of the index."""
+        k = np.searchsorted(self.positions, pos, side="right") - 1
+        return self.values[k] if k >= 0 else self.values.dtype.type(0)
+
+    def transitions(self) -> tuple[np.ndarray, np.ndarray]:
+        """Positions where the signal rises and where it falls.
+
+        Same as ``signal.diff() > 0`` and ``signal.diff() < 0``: the first
+        day has no previous value and is never a transition, nor is a move
+        into or out of NaN.
+        """
+        prev = np.concatenate([[0], self.values[:-1]])
+        keep = self.positions > 0
+        step = (self.values - prev)[keep]
+        return self.positions[keep][step > 0], self.positions[keep][step < 0]
+
+    def reindex(self, index: pd.Index) -> SignalEvents:
+        """Events on another calendar (dates the signal lacks count as 0).
+
+        Like the dense ``signal.reindex(index).fillna(0)``, NaN values become
+        0 too, unless *index* is the signal's own.
+        """
+        if self.index.equals(index):
+            return self
+        dense = self.to_dense()
+        dense = dense[~dense.index.duplicated(keep="last")]
+        return SignalEvents.from_dense(dense.reindex(index, fill_value=0).fillna(0))
+
+
+def as_events(signal: pd.Series | SignalEvents) -> SignalEvents:
+    """*signal* as :class:`SignalEvents`, encoding dense Series."""
+    if isinstance(signal, SignalEvents):
+        return signal
+    return SignalEvents.from_dense(signal)
+
+
+def encode_signals(
+    signals: Mapping[str, pd.Series | SignalEvents],
+) -> dict[str, SignalEvents]:
+    """Encode a ``{ticker: signal}`` mapping."""
+    return {t: as_events(s) for t, s in signals.items()}
+
+
+def decode_signals(
+    signals: Mapping[str, pd.Series | SignalEvents],
+) -> dict[str, pd.Series]:
+    """Dense Series for every ticker of *signals*."""
+    return {
+        t: s.to_dense() if isinstance(s, SignalEvents) else s
+        for t, s in signals.items()
+    }
+
+
+def day_major(
+    signals: Mapping[str, pd.Series | SignalEvents],
+    dates: pd.DatetimeIndex,
+    tickers: Sequence[str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Events of every ticker on *dates*, sorted by day.
+
+    Returns ``(day, column, value)`` arrays, the column being the position of
+    the ticker in *tickers*; tickers outside *tickers* are dropped. Values are
+    float64 with NaN as 0 (flat), and within a day events come in column
+    order.
+    """
+    col = {t: j for j, t in enumerate(tickers)}
+    days, cols, values = [], [], []
+    for t, s in signals.items():
+        if t not in col:
+            continue
+        ev = as_events(s).reindex(dates)
+        days.append(ev.positions)
+        cols.append(np.full(len(ev), col[t], dtype=np.int64))
+        values.append(np.nan_to_num(ev.values.astype(np.float64), nan=0.0))
+    if not days:
+        return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0)
+    day, tick, value = (np.concatenate(x) for x in (days, cols, values))
+    order = np.lexsort((tick, day))
+    return day[order], tick[order], value[order]
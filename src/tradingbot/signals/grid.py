@@ -0,0 +1,79 @@
+# File: src/tradingbot/signals/grid.py
+"""Grid-aware signal generators.
+
+Each generator takes equal-length parameter arrays (one entry per grid
+point, see :func:`expand_grid`) and returns an int8 tensor shaped
+``(params, dates, tickers)``. Features are computed once per distinct
+window, and every threshold for that window is applied in one broadcast
+comparison. Grid point ``p`` equals the single-parameter generator called
+with the parameters of row ``p``.
+"""
+
+from __future__ import annotations
+
+from itertools import product
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from tradingbot.features import panel_features
+
+__all__ = ["expand_grid", "mr_signal_grid", "mom_signal_grid"]
+
+
+def expand_grid(grid: dict[str, Sequence]) -> pd.DataFrame:
+    """Cartesian product of *grid*, one row per point in ``itertools.product`` order."""
+    return pd.DataFrame(list(product(*grid.values())), columns=list(grid))
+
+
+def _distinct(window: Sequence[int]) -> list[int]:
+    return list(dict.fromkeys(np.asarray(window, dtype=np.int64).tolist()))
+
+
+def _by_window(window: Sequence[int], features: np.ndarray, rule) -> np.ndarray:
+    """Stack ``rule(features[k], rows)`` over the points using distinct window k.
+
+    *features* is stacked in :func:`_distinct` order; *rows* comes shaped
+    ``(points, 1, 1)`` so parameter arrays indexed by it broadcast over
+    ``(dates, tickers)``.
+    """
+    window = np.asarray(window, dtype=np.int64)
+    out = np.empty((len(window),) + features.shape[1:], dtype=np.int8)
+    for k, w in enumerate(_distinct(window)):
+        rows = np.flatnonzero(window == w)
+        out[rows] = rule(features[k], rows[:, None, None])
+    return out
+
+
+def mr_signal_grid(
+    close,
+    enter_thresh: Sequence[float],
+    window: Sequence[int],
+    exit_thresh: Sequence[float] | float = 0.0,
+) -> np.ndarray:
+    """``generate_mr_signal`` for every grid point: 1 if z < enter, 0 if z > exit.
+
+    *close* is a ``(dates,)`` or ``(dates, tickers)`` array or Series.
+    """
+    enter = np.asarray(enter_thresh, dtype=float)
+    exit_ = np.broadcast_to(np.asarray(exit_thresh, dtype=float), enter.shape)
+    z = panel_features.rolling_zscore_multi(close, _distinct(window))
+    return _by_window(window, z, lambda f, r: (f < enter[r]) & ~(f > exit_[r]))
+
+
+def mom_signal_grid(
+    close,
+    long_thresh: Sequence[float],
+    window: Sequence[int],
+    use_vol_adjust: bool = False,
+) -> np.ndarray:
+    """``generate_mom_signal`` for every grid point: 1 if momentum > long."""
+    long_ = np.asarray(long_thresh, dtype=float)
+    stack = (
+        panel_features.vol_adj_momentum_multi
+        if use_vol_adjust
+        else panel_features.cumulative_return_multi
+    )
+    mom = stack(close, _distinct(window))
+    return _by_window(window, mom, lambda f, r: f > long_[r])
@@ -1,18 +1,22 @@
 # File: src/tradingbot/signals/mean_reversion.py
 
-from typing import cast
+from typing import Sequence, cast
 
 import pandas as pd
 
+from tradingbot import kernels
+from tradingbot.features import graph
 from tradingbot.features.base_features import compute_rolling_zscore
+from tradingbot.signals.registry import SignalPlugin
 
 
 def generate_mr_signal(
     df: pd.DataFrame,
     enter_thresh: float = -0.5,
     exit_thresh: float = 0.0,
-    window: int = 20,
-) -> pd.Series:
+    window: int | Sequence[int] = 20,
+    hold: bool = False,
+) -> pd.Series | pd.DataFrame:
     """
     Mean-reversion long-only signal:
     +1  when z-score < enter_thresh
@@ -21,15 +25,36 @@ def generate_mr_signal(
         df           : DataFrame with 'Close'
         enter_thresh : enter when z-score below this
         exit_thresh  : flatten when z-score above this
-        window       : rolling window for z-score
+        window       : rolling window for z-score, or a list of windows
+        hold         : keep the long from entry until z-score > exit_thresh
+                       (enter/exit state machine) instead of only while
+                       z-score < enter_thresh
     Returns:
-        pd.Series of {0,1} aligned with df.index
+        pd.Series of {0,1} aligned with df.index; for a list of windows a
+        DataFrame with one column per window
     """
     close_series = cast(pd.Series, df["Close"])
     z = compute_rolling_zscore(close_series, window)
+    return mr_signal_from_zscore(z, enter_thresh, exit_thresh, hold)
+
+
+def mr_signal_from_zscore(
+    z: pd.Series | pd.DataFrame,
+    enter_thresh: float = -0.5,
+    exit_thresh: float = 0.0,
+    hold: bool = False,
+) -> pd.Series | pd.DataFrame:
+    """``generate_mr_signal`` on an already computed z-score."""
+    if hold:
+        if enter_thresh > exit_thresh:
+            raise ValueError("hold=True needs enter_thresh <= exit_thresh")
+        z2 = z.to_numpy(dtype=float).reshape(len(z), -1)
+        pos = kernels.mr_hold_signal(z2, float(enter_thresh), float(exit_thresh))
+        if isinstance(z, pd.Series):
+            return pd.Series(pos[:, 0].astype(int), index=z.index, name=z.name)
+        return pd.DataFrame(pos.astype(int), index=z.index, columns=z.columns)
     signal = (z < enter_thresh).astype(int)  # 1 = long
-    signal[z > exit_thresh] = 0  # flat
-    return signal
+    return signal.mask(z > exit_thresh, 0)  # flat
 
 
 def generate_mr_long_short(
@@ -37,19 +62,34 @@ def generate_mr_long_short(
     long_enter: float = -0.5,
     short_enter: float = 0.5,
     exit_thresh: float = 0.0,
-    window: int = 20,
-) -> pd.Series:
+    window: int | Sequence[int] = 20,
+) -> pd.Series | pd.DataFrame:
     """
     Symmetric long-short MR signal:
      +1 when z < long_enter
      -1 when z > short_enter
       0 when |z| < exit_thresh
+    A list of windows returns one column per window.
     """
     close_series = cast(pd.Series, df["Close"])
     z = compute_rolling_zscore(close_series, window)
-    signal = pd.Series(0, index=df.index)
+    signal = (z < long_enter).astype(int)
+    signal = signal.mask(z > short_enter, -1)
+    return signal.mask(z.abs() < exit_thresh, 0)
+
 
-    signal[z < long_enter] = 1
-    signal[z > short_enter] = -1
-    signal[z.abs() < exit_thresh] = 0
-    return signal
+MEAN_REVERSION = SignalPlugin(
+    name="mean_reversion",
+    params={
+        "window": 20,
+        "enter_thresh": -0.5,
+        "exit_thresh": 0.0,
+        "hold": False,
+        "rank_window": 5,  # trailing return ranked by cross-sectional configs
+    },
+    features=lambda window, **_: {"zscore": graph.rolling_zscore(window)},
+    panel=lambda f, enter_thresh, exit_thresh, hold, **_: mr_signal_from_zscore(
+        f["zscore"], enter_thresh, exit_thresh, hold
+    ),
+    metric=lambda rank_window, **_: (graph.trailing_return(rank_window), False),
+)
@@ -1,33 +1,65 @@
 # File: src/tradingbot/signals/momentum.py
 
+from typing import Sequence
+
 import pandas as pd
 
+from tradingbot.features import graph
 from tradingbot.features.momentum_features import (
     compute_cumulative_return,
     compute_vol_adj_momentum,
 )
+from tradingbot.signals.registry import SignalPlugin
 
 
 def generate_mom_signal(
     df: pd.DataFrame,
-    window: int = 21,
+    window: int | Sequence[int] = 21,
     long_thresh: float = 0.01,
     short_thresh: float = -0.01,
     use_vol_adjust: bool = False,
-) -> pd.Series:
+) -> pd.Series | pd.DataFrame:
     """
     Momentum signal (long-only):
       +1  if momentum > long_thresh
        0  otherwise
+    A list of windows returns one column per window.
     """
     mom = (
         compute_vol_adj_momentum(df, window)
         if use_vol_adjust
         else compute_cumulative_return(df, window)
     )
+    return mom_signal_from_feature(mom, long_thresh)
+
 
-    signal = pd.Series(0, index=df.index)
-    signal[mom > long_thresh] = 1
+def mom_signal_from_feature(
+    mom: pd.Series | pd.DataFrame, long_thresh: float = 0.01
+) -> pd.Series | pd.DataFrame:
+    """Threshold an already computed momentum feature (see above)."""
+    signal = (mom > long_thresh).astype(int)
     # Remove short signals for baseline compatibility
     # signal[mom < short_thresh] = -1
     return signal
+
+
+MOMENTUM = SignalPlugin(
+    name="momentum",
+    params={
+        "window": 21,
+        "long_thresh": 0.01,
+        "use_vol_adjust": False,
+        "rank_window": 60,  # trailing return ranked by cross-sectional configs
+    },
+    features=lambda window, use_vol_adjust, **_: {
+        "momentum": (
+            graph.vol_adj_momentum(window)
+            if use_vol_adjust
+            else graph.cumulative_return(window)
+        )
+    },
+    panel=lambda f, long_thresh, **_: mom_signal_from_feature(
+        f["momentum"], long_thresh
+    ),
+    metric=lambda rank_window, **_: (graph.trailing_return(rank_window), True),
+)
@@ -1,6 +1,11 @@
 # File: src/tradingbot/signals/regime_filter.py
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
 
+from tradingbot.data.providers import get_provider
+from tradingbot.features.store import data_digest
 from tradingbot.features.vol_regime import (
     compute_regime,
     load_spy_vol,
@@ -10,24 +15,128 @@ from tradingbot.features.vol_regime import (
 )
 
 
+def load_regime(
+    start_date: str,
+    vix_series: pd.Series = None,
+    spy_series: pd.Series = None,
+) -> pd.Series:
+    """Market regime labels from *start_date* on (see ``compute_regime``)."""
+    # Load market data - use cached versions if available
+    if vix_series is not None and spy_series is not None:
+        vix = load_vix_cached(vix_series, start=start_date)
+        spy_vol = load_spy_vol_cached(spy_series, start=start_date)
+    else:
+        # Fallback to downloading
+        vix = load_vix(start=start_date)
+        spy_vol = load_spy_vol(start=start_date)
+    return compute_regime(vix, spy_vol)
+
+
+def _today() -> pd.Timestamp:
+    return pd.Timestamp.now().normalize()
+
+
+class RegimeTimeline:
+    """Regime labels for one start date, shared by every ticker that uses it.
+
+    Build through :meth:`load`, which memoizes on the start date and a digest
+    of the VIX and SPY series, so a universe of tickers costs one regime
+    computation instead of one per ticker. When the series are not supplied
+    they are downloaded once per start date, data provider and calendar day
+    (like ``download_latest``), so repeated calls never refetch while a
+    long-lived process still picks up the next day's bars. Aligned masks are
+    cached per calendar as well.
+    """
+
+    _cache: "OrderedDict[tuple, RegimeTimeline]" = OrderedDict()
+    _max_items = 32
+
+    def __init__(self, regime: pd.Series):
+        self.regime = regime
+        self._aligned: list[tuple[pd.Index, pd.Series]] = []
+
+    @classmethod
+    def load(
+        cls,
+        start_date: str,
+        vix_series: pd.Series = None,
+        spy_series: pd.Series = None,
+    ) -> "RegimeTimeline":
+        """Memoized timeline from *start_date* (errors are not cached)."""
+        if vix_series is not None and spy_series is not None:
+            key = (start_date, data_digest(vix_series), data_digest(spy_series))
+        else:
+            provider = get_provider()
+            source = getattr(provider, "cache_key", provider.name)
+            key = (start_date, "downloaded", source, _today())
+        timeline = cls._cache.get(key)
+        if timeline is None:
+            timeline = cls(load_regime(start_date, vix_series, spy_series))
+            cls._cache[key] = timeline
+            if len(cls._cache) > cls._max_items:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(key)
+        return timeline
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all memoized timelines (e.g. after new market data arrives)."""
+        cls._cache.clear()
+
+    def aligned(self, index: pd.Index) -> pd.Series:
+        """Regime labels reindexed onto *index* and forward-filled."""
+        for seen, labels in self._aligned:
+            if seen is index or seen.equals(index):
+                return labels
+        if self.regime.index.equals(index):
+            labels = self.regime
+        else:
+            labels = self.regime.reindex(index).ffill()
+        if len(self._aligned) >= 8:
+            self._aligned.pop(0)
+        self._aligned.append((index, labels))
+        return labels
+
+    def mask(self, index: pd.Index, allowed: tuple[str, ...]) -> np.ndarray:
+        """Boolean array over *index*: True where the regime is *allowed*."""
+        return self.aligned(index).isin(allowed).to_numpy()
+
+    def apply(
+        self,
+        signal: pd.Series | pd.DataFrame,
+        allowed: tuple[str, ...] = ("calm", "normal"),
+    ) -> pd.Series | pd.DataFrame:
+        """Zero *signal* outside *allowed* regimes with a single broadcast."""
+        keep = self.mask(signal.index, allowed)
+        if isinstance(signal, pd.DataFrame):
+            keep = np.broadcast_to(keep[:, None], signal.shape)
+        return signal.where(keep, 0)
+
+
 def apply_regime_filter(
-    signal: pd.Series,
+    signal: pd.Series | pd.DataFrame,
     allowed: tuple[str, ...] = ("calm", "normal"),
     vix_series: pd.Series = None,
     spy_series: pd.Series = None,
-) -> pd.Series:
+    regime: pd.Series = None,
+) -> pd.Series | pd.DataFrame:
     """Filter signals to only trade in allowed market regimes.
 
     Parameters
     ----------
-    signal : pd.Series
-        Trading signal to filter
+    signal : pd.Series or pd.DataFrame
+        Trading signal to filter; a DataFrame (dates × tickers) is filtered
+        with a single regime alignment for all columns.
     allowed : tuple[str, ...]
         Allowed regimes ('calm', 'normal', 'turbulent')
     vix_series : pd.Series, optional
         Pre-loaded VIX series to avoid downloads
     spy_series : pd.Series, optional
         Pre-loaded SPY series to avoid downloads
+    regime : pd.Series or RegimeTimeline, optional
+        Pre-computed ``load_regime`` output (or timeline) for the signal's
+        start date. Without one the memoized ``RegimeTimeline`` is used.
     """
 
     # Handle empty signals
@@ -39,27 +148,15 @@ def apply_regime_filter(
         return signal.copy()
 
     try:
-        # Determine start date from signal index
-        start_date = str(signal.index.min())[:10]  # Get YYYY-MM-DD format
-
-        # Load market data - use cached versions if available
-        if vix_series is not None and spy_series is not None:
-            vix = load_vix_cached(vix_series, start=start_date)
-            spy_vol = load_spy_vol_cached(spy_series, start=start_date)
-        else:
-            # Fallback to downloading
-            vix = load_vix(start=start_date)
-            spy_vol = load_spy_vol(start=start_date)
-
-        # Compute regime
-        regime = compute_regime(vix, spy_vol)
-
-        # Align regime with signal dates and fill forward
-        aligned = regime.reindex(signal.index).ffill()
+        if regime is None:
+            # Determine start date from signal index
+            start_date = str(signal.index.min())[:10]  # Get YYYY-MM-DD format
+            regime = RegimeTimeline.load(start_date, vix_series, spy_series)
+        elif not isinstance(regime, RegimeTimeline):
+            regime = RegimeTimeline(regime)
 
         # Filter: zero out signals not in allowed regimes
-        mask = aligned.isin(allowed)
-        return signal.where(mask, 0)
+        return regime.apply(signal, allowed)
     except Exception:
         # If regime filtering fails, return original signal
         return signal.copy()
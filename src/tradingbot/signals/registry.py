@@ -0,0 +1,162 @@
+# File: src/tradingbot/signals/registry.py
+"""Registry of signal plugins used by strategy configs.
+
+A :class:`SignalPlugin` declares everything the strategy runner needs to
+know about a signal:
+
+* its parameters and their defaults;
+* the feature nodes it reads (see :mod:`tradingbot.features.graph`), so a
+  shared :class:`~tradingbot.features.graph.FeatureGraph` computes each of
+  them once for all signals and configs;
+* a vectorised implementation mapping ``dates × tickers`` feature frames to
+  a signal frame;
+* optionally the metric a cross-sectional (top-N) config ranks on.
+
+Plugins are looked up by name. :func:`register_lazy` records a
+``"module:attribute"`` path that is imported on first lookup, so plugins
+(including the built-in ``momentum`` and ``mean_reversion``) cost nothing
+until a config uses them. Config entries are either a name or a mapping
+with a ``name`` and parameter overrides:
+
+>>> calls = signal_calls(["momentum", {"name": "mean_reversion", "window": 10}])
+>>> [(c.name, c.params["window"]) for c in calls]
+[('momentum', 21), ('mean_reversion', 10)]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, Callable, Iterable, Mapping
+
+import pandas as pd
+
+__all__ = [
+    "SignalPlugin",
+    "SignalCall",
+    "register_signal",
+    "register_lazy",
+    "get_signal",
+    "available_signals",
+    "signal_calls",
+]
+
+
+@dataclass(frozen=True)
+class SignalPlugin:
+    """A named, parameterised signal.
+
+    Attributes
+    ----------
+    name : str
+        Name used in strategy configs.
+    params : Mapping[str, Any]
+        Every parameter with its default. The callables below receive all of
+        them as keyword arguments (ignore the ones you do not use with
+        ``**_``).
+    features : callable
+        ``features(**params) -> {key: Node}``: feature nodes the signal reads.
+    panel : callable
+        ``panel(frames, **params) -> DataFrame``: the signal for a
+        ``dates × tickers`` panel, *frames* mapping each key of *features*
+        to its values as a DataFrame.
+    metric : callable, optional
+        ``metric(**params) -> (Node, highest)``: the feature ranked by a
+        cross-sectional config and whether the highest values are selected.
+    """
+
+    name: str
+    params: Mapping[str, Any]
+    features: Callable[..., dict]
+    panel: Callable[..., pd.DataFrame]
+    metric: Callable[..., tuple] | None = None
+
+
+@dataclass(frozen=True)
+class SignalCall:
+    """A plugin bound to the parameters of one config entry."""
+
+    plugin: SignalPlugin
+    params: Mapping[str, Any]
+
+    @property
+    def name(self) -> str:
+        return self.plugin.name
+
+    def nodes(self) -> dict:
+        """Feature nodes of this call, keyed as the plugin names them."""
+        return self.plugin.features(**self.params)
+
+    def evaluate(self, frames: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
+        """Signal frame from the values of :meth:`nodes`."""
+        return self.plugin.panel(frames, **self.params)
+
+    def metric(self) -> tuple:
+        """``(node, highest)`` ranked by a cross-sectional config."""
+        if self.plugin.metric is None:
+            raise ValueError(f"Signal {self.name!r} has no cross-sectional metric")
+        return self.plugin.metric(**self.params)
+
+
+_PLUGINS: dict[str, SignalPlugin] = {}
+_LAZY: dict[str, str] = {
+    "momentum": "tradingbot.signals.momentum:MOMENTUM",
+    "mean_reversion": "tradingbot.signals.mean_reversion:MEAN_REVERSION",
+}
+
+
+def register_signal(plugin: SignalPlugin, replace: bool = False) -> SignalPlugin:
+    """Make *plugin* available to strategy configs under ``plugin.name``."""
+    if not replace and plugin.name in available_signals():
+        raise ValueError(f"Signal {plugin.name!r} is already registered")
+    _LAZY.pop(plugin.name, None)
+    _PLUGINS[plugin.name] = plugin
+    return plugin
+
+
+def register_lazy(name: str, target: str) -> None:
+    """Register the plugin at ``"module:attribute"`` *target*, imported on use."""
+    if name in available_signals():
+        raise ValueError(f"Signal {name!r} is already registered")
+    _LAZY[name] = target
+
+
+def get_signal(name: str) -> SignalPlugin:
+    """The plugin registered as *name* (importing it if registered lazily)."""
+    if name not in _PLUGINS:
+        if name not in _LAZY:
+            raise ValueError(f"Unknown signal type: {name}")
+        module, attr = _LAZY[name].split(":")
+        plugin = getattr(import_module(module), attr)
+        if plugin.name != name:
+            raise ValueError(f"{_LAZY[name]} is signal {plugin.name!r}, not {name!r}")
+        del _LAZY[name]
+        _PLUGINS[name] = plugin
+    return _PLUGINS[name]
+
+
+def available_signals() -> list[str]:
+    """Names of every registered plugin, loaded or not."""
+    return sorted(set(_PLUGINS) | set(_LAZY))
+
+
+def signal_calls(entries: Iterable[str | Mapping[str, Any]]) -> list[SignalCall]:
+    """Bind the ``signals`` entries of a strategy config to their plugins.
+
+    Raises ``ValueError`` for unknown signals or parameters.
+    """
+    calls = []
+    for entry in entries:
+        if isinstance(entry, str):
+            name, overrides = entry, {}
+        else:
+            overrides = dict(entry)
+            name = overrides.pop("name", None)
+            if name is None:
+                raise ValueError(f"Signal entry {entry!r} has no 'name'")
+        plugin = get_signal(name)
+        unknown = sorted(set(overrides) - set(plugin.params))
+        if unknown:
+            raise ValueError(f"Unknown parameter {unknown[0]!r} for signal {name!r}")
+        calls.append(SignalCall(plugin, {**plugin.params, **overrides}))
+    return calls
@@ -0,0 +1,91 @@
+# File: src/tradingbot/strategy/plan.py
+"""Lazy evaluation plan of a ``run_strategy`` config.
+
+:func:`build_plan` validates a config, binds its ``signals`` entries to
+their registered plugins (:mod:`tradingbot.signals.registry`) and lists the
+feature nodes each of them reads. Nothing is computed: the runner requests
+:meth:`StrategyPlan.requests` from a shared feature graph and evaluates it
+once for every config. A config whose allowed regimes include none of the
+known regimes is *masked*: every signal would be zeroed by the regime
+filter, so the plan requests no features and the runner emits zeros.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from tradingbot.features.graph import Node
+from tradingbot.signals.registry import SignalCall, signal_calls
+
+__all__ = ["REGIMES", "StrategyPlan", "build_plan"]
+
+REGIMES = ("calm", "normal", "turbulent")
+
+
+@dataclass
+class StrategyPlan:
+    """Bound signals and feature nodes of one strategy config.
+
+    Attributes
+    ----------
+    config : dict
+        The strategy config.
+    calls : list[SignalCall]
+        One bound plugin per ``signals`` entry, in config order.
+    nodes : list[dict[str, Node]]
+        Feature nodes of each call (empty lists when masked or
+        cross-sectional).
+    metric : tuple[Node, bool] or None
+        Ranked feature and direction of a cross-sectional config.
+    masked : bool
+        True if no allowed regime exists, so every signal is 0.
+    """
+
+    config: dict
+    calls: list[SignalCall]
+    nodes: list[dict[str, Node]]
+    metric: tuple[Node, bool] | None
+    masked: bool
+
+    @property
+    def cross_sectional(self) -> bool:
+        return bool(self.config.get("cross_sectional", False))
+
+    @property
+    def allowed_regimes(self) -> tuple[str, ...]:
+        return tuple(self.config.get("allowed_regimes", ("calm", "normal")))
+
+    def requests(self) -> list[Node]:
+        """Feature nodes to request from the shared graph."""
+        if self.metric is not None:
+            return [self.metric[0]]
+        return [node for nodes in self.nodes for node in nodes.values()]
+
+
+def build_plan(strategy_config: dict) -> StrategyPlan:
+    """Validate *strategy_config* and plan its evaluation.
+
+    Raises ``ValueError`` for a non-positive ``top_n``, an empty or unknown
+    signal list, unknown signal parameters, or a cross-sectional config
+    without exactly one rankable signal.
+    """
+    entries = list(strategy_config.get("signals", []))
+    cross_sectional = strategy_config.get("cross_sectional", False)
+    if cross_sectional:
+        if int(strategy_config.get("top_n", 5)) <= 0:
+            raise ValueError("top_n must be positive for cross-sectional strategy")
+        if len(entries) != 1:
+            raise ValueError(
+                "Cross-sectional strategy must specify exactly one signal type"
+            )
+    elif not entries:
+        raise ValueError("strategy_config must include non-empty 'signals' list")
+
+    calls = signal_calls(entries)
+    allowed = strategy_config.get("allowed_regimes", ("calm", "normal"))
+    masked = not set(allowed) & set(REGIMES)
+    if masked:
+        return StrategyPlan(strategy_config, calls, [], None, True)
+    if cross_sectional:
+        return StrategyPlan(strategy_config, calls, [], calls[0].metric(), False)
+    return StrategyPlan(strategy_config, calls, [c.nodes() for c in calls], None, False)
@@ -1,29 +1,60 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 import numpy as np
 import pandas as pd
 
-from tradingbot.risk.atr import calc_atr, position_size
-from tradingbot.risk.vix_filter import throttle_risk_pct
-from tradingbot.signals.cross_sectional import (
-    compute_return_matrix,
-    rank_top_n_df,
-    universe_momentum_ok,
-)
-from tradingbot.signals.mean_reversion import generate_mr_signal
-from tradingbot.signals.momentum import generate_mom_signal
-from tradingbot.signals.regime_filter import apply_regime_filter
+from tradingbot import kernels
+from tradingbot.data.calendar import align_columns, build_calendar
+from tradingbot.data.panel import PricePanel
+from tradingbot.features.graph import FeatureGraph, GraphRun, Node
+from tradingbot.risk.atr import calc_atr
+from tradingbot.risk.vix_filter import throttle_risk_series
+from tradingbot.signals.cross_sectional import select_top_n, universe_momentum_ok
+from tradingbot.signals.events import SignalEvents, day_major
+from tradingbot.signals.regime_filter import RegimeTimeline, apply_regime_filter
+from tradingbot.signals.registry import SignalCall
+from tradingbot.strategy.plan import StrategyPlan, build_plan
+
+
+def _calendar_groups(
+    items: Dict[str, pd.Series] | Dict[str, pd.DataFrame],
+) -> list[tuple[pd.Index, list[str]]]:
+    """Tickers grouped by identical index, in first-seen order."""
+    groups: list[tuple[pd.Index, list[str]]] = []
+    for ticker, obj in items.items():
+        for index, members in groups:
+            if index is obj.index or index.equals(obj.index):
+                members.append(ticker)
+                break
+        else:
+            groups.append((obj.index, [ticker]))
+    return groups
+
 
+def _regime_filter_frame(
+    signals: pd.DataFrame,
+    allowed: tuple[str, ...],
+    vix_series: pd.Series = None,
+    spy_series: pd.Series = None,
+) -> pd.DataFrame:
+    """Zero a ``dates × tickers`` signal frame outside *allowed* regimes.
 
-def _gen_signal_by_type(signal_type: str, df: pd.DataFrame) -> pd.Series:
-    """Helper to generate a signal Series given signal type string."""
-    if signal_type == "mean_reversion":
-        return generate_mr_signal(df)
-    if signal_type == "momentum":
-        return generate_mom_signal(df)
-    raise ValueError(f"Unknown signal type: {signal_type}")
+    One memoized ``RegimeTimeline`` and one broadcast mask cover every
+    column. If the regime cannot be loaded the signals pass through
+    unchanged, like ``apply_regime_filter`` does.
+    """
+    if signals.empty or {"calm", "normal", "turbulent"} <= set(allowed):
+        return signals
+    try:
+        timeline = RegimeTimeline.load(
+            str(signals.index.min())[:10], vix_series, spy_series
+        )
+        return timeline.apply(signals, allowed)
+    except Exception:
+        return signals
 
 
 def run_strategy(
@@ -31,6 +62,8 @@ def run_strategy(
     data: Dict[str, pd.DataFrame],
     spy_series: pd.Series = None,
     vix_series: pd.Series = None,
+    *,
+    max_workers: int = 4,
 ) -> Dict[str, pd.Series]:
     """Run a strategy for each ticker based on configuration.
 
@@ -38,7 +71,9 @@ def run_strategy(
     ----------
     strategy_config : dict
         Dict containing keys:
-        - "signals": list[str] of signal identifiers ("momentum", "mean_reversion")
+        - "signals": list of registered signal names ("momentum",
+          "mean_reversion", see ``tradingbot.signals.registry``), or of
+          ``{"name": ..., <param>: <value>}`` mappings overriding parameters
         - "allowed_regimes": Optional list[str] of regimes to keep (default calm+normal)
     data : dict[str, pd.DataFrame]
         Mapping of ticker -> price DataFrame (must contain "Close")
@@ -46,98 +81,256 @@ def run_strategy(
         Pre-loaded SPY series to avoid downloads
     vix_series : pd.Series, optional
         Pre-loaded VIX series to avoid downloads
+    max_workers : int, default 4
+        Threads evaluating the signals of an ensemble concurrently.
 
     Returns
     -------
     dict[str, pd.Series]
         Mapping of ticker -> signal Series aligned to the DataFrame index.
     """
+    return run_strategies(
+        [strategy_config], data, spy_series, vix_series, max_workers=max_workers
+    )[0]
 
-    # Cross-sectional strategy path
-    if strategy_config.get("cross_sectional", False):
-        n = int(strategy_config.get("top_n", 5))
-        if n <= 0:
-            raise ValueError("top_n must be positive for cross-sectional strategy")
-
-        if strategy_config["signals"] == ["momentum"]:
-            metric_df = compute_return_matrix(data, window=60)
-            selection = rank_top_n_df(metric_df, n, highest=True)
-        elif strategy_config["signals"] == ["mean_reversion"]:
-            metric_df = compute_return_matrix(data, window=5)
-            selection = rank_top_n_df(metric_df, n, highest=False)
-        else:
-            raise ValueError(
-                "Cross-sectional strategy must specify exactly one "
-                "signal type (momentum or mean_reversion)"
-            )
 
-        allowed_regimes = tuple(
-            strategy_config.get("allowed_regimes", ("calm", "normal"))
+def run_strategies(
+    strategy_configs: List[dict],
+    data: Dict[str, pd.DataFrame],
+    spy_series: pd.Series = None,
+    vix_series: pd.Series = None,
+    *,
+    max_workers: int = 4,
+) -> List[Dict[str, pd.Series]]:
+    """``run_strategy`` for several configs over the same data.
+
+    Each config becomes a :class:`~tradingbot.strategy.plan.StrategyPlan`.
+    The features of all plans go into one :class:`FeatureGraph`, so inputs
+    they share (the Close field, a 21-day return used by two configs, ...)
+    are computed once per calendar for all tickers; masked plans request
+    none. Tickers sharing a calendar are then run as one panel (see
+    :func:`run_strategy_panel`). Each config's features are released once
+    its signals are built, so only features still needed by later configs
+    stay in memory.
+    """
+    plans = [build_plan(cfg) for cfg in strategy_configs]
+    graph = FeatureGraph()
+    for plan in plans:
+        graph.request(*plan.requests())
+
+    fields = [n.params[0] for n in graph.nodes() if n.op == "field"]
+    runs = [
+        (
+            index,
+            members,
+            graph.evaluate(
+                {
+                    f: np.column_stack(
+                        [data[t][f].to_numpy(dtype=float) for t in members]
+                    )
+                    for f in fields
+                }
+            ),
         )
-        signals_cs: Dict[str, pd.Series] = {
-            col: apply_regime_filter(
-                pd.Series(selection[col].astype(int)),
-                allowed=allowed_regimes,
-                vix_series=vix_series,
-                spy_series=spy_series,
+        for index, members in _calendar_groups(data)
+    ]
+
+    results = []
+    for plan in plans:
+        if plan.masked:
+            signals = _masked_signals(plan, data)
+        elif plan.cross_sectional:
+            node, highest = plan.metric
+            metric_df = pd.DataFrame(_feature_series(node, runs, list(data)))
+            signals = _cross_sectional_signals(
+                plan.config, highest, metric_df, spy_series, vix_series
             )
-            for col in selection.columns
-        }
-
-        # Apply cash buffer logic if enabled
-        if strategy_config.get("cash_buffer", False):
-            ok_series = universe_momentum_ok(metric_df)
-            for ticker in signals_cs:
-                # Zero out signals when universe momentum is negative
-                signals_cs[ticker] = signals_cs[ticker].where(ok_series, 0)
-
-        # For long-only strategies, filter out negative signals
-        if not strategy_config.get("long_short", False):
-            for ticker in signals_cs:
-                signals_cs[ticker] = signals_cs[ticker].where(
-                    signals_cs[ticker] >= 0, 0
+        else:
+            signals = {}
+            for index, members, run in runs:
+                frames = [
+                    {
+                        key: pd.DataFrame(run.get(node), index=index, columns=members)
+                        for key, node in nodes.items()
+                    }
+                    for nodes in plan.nodes
+                ]
+                frame = _panel_signals(
+                    plan, frames, spy_series, vix_series, max_workers
                 )
+                signals.update(frame.items())
+            signals = {t: signals[t] for t in data}
+        for _, _, run in runs:
+            run.release_all(plan.requests())
+        results.append(signals)
+    return results
 
-        return signals_cs
 
-    # ---- single‐stock (non cross-sectional) logic below ----
+def run_strategy_panel(
+    strategy_config: dict,
+    panel: PricePanel,
+    spy_series: pd.Series = None,
+    vix_series: pd.Series = None,
+    *,
+    max_workers: int = 4,
+) -> pd.DataFrame:
+    """Panel mode of :func:`run_strategy`: one ``dates × tickers`` signal frame.
+
+    Every requested signal is computed for all tickers at once on the panel
+    calendar; the sign-agreement ensemble, regime mask and long-only clip
+    are whole-array operations. On a panel whose tickers share one calendar
+    the columns equal ``run_strategy`` on ``panel.to_frames()``; on a union
+    calendar a ticker's missing bars are NaN rows inside its windows (as in
+    :mod:`tradingbot.features.panel_features`). Use :func:`signals_to_dict`
+    for the ``Dict[str, pd.Series]`` layout.
+    """
+    plan = build_plan(strategy_config)
+    if plan.masked:
+        return pd.DataFrame(0, index=panel.dates, columns=panel.tickers)
+    graph = FeatureGraph()
+    graph.request(*plan.requests())
+    run = graph.evaluate(panel.fields)
+
+    def frame(node: Node) -> pd.DataFrame:
+        return pd.DataFrame(run.get(node), index=panel.dates, columns=panel.tickers)
+
+    if plan.cross_sectional:
+        node, highest = plan.metric
+        return pd.DataFrame(
+            _cross_sectional_signals(
+                strategy_config, highest, frame(node), spy_series, vix_series
+            ),
+            index=panel.dates,
+        )
+    frames = [{key: frame(node) for key, node in nodes.items()} for nodes in plan.nodes]
+    return _panel_signals(plan, frames, spy_series, vix_series, max_workers)
 
-    signal_names: List[str] = strategy_config.get("signals", [])
-    if not signal_names:
-        raise ValueError("strategy_config must include non-empty 'signals' list")
 
-    allowed_regimes = tuple(strategy_config.get("allowed_regimes", ("calm", "normal")))
+def signals_to_dict(
+    signals: pd.DataFrame, panel: PricePanel | None = None
+) -> Dict[str, pd.Series]:
+    """Compatibility adapter from a signal frame to ``ticker -> Series``.
 
-    results: Dict[str, pd.Series] = {}
+    With *panel*, each Series keeps only the dates the ticker has a bar on,
+    like the per-ticker frames of ``panel.to_frames()``.
+    """
+    if panel is None:
+        return {t: signals[t] for t in signals.columns}
+    valid = pd.DataFrame(panel.valid, index=panel.dates, columns=panel.tickers)
+    return {t: signals[t][valid[t].to_numpy()] for t in signals.columns}
 
-    for ticker, df in data.items():
-        # Generate individual signals requested
-        sig_components = [_gen_signal_by_type(name, df) for name in signal_names]
 
-        if len(sig_components) == 1:
-            combined = sig_components[0]
-        else:
-            # If multiple signals, simple ensemble logic: require alignment sign-wise
-            combined = sig_components[0].copy()
-            for s in sig_components[1:]:
-                combined[(combined > 0) & (s <= 0)] = 0  # long only if all agree long
-                combined[(combined < 0) & (s >= 0)] = 0  # short only if all agree short
-
-        # Apply regime filter with cached series
-        combined = apply_regime_filter(
-            combined,
-            allowed=allowed_regimes,
-            vix_series=vix_series,
-            spy_series=spy_series,
-        )
+def _masked_signals(
+    plan: StrategyPlan, data: Dict[str, pd.DataFrame]
+) -> Dict[str, pd.Series]:
+    """All-zero signals of a plan whose every regime is disallowed."""
+    if plan.cross_sectional:
+        # Top-N signals live on the metric frame's union calendar
+        index = pd.DataFrame({t: df["Close"] for t, df in data.items()}).index
+        return {t: pd.Series(0, index=index, name=t) for t in data}
+    return {t: pd.Series(0, index=df.index, name=t) for t, df in data.items()}
+
+
+def _feature_series(
+    node: Node,
+    runs: list[tuple[pd.Index, list[str], GraphRun]],
+    tickers: List[str],
+) -> Dict[str, pd.Series]:
+    """Ticker -> Series of *node* (in *tickers* order) from each calendar."""
+    out: Dict[str, pd.Series] = {}
+    for index, members, run in runs:
+        values = run.get(node)
+        for j, ticker in enumerate(members):
+            out[ticker] = pd.Series(values[:, j], index=index)
+    return {t: out[t] for t in tickers}
 
-        # For long-only strategies, filter out negative signals
-        if not strategy_config.get("long_short", False):
-            combined = combined.where(combined >= 0, 0)
 
-        results[ticker] = combined
+def _cross_sectional_signals(
+    strategy_config: dict,
+    highest: bool,
+    metric_df: pd.DataFrame,
+    spy_series: pd.Series = None,
+    vix_series: pd.Series = None,
+) -> Dict[str, pd.Series]:
+    """Top-N selection signals from a ``dates × tickers`` metric frame.
 
-    return results
+    NaN metrics (warm-up, not yet listed) are never selected; the universe
+    momentum of the cash buffer counts them as 0.
+    """
+    allowed_regimes = tuple(strategy_config.get("allowed_regimes", ("calm", "normal")))
+    n = int(strategy_config.get("top_n", 5))
+    # Exactly n names per date (ties go to the earlier ticker)
+    selection = select_top_n(metric_df, n, highest=highest)
+    selection = selection.to_dense()
+
+    # All columns share the selection index: align the regime once
+    filtered = apply_regime_filter(
+        selection.astype(int),
+        allowed=allowed_regimes,
+        vix_series=vix_series,
+        spy_series=spy_series,
+    )
+    signals_cs: Dict[str, pd.Series] = {col: filtered[col] for col in selection.columns}
+
+    # Apply cash buffer logic if enabled
+    if strategy_config.get("cash_buffer", False):
+        ok_series = universe_momentum_ok(metric_df.fillna(0.0))
+        for ticker in signals_cs:
+            # Zero out signals when universe momentum is negative
+            signals_cs[ticker] = signals_cs[ticker].where(ok_series, 0)
+
+    # For long-only strategies, filter out negative signals
+    if not strategy_config.get("long_short", False):
+        for ticker in signals_cs:
+            signals_cs[ticker] = signals_cs[ticker].where(signals_cs[ticker] >= 0, 0)
+
+    return signals_cs
+
+
+def _evaluate_calls(
+    calls: List[SignalCall],
+    frames: List[Dict[str, pd.DataFrame]],
+    max_workers: int,
+) -> List[pd.DataFrame]:
+    """Each call's signal frame; independent calls run in a thread pool."""
+    if max_workers <= 1 or len(calls) == 1:
+        return [call.evaluate(f) for call, f in zip(calls, frames)]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        return list(pool.map(lambda call, f: call.evaluate(f), calls, frames))
+
+
+def _panel_signals(
+    plan: StrategyPlan,
+    frames: List[Dict[str, pd.DataFrame]],
+    spy_series: pd.Series = None,
+    vix_series: pd.Series = None,
+    max_workers: int = 4,
+) -> pd.DataFrame:
+    """Single-stock signals of one plan for a ``dates × tickers`` panel.
+
+    *frames* holds the feature frames of each of ``plan.calls``.
+    """
+    components = _evaluate_calls(plan.calls, frames, max_workers)
+
+    combined = components[0]
+    if len(components) > 1:
+        # Simple ensemble logic: require alignment sign-wise
+        values = combined.to_numpy(copy=True)
+        for comp in components[1:]:
+            other = comp.to_numpy()
+            values[(values > 0) & (other <= 0)] = 0  # long only if all agree long
+            values[(values < 0) & (other >= 0)] = 0  # short only if all agree short
+        combined = pd.DataFrame(values, index=combined.index, columns=combined.columns)
+
+    # One regime computation and one broadcast mask for all tickers
+    combined = _regime_filter_frame(
+        combined, plan.allowed_regimes, vix_series, spy_series
+    )
+
+    # For long-only strategies, filter out negative signals
+    if not plan.config.get("long_short", False):
+        combined = combined.clip(lower=0)
+    return combined
 
 
 # ---------------------------------------------------------------------------
@@ -147,7 +340,7 @@ def run_strategy(
 
 def backtest_with_atr(
     strategy_conf: dict,
-    data: Dict[str, pd.DataFrame],
+    data: Dict[str, pd.DataFrame] | PricePanel,
     start_equity: float = 1_000_000,
     *,
     risk_pct: float = 0.003,
@@ -162,9 +355,11 @@ def backtest_with_atr(
     ----------
     strategy_conf : dict
         Must contain key ``"signals_dict"`` mapping ticker → Series
-        (1 = long, 0 = flat) produced by the signal engine.
-    data : dict[str, pd.DataFrame]
-        Historical OHLCV data (must include High, Low, Close).
+        (1 = long, 0 = flat) produced by the signal engine, or to its
+        :class:`~tradingbot.signals.events.SignalEvents` encoding.
+    data : dict[str, pd.DataFrame] or PricePanel
+        Historical OHLCV data (must include High, Low, Close). A panel (e.g. a
+        shared memmap export) is read through zero-copy per-ticker views.
     start_equity : float, default 1,000,000
         Starting capital in dollars.
     risk_pct : float, default 0.003
@@ -187,135 +382,58 @@ def backtest_with_atr(
     if "signals_dict" not in strategy_conf:
         raise KeyError("strategy_conf must include 'signals_dict' for ATR back-test")
 
-    signals_dict: Dict[str, pd.Series] = strategy_conf["signals_dict"]
-
-    # Align all tickers to common date index (use first ticker as anchor)
-    dates = next(iter(data.values())).index
-
-    # Pre-compute ATR for each ticker
-    atr_map: Dict[str, pd.Series] = {
-        t: calc_atr(df, window=atr_window) for t, df in data.items()
-    }
-
-    equity = pd.Series(start_equity, index=dates, dtype=float)
-    cash = start_equity
-
-    positions: Dict[str, int] = {t: 0 for t in data.keys()}
-    entry_price: Dict[str, float] = {t: np.nan for t in data.keys()}
-    entry_dates: Dict[str, pd.Timestamp] = {t: None for t in data.keys()}
-
-    # Trade log storage
-    fills = []
-
-    for i in range(1, len(dates)):
-        today, prev_day = dates[i], dates[i - 1]
-
-        # ------------------------------------------------------------------
-        # 1) Check trailing-stop exits
-        # ------------------------------------------------------------------
-        for t, qty in list(positions.items()):
-            if qty == 0:
-                continue
-            price_today = data[t]["Close"].loc[today]
-            atr_today_val = atr_map[t].get(today)
-            if atr_today_val is None or pd.isna(atr_today_val):
-                continue
-            atr_today = float(atr_today_val)
-
-            exit_triggered = False
-            if qty > 0 and price_today < entry_price[t] - stop_mult * atr_today:
-                exit_triggered = True
-            elif qty < 0 and price_today > entry_price[t] + stop_mult * atr_today:
-                exit_triggered = True
-
-            if exit_triggered:
-                # Record the fill
-                if return_fills:
-                    pnl = qty * (price_today - entry_price[t])
-                    fills.append(
-                        {
-                            "symbol": t,
-                            "open_time": entry_dates[t],
-                            "open_price": entry_price[t],
-                            "close_time": today,
-                            "close_price": price_today,
-                            "pnl": pnl,
-                            "side": "buy" if qty > 0 else "sell",
-                        }
-                    )
-
-                # EXIT (close position)
-                cash += qty * price_today  # Add position value back to cash
-                positions[t] = 0
-                entry_price[t] = float("nan")
-                entry_dates[t] = None
-
-        # ------------------------------------------------------------------
-        # 2) Entries from signals (end of previous day)
-        # ------------------------------------------------------------------
-        for t, sig in signals_dict.items():
-            if positions[t] != 0:
-                continue  # already in position
-
-            # Use safe lookup to avoid KeyError
-            sig_prev = sig.get(prev_day, 0)
-            if sig_prev is not None and sig_prev != 0:
-                atr_prev_val = atr_map[t].get(prev_day)
-                if atr_prev_val is None or pd.isna(atr_prev_val):
-                    continue
-                atr_prev = float(atr_prev_val)
-
-                # Apply VIX-based risk throttling with cached series
-                adj_risk = throttle_risk_pct(risk_pct, prev_day, vix_series=vix_series)
-                base_qty = position_size(
-                    equity.loc[prev_day], atr_prev, risk_pct=adj_risk
-                )
-                qty = int(
-                    base_qty * sig_prev
-                )  # +base_qty for long, -base_qty for short
-
-                price_prev = data[t]["Close"].loc[prev_day]
-                cost = abs(qty) * price_prev
-                if cost <= cash or qty < 0:  # allow proceeds to fund shorts
-                    if qty < 0:  # SHORT ENTRY
-                        cash += cost  # receive cash
-                    else:  # LONG ENTRY
-                        cash -= cost  # pay cash
-                    positions[t] = qty
-                    entry_price[t] = price_prev
-                    entry_dates[t] = prev_day
-
-        # ------------------------------------------------------------------
-        # 3) Mark-to-market portfolio equity
-        # ------------------------------------------------------------------
-        portfolio_val = cash + sum(
-            positions[t] * data[t]["Close"].loc[today]
-            for t in positions
-            if positions[t] != 0  # Include both positive and negative positions
-        )
-
-        equity.iloc[i] = portfolio_val
-
-    # Close any remaining positions at the end
-    final_date = dates[-1]
-    for t, qty in positions.items():
-        if qty != 0 and return_fills:
-            price_final = data[t]["Close"].loc[final_date]
-            pnl = qty * (price_final - entry_price[t])
-            fills.append(
-                {
-                    "symbol": t,
-                    "open_time": entry_dates[t],
-                    "open_price": entry_price[t],
-                    "close_time": final_date,
-                    "close_price": price_final,
-                    "pnl": pnl,
-                    "side": "buy" if qty > 0 else "sell",
-                }
-            )
-
+    signals_dict: Dict[str, pd.Series | SignalEvents] = strategy_conf["signals_dict"]
+    if isinstance(data, PricePanel):
+        data = data.to_frames()
+
+    # One shared calendar; every input becomes a (dates × tickers) array on it
+    tickers = list(data)
+    col = {t: j for j, t in enumerate(tickers)}
+    dates = build_calendar(df.index for df in data.values())
+    close = align_columns({t: df["Close"] for t, df in data.items()}, dates)
+    valid = np.isfinite(close)
+    mark = pd.DataFrame(close).ffill().to_numpy()  # last known price for MTM
+    atr = align_columns(
+        {t: calc_atr(df, window=atr_window) for t, df in data.items()}, dates
+    )
+    # Signals go in as day-sorted change events, never as a dense matrix
+    ev_day, ev_tick, ev_val = day_major(signals_dict, dates, tickers)
+    # Entries are considered in signals_dict order (cash is spent first-come)
+    entry_order = np.array([col[t] for t in signals_dict if t in col], dtype=np.intp)
+
+    # VIX throttle for every day up front (one VIX load, not one per entry)
+    risk = throttle_risk_series(risk_pct, dates, vix_series=vix_series)
+    equity, fill_rows = kernels.atr_stop_events(
+        close,
+        atr,
+        valid,
+        mark,
+        ev_day,
+        ev_tick,
+        ev_val,
+        entry_order,
+        risk,
+        float(start_equity),
+        stop_mult,
+    )
+
+    equity = pd.Series(equity, index=dates, dtype=float)
     if return_fills:
-        fills_df = pd.DataFrame(fills)
+        j, open_pos, close_pos = (fill_rows[:, k].astype(np.intp) for k in range(3))
+        open_price, close_price, qty = fill_rows[:, 3], fill_rows[:, 4], fill_rows[:, 5]
+        fills_df = pd.DataFrame(
+            {
+                "symbol": [tickers[k] for k in j],
+                "open_time": dates[open_pos],
+                "open_price": open_price,
+                "close_time": dates[close_pos],
+                "close_price": close_price,
+                "pnl": qty * (close_price - open_price),
+                "side": np.where(qty > 0, "buy", "sell"),
+            }
+        )
+        if fills_df.empty:
+            fills_df = pd.DataFrame()
         return equity, fills_df
     else:
         return equity
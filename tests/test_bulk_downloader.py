@@ -0,0 +1,73 @@
+# File: tests/test_bulk_downloader.py
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from tradingbot.data import yfinance_downloader as ydl
+from tradingbot.data.bulk_downloader import TokenBucket, download_universe
+
+
+def _bars(start, end):
+    idx = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+    px = 50 + np.arange(len(idx), dtype=float)
+    return pd.DataFrame(
+        {"Open": px, "High": px + 1, "Low": px - 1, "Close": px, "Volume": 1e6},
+        index=pd.DatetimeIndex(idx, name="Date"),
+    )
+
+
+def test_download_universe_offline(monkeypatch, tmp_path):
+    monkeypatch.setattr(ydl, "CACHE_DIR", tmp_path)
+    attempts: dict[str, int] = {}
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_dl(ticker, start, end):
+        with lock:
+            attempts[ticker] = attempts.get(ticker, 0) + 1
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        try:
+            time.sleep(0.05)
+            if ticker == "DEAD":
+                raise ConnectionError("boom")
+            if ticker == "FLAKY" and attempts[ticker] == 1:
+                return pd.DataFrame()
+            return _bars(start, end)
+        finally:
+            with lock:
+                active[0] -= 1
+
+    monkeypatch.setattr(ydl, "_dl", fake_dl)
+    tickers = ["A", "B", "C", "D", "FLAKY", "DEAD"]
+    frames, failures = download_universe(
+        tickers,
+        "2023-01-01",
+        "2023-03-01",
+        max_workers=4,
+        rate=100,
+        burst=10,
+        max_retry=3,
+        base_delay=0.01,
+    )
+
+    assert set(frames) == {"A", "B", "C", "D", "FLAKY"}
+    assert set(failures) == {"DEAD"} and "boom" in failures["DEAD"]
+    assert attempts["FLAKY"] == 2 and attempts["DEAD"] == 3
+    assert peak[0] > 1  # downloads overlapped
+
+    # Second pass is answered from the cache
+    frames2, failures2 = download_universe(["A", "B"], "2023-01-15", "2023-02-15")
+    assert attempts["A"] == 1 and not failures2
+    assert frames2["A"].index.min() >= pd.Timestamp("2023-01-15")
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+    t0 = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - t0 >= 5 / 50 * 0.9
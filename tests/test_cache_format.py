@@ -0,0 +1,60 @@
+# File: tests/test_cache_format.py
+
+import numpy as np
+import pandas as pd
+
+from tradingbot.data import cache_manifest
+from tradingbot.data import yfinance_downloader as ydl
+from tradingbot.data.cache_format import PRICE_TOL, fits_float32, read_bars, write_bars
+from tradingbot.data.providers import SyntheticProvider
+
+
+def _bars():
+    return SyntheticProvider(seed=3).fetch("SYN0001", "2005-01-01", "2025-01-01")
+
+
+def test_compact_profiles_shrink_and_round_trip(tmp_path):
+    df = _bars()
+    sizes = {}
+    for name in ("legacy", "compact", "compact32"):
+        fp = tmp_path / f"{name}.parquet"
+        write_bars(fp, df, {b"k": b"v"}, name)
+        sizes[name] = fp.stat().st_size
+        back = read_bars(fp)
+        assert back.dtypes.eq(df.dtypes).all()
+        assert back.index.equals(df.index)
+        tol = PRICE_TOL if name == "compact32" else 0
+        assert np.abs(back.to_numpy() - df.to_numpy()).max() <= tol
+
+    assert sizes["compact"] < sizes["legacy"]
+    assert sizes["compact32"] < 0.75 * sizes["legacy"]
+
+
+def test_float32_precision_check():
+    assert fits_float32(np.array([12.34, 4567.89, np.nan]))
+    assert not fits_float32(np.array([612_345.67]))  # BRK-A scale
+
+
+def test_migrate_rewrites_parquet_and_legacy_csv(monkeypatch, tmp_path):
+    monkeypatch.setattr(ydl, "CACHE_DIR", tmp_path)
+    df = _bars()
+    fp = tmp_path / "AAA.parquet"
+    ydl._write_cache(
+        fp, df, pd.Timestamp("2005-01-01"), pd.Timestamp("2025-01-01"), None, "legacy"
+    )
+    csv_df = df.loc["2010"].rename_axis("Date")
+    csv_df.to_csv(tmp_path / "BBB_1d.csv")
+
+    res = ydl.migrate_cache("compact32")
+    assert res == {**res, "files": 1, "csv": 1}
+    assert res["bytes_after"] < res["bytes_before"]
+    assert not (tmp_path / "BBB_1d.csv").exists()
+
+    assert ydl._cached_range(fp) == (
+        pd.Timestamp("2005-01-01"),
+        pd.Timestamp("2025-01-01"),
+    )
+    bbb = read_bars(tmp_path / "BBB.parquet")
+    assert bbb.index.equals(csv_df.index)
+    assert np.allclose(bbb["Close"], csv_df["Close"], atol=PRICE_TOL)
+    assert cache_manifest.lookup(tmp_path, tmp_path / "BBB.parquet").rows == len(bbb)
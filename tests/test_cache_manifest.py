@@ -0,0 +1,119 @@
+# File: tests/test_cache_manifest.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingbot import cli
+from tradingbot.data import cache_manifest
+from tradingbot.data import yfinance_downloader as ydl
+from tradingbot.data.providers import set_provider
+
+
+@pytest.fixture
+def offline_cache(monkeypatch, tmp_path):
+    calls = []
+
+    def _fake(ticker, start, end):
+        calls.append(ticker)
+        idx = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+        px = 10 + np.arange(len(idx), dtype=float)
+        return pd.DataFrame(
+            {"Open": px, "High": px, "Low": px, "Close": px, "Volume": 1e6},
+            index=pd.DatetimeIndex(idx, name="Date"),
+        )
+
+    monkeypatch.setattr(ydl, "_dl", _fake)
+    monkeypatch.setattr(ydl, "CACHE_DIR", tmp_path)
+    set_provider("yfinance")  # cache layout of the default provider
+    yield calls
+    set_provider(None)
+
+
+def test_manifest_tracks_downloads(offline_cache, tmp_path):
+    ydl.download_stock_data("AAA", start="2023-01-01", end="2023-07-01")
+    fp = tmp_path / "AAA.parquet"
+    e = cache_manifest.lookup(tmp_path, fp)
+    assert (e.ticker, e.start, e.end) == ("AAA", "2023-01-01", "2023-07-01")
+    assert e.rows > 100 and e.bytes == fp.stat().st_size
+
+    # Sub-range served from the manifest + file, and the access time moves
+    before = e.last_access
+    ydl.download_stock_data("AAA", start="2023-02-01", end="2023-03-01")
+    assert offline_cache == ["AAA"]
+    assert cache_manifest.lookup(tmp_path, fp).last_access >= before
+
+
+def test_legacy_file_is_indexed_on_first_visit(offline_cache, tmp_path):
+    ydl.download_stock_data("AAA", start="2023-01-01", end="2023-03-01")
+    cache_manifest.forget(tmp_path, "AAA.parquet")
+
+    ydl.download_stock_data("AAA", start="2023-01-15", end="2023-02-15")
+    assert offline_cache == ["AAA"]
+    assert cache_manifest.lookup(tmp_path, tmp_path / "AAA.parquet").rows > 0
+
+
+def test_verify_and_prune(offline_cache, tmp_path, capsys):
+    for t in ("AAA", "BBB", "CCC"):
+        ydl.download_stock_data(t, start="2023-01-01", end="2023-03-01")
+    ydl.download_stock_data("AAA", start="2023-01-01", end="2023-02-01")  # touch
+
+    (tmp_path / "BBB.parquet").write_bytes(b"garbage")
+    report = cache_manifest.verify(tmp_path)
+    assert report["corrupt"] == ["BBB.parquet"] and not report["missing"]
+    assert cli.main(["cache", "--cache-dir", str(tmp_path), "verify"]) == 1
+    cache_manifest.verify(tmp_path, repair=True)
+    assert not (tmp_path / "BBB.parquet").exists()
+
+    one = cache_manifest.lookup(tmp_path, tmp_path / "AAA.parquet").bytes
+    args = ["cache", "--cache-dir", str(tmp_path), "prune", "--max-bytes", str(one)]
+    assert cli.main(args) == 0
+    # CCC was least recently used; AAA survives
+    assert (tmp_path / "AAA.parquet").exists()
+    assert not (tmp_path / "CCC.parquet").exists()
+    assert cache_manifest.stats(tmp_path)["entries"] == 1
+
+    cli.main(["cache", "--cache-dir", str(tmp_path), "stats"])
+    assert "Entries:  1" in capsys.readouterr().out
+
+
+def test_parse_size():
+    assert cli.parse_size("512") == 512
+    assert cli.parse_size("2G") == 2 << 30
+    assert cli.parse_size("1.5MiB") == int(1.5 * (1 << 20))
+
+
+def test_touches_are_batched_on_one_connection(offline_cache, tmp_path, monkeypatch):
+    ydl.download_stock_data("AAA", start="2023-01-01", end="2023-03-01")
+    fp = tmp_path / "AAA.parquet"
+    opened = []
+    real_connect = cache_manifest.sqlite3.connect
+    monkeypatch.setattr(
+        cache_manifest.sqlite3,
+        "connect",
+        lambda *a, **k: opened.append(a) or real_connect(*a, **k),
+    )
+    for _ in range(5):
+        ydl.download_stock_data("AAA", start="2023-01-15", end="2023-02-15")
+    assert opened == []  # the connection of the first download is reused
+
+    row = cache_manifest._connect(tmp_path).execute(
+        "SELECT last_access FROM entries WHERE path = 'AAA.parquet'"
+    )
+    stored = row.fetchone()[0]
+    buffered = cache_manifest.lookup(tmp_path, fp).last_access
+    assert buffered > stored  # pending, but visible to lookups
+    assert next(cache_manifest.entries(tmp_path)).last_access == buffered
+
+
+def test_verify_hashes_new_files_then_checks_them(offline_cache, tmp_path):
+    ydl.download_stock_data("AAA", start="2023-01-01", end="2023-03-01")
+    fp = tmp_path / "AAA.parquet"
+    assert cache_manifest.lookup(tmp_path, fp).sha256 == ""
+    assert cache_manifest.verify(tmp_path)["corrupt"] == []
+    assert cache_manifest.lookup(tmp_path, fp).sha256 == cache_manifest.file_digest(fp)
+
+    data = bytearray(fp.read_bytes())
+    data[len(data) // 2] ^= 0xFF  # same size, different content
+    fp.write_bytes(bytes(data))
+    assert cache_manifest.verify(tmp_path)["corrupt"] == ["AAA.parquet"]
@@ -0,0 +1,68 @@
+# File: tests/test_calendar.py
+
+import numpy as np
+import pandas as pd
+
+from tradingbot.data.calendar import align_columns, build_calendar
+from tradingbot.evaluation.benchmark_compare import _simulate_simple_long_only
+from tradingbot.strategy.runner import backtest_with_atr
+
+
+def _ohlc(idx, start=100.0, step=1.0):
+    px = pd.Series(start + step * np.arange(len(idx)), index=idx)
+    return pd.DataFrame(
+        {"Open": px, "High": px + 1, "Low": px - 1, "Close": px, "Volume": 1e6}
+    )
+
+
+def test_build_calendar_and_align():
+    a = pd.bdate_range("2024-01-01", periods=5)
+    b = a[2:]
+    cal = build_calendar([b, a])
+    assert cal.equals(pd.DatetimeIndex(a, name="Date"))
+    assert build_calendar([a, b], how="intersection").equals(
+        pd.DatetimeIndex(b, name="Date")
+    )
+
+    s = {"A": pd.Series(1.0, index=a), "B": pd.Series(2.0, index=b)}
+    arr = align_columns(s, cal, ["A", "B", "C"])
+    assert arr.shape == (5, 3)
+    assert np.isnan(arr[:2, 1]).all() and (arr[2:, 1] == 2).all()
+    assert np.isnan(arr[:, 2]).all()
+
+    filled = align_columns(s, cal, ["B"], fill_value=0.0)
+    assert (filled[:2, 0] == 0).all()
+
+
+def test_backtest_with_mid_sample_listing():
+    idx = pd.bdate_range("2024-01-01", periods=40)
+    data = {"OLD": _ohlc(idx), "IPO": _ohlc(idx[20:], start=50.0)}
+    sigs = {t: pd.Series(1, index=df.index) for t, df in data.items()}
+    vix = pd.Series(15.0, index=idx)
+
+    equity, fills = backtest_with_atr(
+        {"signals_dict": sigs},
+        data,
+        start_equity=100_000,
+        risk_pct=0.01,
+        atr_window=2,
+        stop_mult=99,
+        return_fills=True,
+        vix_series=vix,
+    )
+    assert equity.index.equals(pd.DatetimeIndex(idx, name="Date"))
+    assert set(fills["symbol"]) == {"OLD", "IPO"}
+    ipo = fills.set_index("symbol").loc["IPO"]
+    assert ipo["open_time"] >= idx[20]
+    assert equity.iloc[-1] > 100_000  # both legs trend up
+
+
+def test_simple_long_only_uses_union_calendar():
+    idx = pd.bdate_range("2024-01-01", periods=6)
+    data = {"A": _ohlc(idx[3:]), "B": _ohlc(idx, start=10.0)}
+    sigs = {"A": pd.Series(1, index=idx[3:]), "B": pd.Series(0, index=idx)}
+
+    equity, daily = _simulate_simple_long_only(1.0, ["A", "B"], data, sigs)
+    assert equity.index.equals(pd.DatetimeIndex(idx, name="Date"))
+    assert (daily.iloc[:4] == 0).all()
+    assert np.isclose(daily.iloc[4], 101 / 100 - 1)
@@ -1,6 +1,11 @@
+import numpy as np
 import pandas as pd
 
-from tradingbot.signals.cross_sectional import rank_top_n_df
+from tradingbot.signals.cross_sectional import (
+    compute_return_matrix,
+    rank_top_n_df,
+    select_top_n,
+)
 
 
 def test_rank_top_n_df_basic():
@@ -21,3 +26,55 @@ def test_rank_top_n_df_basic():
     bottom1 = rank_top_n_df(data, n=1, highest=False)
     assert bottom1.loc["2023-01-01", "StockC"] == 1
     assert bottom1.loc["2023-01-02", "StockC"] == 1
+
+
+def test_select_top_n_exact_under_ties():
+    data = pd.DataFrame(
+        {
+            "StockA": [0.0, 0.02, np.nan],
+            "StockB": [0.0, 0.02, 0.01],
+            "StockC": [0.0, 0.05, np.nan],
+            "StockD": [0.0, -0.01, np.nan],
+        },
+        index=pd.to_datetime(["2023-01-02", "2023-01-03", "2023-01-04"]),
+    )
+    # dense ranking picks all four tied names on the first date
+    assert rank_top_n_df(data, n=2).iloc[0].sum() == 4
+
+    sel = select_top_n(data, n=2)
+    dense = sel.to_dense()
+    assert dense.iloc[0].tolist() == [1, 1, 0, 0]  # ties: earliest tickers
+    assert dense.iloc[1].tolist() == [1, 0, 1, 0]
+    assert dense.iloc[2].tolist() == [0, 1, 0, 0]  # NaN is never picked
+    assert sel.indptr.tolist() == [0, 2, 4, 5]
+
+    rows, cols = sel.pairs()
+    assert list(zip(rows, cols)) == [(0, 0), (0, 1), (1, 0), (1, 2), (2, 1)]
+    np.testing.assert_array_equal(sel.to_csr().toarray(), dense.to_numpy())
+
+    bottom = select_top_n(data, n=1, highest=False).to_dense()
+    assert bottom.iloc[1].tolist() == [0, 0, 0, 1]
+
+
+def test_select_top_n_matches_rank_without_ties():
+    data = pd.DataFrame(np.random.default_rng(0).normal(size=(50, 12)))
+    for highest in (True, False):
+        pd.testing.assert_frame_equal(
+            select_top_n(data, 3, highest).to_dense(),
+            rank_top_n_df(data, 3, highest),
+        )
+
+
+def test_return_matrix_keeps_warm_up_nan_on_request():
+    dates = pd.bdate_range("2023-01-02", periods=6)
+    close = pd.DataFrame({"Close": [10.0, 11.0, 12.0, 13.0, 14.0, 15.0]}, dates)
+    late = close.copy()
+    late.iloc[:3] = np.nan  # listed on the fourth day
+    for data in ({"A": close, "B": late}, {"A": close, "B": late.iloc[3:]}):
+        raw = compute_return_matrix(data, window=2, fill_value=None)
+        assert raw["A"].isna().sum() == 2 and raw["B"].isna().sum() == 5
+        filled = compute_return_matrix(data, window=2)
+        pd.testing.assert_frame_equal(filled, raw.fillna(0.0))
+        picks = select_top_n(raw, n=2).to_dense()
+        assert picks.iloc[:2].to_numpy().sum() == 0
+        assert picks["B"].iloc[:5].sum() == 0 and picks["B"].iloc[5] == 1
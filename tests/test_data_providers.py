@@ -0,0 +1,98 @@
+# File: tests/test_data_providers.py
+
+import gc
+import weakref
+
+import pandas as pd
+import pytest
+
+from tradingbot.data import providers
+from tradingbot.data import yfinance_downloader as ydl
+from tradingbot.data.providers import (
+    SyntheticProvider,
+    get_provider,
+    set_provider,
+    synthetic_universe,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_provider():
+    yield
+    set_provider(None)
+
+
+def test_synthetic_is_deterministic_and_window_independent():
+    a = SyntheticProvider(seed=7).fetch("SYN0001", "2020-01-01", "2021-01-01")
+    b = SyntheticProvider(seed=7).fetch("SYN0001", "2019-01-01", "2022-01-01")
+    c = SyntheticProvider(seed=8).fetch("SYN0001", "2020-01-01", "2021-01-01")
+
+    pd.testing.assert_frame_equal(a, b.loc[a.index])
+    assert not a["Close"].equals(c["Close"])
+    assert a.index.min() >= pd.Timestamp("2020-01-01")
+    assert a.index.max() < pd.Timestamp("2021-01-01")
+    assert (a["High"] >= a[["Open", "Close"]].max(axis=1)).all()
+    assert (a["Low"] <= a[["Open", "Close"]].min(axis=1)).all()
+
+
+def test_synthetic_benchmarks_look_plausible():
+    p = SyntheticProvider()
+    spy = p.fetch("SPY", "2015-01-01", "2020-01-01")["Close"]
+    vix = p.fetch("^VIX", "2015-01-01", "2020-01-01")["Close"]
+    assert spy.gt(0).all() and vix.between(2, 200).all()
+    # turbulent regimes push both vol and the VIX proxy up together
+    rv = spy.pct_change().rolling(21).std()
+    assert rv.corr(vix) > 0.3
+
+
+def test_download_uses_synthetic_cache_offline(monkeypatch, tmp_path):
+    monkeypatch.setattr(ydl, "CACHE_DIR", tmp_path)
+    set_provider("synthetic")
+    tickers = synthetic_universe(3)
+
+    df = ydl.download_stock_data(tickers[0], start="2022-01-01", end="2023-01-01")
+    assert len(df) > 200
+    assert (tmp_path / "synthetic" / "seed42" / f"{tickers[0]}.parquet").exists()
+    assert not (tmp_path / f"{tickers[0]}.parquet").exists()
+
+
+def test_synthetic_cache_is_per_seed(monkeypatch, tmp_path):
+    monkeypatch.setattr(ydl, "CACHE_DIR", tmp_path)
+    kw = dict(start="2022-01-01", end="2022-07-01")
+    set_provider(SyntheticProvider(seed=1))
+    one = ydl.download_stock_data("T001", **kw)
+    set_provider(SyntheticProvider(seed=2))
+    two = ydl.download_stock_data("T001", **kw)
+
+    fresh = SyntheticProvider(seed=2).fetch("T001", kw["start"], kw["end"])
+    pd.testing.assert_frame_equal(two, fresh, check_freq=False, check_names=False)
+    assert not two["Close"].equals(one["Close"])
+    assert (tmp_path / "synthetic" / "seed1" / "T001.parquet").exists()
+
+
+def test_provider_from_env(monkeypatch):
+    monkeypatch.setenv("TRADINGBOT_DATA_PROVIDER", "synthetic")
+    monkeypatch.setenv("TRADINGBOT_DATA_SEED", "5")
+    providers._configured.cache_clear()
+    p = get_provider()
+    assert p.name == "synthetic" and p.seed == 5
+
+    monkeypatch.delenv("TRADINGBOT_DATA_PROVIDER")
+    set_provider(None)
+    assert get_provider().name == "yfinance"
+
+    with pytest.raises(ValueError):
+        set_provider("nope")
+
+
+def test_synthetic_market_cache_does_not_pin_providers():
+    a = SyntheticProvider(seed=1).fetch("AAA", "2020-01-01", "2020-06-30")
+    b = SyntheticProvider(seed=2).fetch("AAA", "2020-01-01", "2020-06-30")
+    assert not a.equals(b)  # seeds never share a cached market path
+
+    provider = SyntheticProvider(seed=3)
+    provider.fetch("AAA", "2020-01-01", "2020-06-30")
+    ref = weakref.ref(provider)
+    del provider
+    gc.collect()
+    assert ref() is None
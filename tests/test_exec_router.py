@@ -67,3 +67,38 @@ def test_router_monkeypatch(monkeypatch, tmp_path):
     assert hasattr(ex.client, "api")
     assert hasattr(ex.client.api, "orders")
     assert len(ex.client.api.orders) == 1  # type: ignore
+
+
+def _bars(base: float, days: int = 20) -> pd.DataFrame:
+    idx = pd.date_range("2025-06-01", periods=days, freq="D")
+    close = [base * (1 + 0.01 * (i % 3)) for i in range(days)]
+    return pd.DataFrame(
+        {
+            "Close": close,
+            "High": [c * 1.02 for c in close],
+            "Low": [c * 0.98 for c in close],
+        },
+        index=idx,
+    )
+
+
+@pytest.mark.skipif(not EXEC_AVAILABLE, reason="Alpaca dependency not available")
+def test_router_keeps_atr_state_per_symbol(monkeypatch, tmp_path):
+    monkeypatch.setattr("tradingbot.exec.order_router.AlpacaClient", DummyAlpacaClient)
+    monkeypatch.setattr("tradingbot.exec.order_router.LOG_PATH", tmp_path / "log.csv")
+    data = {"CHEAP": _bars(10.0), "DEAR": _bars(1000.0)}
+    signals = {t: pd.Series([0] * 19 + [1], index=df.index) for t, df in data.items()}
+
+    ex = DailySignalExecutor(tmp_path / "state.json")  # type: ignore
+    saves = []
+    monkeypatch.setattr(ex.state, "save", lambda: saves.append(1))
+    ex.run_daily(data, signals)
+
+    atr = {t: ex.state.advance(t, df)["atr"].value for t, df in data.items()}
+    assert atr["DEAR"] == pytest.approx(100 * atr["CHEAP"])
+    qty = dict((s, q) for s, q, _ in ex.client.api.orders)  # type: ignore
+    assert qty["CHEAP"] > qty["DEAR"]
+    assert saves == [1]  # one save per run, not per symbol
+
+    with pytest.raises(ValueError, match="symbol"):
+        ex.execute(_bars(50.0), signals["CHEAP"])  # unnamed frame
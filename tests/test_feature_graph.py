@@ -0,0 +1,73 @@
+# File: tests/test_feature_graph.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingbot.data.panel import PricePanel
+from tradingbot.data.providers import SyntheticProvider
+from tradingbot.features import graph as fg
+from tradingbot.features import panel_features as pf
+from tradingbot.strategy.runner import run_strategies, run_strategy
+
+
+def _panel():
+    provider = SyntheticProvider(seed=5)
+    frames = {t: provider.fetch(t, "2020-01-01", "2021-12-31") for t in "ABC"}
+    return frames, PricePanel.from_frames(frames)
+
+
+def test_identical_nodes_are_shared():
+    graph = fg.FeatureGraph()
+    graph.request(fg.vol_adj_momentum(21), fg.cumulative_return(21))
+    graph.request(fg.rolling_zscore(20), fg.atr(14), fg.cumulative_return(21))
+    ops = [n.op for n in graph.nodes()]
+    assert ops.count("field") == 3  # Close, High, Low once each
+    assert ops.count("cumulative_return") == 1
+    assert len(graph.nodes()) == len(set(graph.nodes()))
+
+
+def test_values_match_panel_features_and_memory_is_released():
+    _, panel = _panel()
+    close = panel.fields["Close"]
+    graph = fg.FeatureGraph()
+    wanted = [fg.vol_adj_momentum(21), fg.cumulative_return(21), fg.atr(14)]
+    graph.request(*wanted)
+    run = graph.evaluate(panel.fields)
+
+    np.testing.assert_array_equal(
+        run.get(wanted[0]), pf.vol_adj_momentum(close, 21), strict=True
+    )
+    np.testing.assert_array_equal(run.get(wanted[1]), pf.cumulative_return(close, 21))
+    np.testing.assert_array_equal(
+        run.get(wanted[2]),
+        pf.atr(panel.fields["High"], panel.fields["Low"], close, 14),
+    )
+    assert run.computed == len(graph.nodes())  # nothing evaluated twice
+    # only the requested outputs survive their consumers
+    assert set(run.values) == set(wanted)
+
+    run.release_all(wanted)
+    assert not run.values
+    with pytest.raises(KeyError):
+        run.get(fg.rolling_zscore(5))
+
+
+def test_run_strategies_matches_run_strategy():
+    frames, _ = _panel()
+    frames["LATE"] = frames["A"].iloc[30:]
+    dates = pd.bdate_range("2019-01-01", "2022-01-31")
+    rng = np.random.default_rng(0)
+    vix = pd.Series(rng.uniform(10, 40, len(dates)), index=dates)
+    spy = pd.Series(300 * np.exp(rng.normal(0, 0.01, len(dates)).cumsum()), dates)
+    configs = [
+        {"signals": ["momentum"]},
+        {"signals": ["momentum", "mean_reversion"]},
+        {"signals": ["momentum"], "cross_sectional": True, "top_n": 2},
+    ]
+    together = run_strategies(configs, frames, spy, vix)
+    for cfg, signals in zip(configs, together):
+        alone = run_strategy(cfg, frames, spy, vix)
+        assert list(alone) == list(signals) == list(frames)
+        for ticker in alone:
+            pd.testing.assert_series_equal(signals[ticker], alone[ticker])
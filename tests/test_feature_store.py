@@ -0,0 +1,96 @@
+# File: tests/test_feature_store.py
+
+import pandas as pd
+import pytest
+
+from tradingbot.data import cache_manifest
+from tradingbot.data.providers import SyntheticProvider
+from tradingbot.features import base_features
+from tradingbot.features.store import FeatureStore, set_feature_store
+from tradingbot.features.ta_indicators import add_technical_indicators
+from tradingbot.risk.atr import calc_atr
+from tradingbot.signals.mean_reversion import generate_mr_signal
+from tradingbot.signals.momentum import generate_mom_signal
+
+
+@pytest.fixture
+def bars():
+    return SyntheticProvider(seed=1).fetch("SYN0001", "2019-01-01", "2021-01-01")
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = FeatureStore(tmp_path)
+    set_feature_store(s)
+    yield s
+    set_feature_store(None)
+
+
+def test_results_are_cached_in_memory_and_on_disk(store, bars, tmp_path):
+    first = calc_atr(bars, window=14)
+    again = calc_atr(bars, window=14)
+    assert (store.misses, store.hits) == (1, 1)
+    pd.testing.assert_series_equal(first, again)
+    pd.testing.assert_series_equal(first, calc_atr.compute(bars, window=14))
+
+    # A fresh process-level store is served from the parquet files
+    cold = FeatureStore(tmp_path)
+    set_feature_store(cold)
+    pd.testing.assert_series_equal(calc_atr(bars, window=14), first, check_freq=False)
+    assert (cold.misses, cold.hits) == (0, 1)
+
+
+def test_key_tracks_params_and_data(store, bars):
+    calc_atr(bars, window=14)
+    calc_atr(bars, window=10)
+    bumped = bars.copy()
+    bumped.iloc[-1, bumped.columns.get_loc("Close")] += 1.0
+    calc_atr(bumped, window=14)
+    calc_atr(bars.assign(Volume=0.0), window=14)  # unused column → same key
+    assert (store.misses, store.hits) == (3, 1)
+
+
+def test_signals_are_unchanged_through_the_store(store, bars):
+    set_feature_store(False)
+    mr, mom = generate_mr_signal(bars), generate_mom_signal(bars)
+    ta_cols = add_technical_indicators(bars)
+    set_feature_store(store)
+
+    for _ in range(2):
+        pd.testing.assert_series_equal(generate_mr_signal(bars), mr)
+        pd.testing.assert_series_equal(generate_mom_signal(bars), mom)
+        pd.testing.assert_frame_equal(add_technical_indicators(bars), ta_cols)
+    assert store.hits >= 3
+
+
+def test_cached_result_can_be_mutated_safely(store, bars):
+    z = base_features.compute_rolling_zscore(bars["Close"], 20)
+    z[:] = 0.0
+    assert base_features.compute_rolling_zscore(bars["Close"], 20).abs().sum() > 0
+
+
+def test_disk_layer_is_capped_and_skipped_by_manifest_verify(bars, tmp_path):
+    root = tmp_path / "features"
+    store = FeatureStore(root, memory_items=1)
+    set_feature_store(store)
+    try:
+        calc_atr(bars, window=14)
+        size = next(root.glob("*/*.parquet")).stat().st_size
+        store.max_bytes = 3 * size
+        for day in range(8):  # a new daily bar each time → a new key
+            calc_atr(bars.iloc[: len(bars) - 8 + day], window=14)
+            calc_atr(bars, window=14)  # hot entry keeps being read
+    finally:
+        set_feature_store(None)
+
+    files = list(root.glob("*/*.parquet"))
+    assert 1 < len(files) <= 3
+    assert sum(fp.stat().st_size for fp in files) <= 3 * size * 1.1
+    cold = FeatureStore(root)  # the hot entry survived eviction
+    set_feature_store(cold)
+    try:
+        calc_atr(bars, window=14)
+    finally:
+        set_feature_store(None)
+    assert cold.hits == 1
+    assert cache_manifest.verify(tmp_path)["unindexed"] == []
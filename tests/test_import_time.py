@@ -0,0 +1,59 @@
+# File: tests/test_import_time.py
+"""Guard against import-time side effects creeping back into the package."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Generous for slow CI runners; a bare import is ~0.1 s when nothing heavy loads
+IMPORT_BUDGET_S = 1.0
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {modules}
+elapsed = time.perf_counter() - t0
+heavy = [m for m in ("vectorbt", "yfinance", "alpaca") if m in sys.modules]
+print(json.dumps({"elapsed": elapsed, "heavy": heavy}))
+"""
+
+
+def _probe(cwd, modules="tradingbot"):
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.replace("{modules}", modules)],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout)
+
+
+def test_import_has_no_heavy_deps_or_side_effects(tmp_path):
+    modules = (
+        "tradingbot, tradingbot.config, tradingbot.backtest, "
+        "tradingbot.risk.spy_hedge, tradingbot.data.yfinance_downloader"
+    )
+    res = _probe(tmp_path, modules)
+    assert res["heavy"] == []
+    assert not (tmp_path / "data").exists()  # no cache dir created on import
+
+
+def test_import_time_budget(tmp_path):
+    # best of three to ignore a cold page cache
+    elapsed = min(_probe(tmp_path)["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_S, f"import tradingbot took {elapsed:.2f}s"
+
+
+def test_lazy_attributes_resolve():
+    import tradingbot
+    from tradingbot.config import strategies
+
+    assert callable(tradingbot.grid_search_batch)
+    assert isinstance(strategies, list)
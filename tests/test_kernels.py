@@ -0,0 +1,109 @@
+# File: tests/test_kernels.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingbot import kernels
+from tradingbot.risk.vix_filter import throttle_risk_pct, throttle_risk_series
+
+
+def _paths(kernel, *args):
+    """Outputs of the NumPy path, the plain loop and (if numba) the JIT loop."""
+    runs = [kernel.numpy(*args), kernel.py_func(*args)]
+    if kernels.numba_available():
+        runs.append(kernel.jit(*args))
+    return [r if isinstance(r, tuple) else (r,) for r in runs]
+
+
+def _assert_identical(kernel, *args):
+    ref, *others = _paths(kernel, *args)
+    for out in others:
+        for a, b in zip(ref, out):
+            assert np.array_equal(a, b, equal_nan=True)
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(3)
+    x = 50 + rng.normal(size=(300, 6)).cumsum(axis=0)
+    x[40:45, 1] = np.nan  # missing bars
+    x[:30, 2] = np.nan  # late listing
+    x[100:130, 3] = x[100, 3]  # flat stretch
+    return x
+
+
+def test_rolling_zscore_parity(prices):
+    _assert_identical(kernels.rolling_zscore, prices, 20)
+    ref = pd.DataFrame(prices)
+    ref = ((ref - ref.rolling(20).mean()) / ref.rolling(20).std()).to_numpy()
+    np.testing.assert_allclose(
+        kernels.rolling_zscore(prices, 20), ref, rtol=1e-8, atol=1e-9
+    )
+
+
+def test_mr_hold_signal_parity():
+    z = np.random.default_rng(4).normal(size=(400, 3))
+    z[10:20, 0] = np.nan
+    _assert_identical(kernels.mr_hold_signal, z, -0.5, 0.0)
+    pos = kernels.mr_hold_signal(
+        np.array([[0.1], [-1.0], [-0.2], [0.3], [-0.2]]), -0.5, 0.0
+    )
+    assert pos[:, 0].tolist() == [0, 1, 1, 0, 0]
+
+
+def test_equal_weight_long_only_parity(prices):
+    sig = (np.random.default_rng(5).random(prices.shape) > 0.4).astype(float)
+    _assert_identical(kernels.equal_weight_long_only, np.abs(prices), sig)
+
+
+def test_atr_stop_backtest_parity(prices):
+    rng = np.random.default_rng(6)
+    close = np.abs(prices)
+    valid = np.isfinite(close)
+    mark = pd.DataFrame(close).ffill().to_numpy()
+    atr = np.abs(rng.normal(1.0, 0.3, close.shape))
+    sig = rng.choice([-1.0, 0.0, 1.0], close.shape, p=[0.1, 0.6, 0.3])
+    entry_order = np.array([3, 0, 5, 1, 2, 4], dtype=np.intp)
+    risk = np.where(np.arange(len(close)) % 50 < 10, 0.0015, 0.003)
+    args = (close, atr, valid, mark, sig, entry_order, risk, 1e6, 2.0)
+    _assert_identical(kernels.atr_stop_backtest, *args)
+    equity, fills = kernels.atr_stop_backtest(*args)
+    assert len(fills) > 0 and np.isfinite(equity).all()
+
+
+def test_atr_stop_events_matches_dense(prices):
+    rng = np.random.default_rng(7)
+    close = np.abs(prices)
+    valid = np.isfinite(close)
+    mark = pd.DataFrame(close).ffill().to_numpy()
+    atr = np.abs(rng.normal(1.0, 0.3, close.shape))
+    sig = rng.choice([-1.0, 0.0, 1.0], close.shape, p=[0.02, 0.9, 0.08])
+    sig = pd.DataFrame(sig).replace(0.0, np.nan).ffill(limit=8).fillna(0.0)
+    sig = sig.to_numpy()
+    day, tick = np.nonzero(np.diff(sig, axis=0, prepend=0.0))
+    entry_order = np.array([3, 0, 5, 1, 2], dtype=np.intp)  # column 4 never enters
+    risk = np.full(len(close), 0.003)
+    rest = (entry_order, risk, 1e6, 2.0)
+    events = (day, tick, sig[day, tick])
+    _assert_identical(kernels.atr_stop_events, close, atr, valid, mark, *events, *rest)
+    expected = kernels.atr_stop_backtest(close, atr, valid, mark, sig, *rest)
+    result = kernels.atr_stop_events(close, atr, valid, mark, *events, *rest)
+    for a, b in zip(expected, result):
+        assert np.array_equal(a, b)
+    assert len(result[1]) > 0
+
+
+def test_throttle_risk_series_matches_scalar():
+    vix = pd.Series(
+        [15.0, 25.0, np.nan, 35.0], index=pd.bdate_range("2024-01-01", periods=4)
+    )
+    dates = pd.bdate_range("2023-12-28", periods=8)
+    expected = [throttle_risk_pct(0.01, d, vix_series=vix) for d in dates]
+    np.testing.assert_allclose(throttle_risk_series(0.01, dates, vix), expected)
+
+
+@pytest.mark.parametrize("window", [0, 7])
+def test_percentile_rank_parity(window):
+    codes = np.random.default_rng(6).integers(0, 12, size=200)  # 0 = NaN
+    _assert_identical(kernels.percentile_rank, codes, 11, window, 1)
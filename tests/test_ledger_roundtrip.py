@@ -19,6 +19,7 @@ def test_long_short_roundtrip():
         }
     )
     price_data = {"FOO": df}
+    calm_vix = pd.Series(15.0, index=idx)  # no VIX risk throttle
 
     # Test 1: Long-only signal (should lose money on 50% drop)
     long_sig = pd.Series([+1, 0], index=idx)
@@ -31,6 +32,7 @@ def test_long_short_roundtrip():
         risk_pct=0.01,  # 1% per trade
         atr_window=1,
         stop_mult=99,  # huge stop so it never hits
+        vix_series=calm_vix,
     )
 
     # Test 2: Short-only signal (should make money on 50% drop)
@@ -44,6 +46,7 @@ def test_long_short_roundtrip():
         risk_pct=0.01,  # 1% per trade
         atr_window=1,
         stop_mult=99,  # huge stop so it never hits
+        vix_series=calm_vix,
     )
 
     print(f"Long equity: {long_equity.tolist()}")
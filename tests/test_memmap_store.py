@@ -0,0 +1,59 @@
+# File: tests/test_memmap_store.py
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingbot.data import memmap_store
+from tradingbot.data.memmap_store import export_memmap, open_memmap_panel
+from tradingbot.data.panel import PricePanel
+
+
+def test_memmap_roundtrip_is_read_only_view(tmp_path):
+    idx = pd.bdate_range("2022-01-03", periods=50, name="Date")
+    rng = np.random.default_rng(0)
+    frames = {
+        t: pd.DataFrame(
+            {f: rng.random(len(idx)) for f in ["Open", "High", "Low", "Close"]},
+            index=idx,
+        )
+        for t in ["AAA", "BBB", "CCC"]
+    }
+    panel = PricePanel.from_frames(frames)
+    export_memmap(panel, tmp_path / "mm")
+
+    mapped = open_memmap_panel(tmp_path / "mm", fields=["Close", "High"])
+    assert isinstance(mapped["Close"], np.memmap)
+    assert mapped.tickers == panel.tickers
+    pd.testing.assert_index_equal(mapped.dates, panel.dates, check_exact=True)
+    np.testing.assert_array_equal(mapped["Close"], panel["Close"])
+
+    with pytest.raises(ValueError):
+        mapped["Close"][0, 0] = 1.0
+
+    # Per-ticker frames share the mapping instead of copying it
+    bbb = mapped.ticker_frame("BBB")
+    assert np.shares_memory(bbb["Close"].to_numpy(), mapped["Close"])
+
+    with pytest.raises(KeyError):
+        open_memmap_panel(tmp_path / "mm", fields=["Adj Close"])
+
+
+def test_reexport_invalidates_index_until_complete(tmp_path, monkeypatch):
+    idx = pd.bdate_range("2022-01-03", periods=10, name="Date")
+    frame = pd.DataFrame({"Close": np.arange(10.0)}, index=idx)
+    panel = PricePanel.from_frames({"AAA": frame, "BBB": frame * 2})
+    export_memmap(panel, tmp_path / "mm", dtype=np.float32)
+    index = json.loads((tmp_path / "mm" / "index.json").read_text())
+    assert index["dtypes"] == {"Close": "<f4"}
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(memmap_store.np, "save", fail)  # dies after the fields
+    with pytest.raises(OSError):
+        export_memmap(panel, tmp_path / "mm")
+    with pytest.raises(FileNotFoundError):
+        open_memmap_panel(tmp_path / "mm")
@@ -0,0 +1,128 @@
+# File: tests/test_online_indicators.py
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from tradingbot.data.providers import SyntheticProvider
+from tradingbot.features import online
+from tradingbot.features.base_features import compute_rolling_zscore
+from tradingbot.features.momentum_features import (
+    compute_cumulative_return,
+    compute_vol_adj_momentum,
+)
+from tradingbot.features.ta_indicators import _ta_columns
+from tradingbot.features.vol_regime import compute_regime
+from tradingbot.risk.atr import calc_atr
+from tradingbot.risk.position_sizer import atr_position_size, atr_position_size_at
+
+
+def _bars():
+    df = SyntheticProvider(seed=11).fetch("XYZ", "2019-01-01", "2020-12-31")
+    df.iloc[:3] = np.nan  # pre-listing rows
+    df.iloc[200:202] = np.nan  # missing bars
+    df.iloc[300:330, df.columns.get_loc("Close")] = df["Close"].iloc[299]  # flat
+    return df
+
+
+def _indicators():
+    return {
+        "z": online.RollingStats(20),
+        "cum": online.CumulativeReturn(21),
+        "mom": online.VolAdjMomentum(21),
+        "atr": online.OnlineATR(14),
+        "rsi": online.OnlineRSI(),
+        "macd": online.OnlineMACD(),
+    }
+
+
+def test_streamed_values_match_batch_functions():
+    df = _bars()
+    ta_cols = _ta_columns.compute(df)
+    batch = {
+        "z": compute_rolling_zscore.compute(df["Close"], 20),
+        "cum": compute_cumulative_return.compute(df, 21),
+        "mom": compute_vol_adj_momentum.compute(df, 21),
+        "atr": calc_atr.compute(df, 14),
+        "rsi": ta_cols["rsi_14"],
+        "macd": ta_cols["macd_diff"],
+    }
+    inds = _indicators()
+    got = {k: [] for k in inds}
+    for i, bar in enumerate(df.to_dict("records")):
+        if i == 250:  # state survives a JSON round trip mid-stream
+            inds = {
+                k: online.from_dict(json.loads(json.dumps(v.to_dict())))
+                for k, v in inds.items()
+            }
+        for k, ind in inds.items():
+            ind.update(bar)
+            got[k].append(ind.value)
+
+    for k, ref in batch.items():
+        ref = ref.to_numpy()
+        if k == "atr":  # the batch ATR back-fills NaN rows from later bars
+            keep = ~np.isnan(np.array(got[k]))
+            ref, got[k] = ref[keep], np.array(got[k])[keep]
+        np.testing.assert_allclose(got[k], ref, rtol=1e-9, atol=1e-10, err_msg=k)
+
+
+def test_online_state_feeds_only_new_bars(tmp_path):
+    df = _bars().iloc[10:]
+    path = tmp_path / "state.json"
+    state = online.OnlineState(path, _indicators)
+    state.advance("XYZ", df.iloc[:-1])
+    state.save()
+
+    resumed = online.OnlineState(path, _indicators)
+    inds = resumed.advance("XYZ", df)  # only the last row is new
+    full = online.OnlineState(None, _indicators).advance("XYZ", df)
+    for k in inds:
+        np.testing.assert_allclose(inds[k].value, full[k].value, rtol=1e-12)
+    assert inds["cum"].seen == len(df)
+
+
+def test_position_size_from_streamed_atr():
+    df = _bars().iloc[10:]
+    atr = online.OnlineState(None, lambda: {"atr": online.OnlineATR()})
+    value = atr.advance("XYZ", df)["atr"].value
+    expected = atr_position_size(df).iloc[-1]
+    assert atr_position_size_at(df["Close"].iloc[-1], value) == expected
+    assert atr_position_size_at(100.0, float("nan")) == 0
+    assert isinstance(pd.Timestamp(atr._tickers["XYZ"]["last"]), pd.Timestamp)
+
+
+def test_streamed_regime_matches_causal_compute_regime():
+    rng = np.random.default_rng(8)
+    dates = pd.bdate_range("2018-01-01", periods=400)
+    vix = pd.Series(np.round(rng.uniform(10, 40, 400), 1), index=dates, name="VIX")
+    vol = pd.Series(rng.uniform(0.05, 0.4, 400), index=dates, name="SPY_vol")
+    vol.iloc[:20] = np.nan
+    for window in (None, 60):
+        batch = compute_regime(vix, vol, causal=True, window=window)
+        regime = online.OnlineRegime(window)
+        streamed = {}
+        for day, row in pd.concat([vix, vol], axis=1).iterrows():
+            if day == dates[200]:
+                regime = online.from_dict(json.loads(json.dumps(regime.to_dict())))
+            streamed[day] = regime.update(row)
+        assert pd.Series(streamed).loc[batch.index].equals(batch)
+
+
+def test_revised_history_rebuilds_state(tmp_path):
+    df = _bars()
+    path = tmp_path / "state.json"
+    state = online.OnlineState(path, lambda: {"atr": online.OnlineATR()})
+    state.advance("XYZ", df.iloc[:-1])
+    state.save()
+
+    # A 2:1 split re-adjusts every past bar but keeps the dates
+    adjusted = df.copy()
+    adjusted[["Open", "High", "Low", "Close"]] /= 2
+    resumed = online.OnlineState(path, lambda: {"atr": online.OnlineATR()})
+    value = resumed.advance("XYZ", adjusted)["atr"].value
+    expected = online.OnlineState(None, lambda: {"atr": online.OnlineATR()})
+    np.testing.assert_allclose(
+        value, expected.advance("XYZ", adjusted)["atr"].value, rtol=1e-12
+    )
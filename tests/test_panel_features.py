@@ -0,0 +1,172 @@
+# File: tests/test_panel_features.py
+
+import numpy as np
+import pandas as pd
+
+from tradingbot.data.providers import SyntheticProvider
+from tradingbot.features import panel_features as pf
+
+
+def _reference(df: pd.DataFrame, w: int) -> dict[str, pd.Series]:
+    """Plain pandas versions of the single-ticker features."""
+    close = df["Close"]
+    z = (close - close.rolling(w).mean()) / close.rolling(w).std()
+    rets = close.ffill().pct_change().fillna(0)
+    cum = (1 + rets).rolling(w).apply(np.prod, raw=True) - 1
+    mom = cum / rets.rolling(w).std().replace(0, np.nan)
+    prev = close.shift(1)
+    tr = pd.concat(
+        [df["High"] - df["Low"], (df["High"] - prev).abs(), (df["Low"] - prev).abs()],
+        axis=1,
+    ).max(axis=1)
+    atr = tr.rolling(w).mean().bfill()
+    return {"zscore": z, "cum": cum, "mom": mom, "atr": atr}
+
+
+def _panel(n=4):
+    p = SyntheticProvider(seed=5)
+    frames = {f"T{i}": p.fetch(f"T{i}", "2020-01-01", "2021-06-30") for i in range(n)}
+    frames["T1"].iloc[50:54] = np.nan  # gap inside one ticker only
+    return frames
+
+
+def test_panel_matches_pandas_per_ticker():
+    frames = _panel()
+    field = {
+        f: np.column_stack([d[f].to_numpy() for d in frames.values()])
+        for f in ("High", "Low", "Close")
+    }
+    w = 10
+    got = {
+        "zscore": pf.rolling_zscore(field["Close"], w),
+        "cum": pf.cumulative_return(field["Close"], w),
+        "mom": pf.vol_adj_momentum(field["Close"], w),
+        "atr": pf.atr(field["High"], field["Low"], field["Close"], w),
+    }
+    for j, df in enumerate(frames.values()):
+        ref = _reference(df, w)
+        for name, arr in got.items():
+            np.testing.assert_allclose(
+                arr[:, j], ref[name].to_numpy(), rtol=1e-8, atol=1e-10, err_msg=name
+            )
+
+
+def test_single_ticker_wrappers_use_panel_engine():
+    from tradingbot.features.base_features import compute_rolling_zscore
+    from tradingbot.features.momentum_features import (
+        compute_cumulative_return,
+        compute_vol_adj_momentum,
+    )
+    from tradingbot.risk.atr import calc_atr
+
+    df = _panel(2)["T1"]
+    ref = _reference(df, 14)
+    pd.testing.assert_series_equal(
+        compute_rolling_zscore.compute(df["Close"], 14), ref["zscore"], rtol=1e-8
+    )
+    # Named after the input column, like the pandas versions
+    pd.testing.assert_series_equal(
+        compute_cumulative_return.compute(df, 14), ref["cum"], rtol=1e-8
+    )
+    pd.testing.assert_series_equal(
+        compute_vol_adj_momentum.compute(df, 14), ref["mom"], rtol=1e-8
+    )
+    np.testing.assert_allclose(calc_atr.compute(df, 14), ref["atr"], rtol=1e-8)
+
+
+def test_short_history_is_all_nan():
+    x = np.arange(5.0)
+    assert np.isnan(pf.rolling_zscore(x, 10)).all()
+    assert np.isnan(pf.cumulative_return(x, 10)).all()
+
+
+def test_multi_window_matches_single_window():
+    frames = _panel()
+    close = np.column_stack([d["Close"].to_numpy() for d in frames.values()])
+    windows = [5, 10, 21]
+    z = pf.rolling_zscore_multi(close, windows)
+    mom = pf.vol_adj_momentum_multi(close, windows)
+    assert z.shape == (3,) + close.shape
+    for k, w in enumerate(windows):
+        np.testing.assert_allclose(z[k], pf.rolling_zscore(close, w), atol=1e-8)
+        np.testing.assert_allclose(mom[k], pf.vol_adj_momentum(close, w), rtol=1e-8)
+
+
+def test_rolling_moments_flat_window_and_large_level():
+    x = np.r_[np.full(10, 5.0), 1e6 + np.arange(10.0)]
+    m = pf.RollingMoments(x)
+    _, ref = pf.rolling_mean_std(x, 5)  # exact two-pass
+    np.testing.assert_allclose(m.std(5), ref, rtol=1e-9)
+    assert (m.std(5)[4:10, 0] == 0).all()
+    assert np.isnan(m.zscore(5)[4:10, 0]).all()
+
+
+def test_generators_stack_windows():
+    from tradingbot.signals.mean_reversion import generate_mr_signal
+    from tradingbot.signals.momentum import generate_mom_signal
+
+    df = _panel(2)["T0"]
+    mr = generate_mr_signal(df, window=[10, 20])
+    mom = generate_mom_signal(df, window=[5, 21])
+    assert list(mr.columns) == [10, 20] and list(mom.columns) == [5, 21]
+    pd.testing.assert_series_equal(
+        mr[20], generate_mr_signal(df, window=20), check_names=False
+    )
+    pd.testing.assert_series_equal(
+        mom[21], generate_mom_signal(df, window=21), check_names=False
+    )
+
+
+def test_native_ta_indicators_match_ta_library():
+    import ta
+
+    from tradingbot.features.ta_indicators import add_technical_indicators
+
+    df = SyntheticProvider(seed=9).fetch("XYZ", "2019-01-01", "2020-12-31")
+    ref = {
+        "rsi_14": ta.momentum.RSIIndicator(df["Close"], window=14).rsi(),
+        "macd_diff": ta.trend.MACD(df["Close"]).macd_diff(),
+        "atr_14": ta.volatility.AverageTrueRange(
+            df["High"], df["Low"], df["Close"], window=14
+        ).average_true_range(),
+    }
+    out = add_technical_indicators(df)
+    for col, expected in ref.items():
+        np.testing.assert_allclose(out[col], expected, rtol=1e-9, err_msg=col)
+
+    # Panel column of a late listing == the ticker on its own history
+    late = df.iloc[40:]
+    close = np.column_stack([df["Close"], df["Close"].where(df.index >= late.index[0])])
+    high = np.column_stack([df["High"], df["High"].where(df.index >= late.index[0])])
+    low = np.column_stack([df["Low"], df["Low"].where(df.index >= late.index[0])])
+    own = add_technical_indicators(late)
+    np.testing.assert_allclose(pf.rsi(close)[40:, 1], own["rsi_14"], rtol=1e-9)
+    np.testing.assert_allclose(
+        pf.wilder_atr(high, low, close)[40:, 1], own["atr_14"], rtol=1e-9
+    )
+
+
+def test_add_technical_indicators_cleans_csv_style_frames():
+    from tradingbot.features.ta_indicators import add_technical_indicators
+
+    df = SyntheticProvider(seed=9).fetch("XYZ", "2020-01-01", "2020-06-30")
+    messy = df.astype(object)
+    messy.index = messy.index.strftime("%Y-%m-%d")
+    header = pd.DataFrame([["XYZ"] * df.shape[1]], columns=df.columns, index=["Ticker"])
+    messy = pd.concat([header, messy])
+
+    out = add_technical_indicators(messy)
+    clean = add_technical_indicators(df)
+    assert isinstance(out.index, pd.DatetimeIndex) and len(out) == len(df)
+    np.testing.assert_allclose(out["atr_14"], clean["atr_14"])
+
+
+def test_pct_rank_matches_pandas_and_is_causal():
+    x = np.round(np.random.default_rng(7).normal(size=(500, 2)), 1)  # ties
+    x[10:15, 0] = np.nan
+    df = pd.DataFrame(x)
+    for window, ref in [(None, df.expanding()), (30, df.rolling(30))]:
+        got = pf.pct_rank(x, window)
+        np.testing.assert_array_equal(got, ref.rank(pct=True).to_numpy())
+        # appending future values leaves past ranks unchanged
+        np.testing.assert_array_equal(pf.pct_rank(x[:300], window), got[:300])
@@ -0,0 +1,81 @@
+# File: tests/test_price_cache.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingbot.data import yfinance_downloader as ydl
+from tradingbot.data.providers import set_provider
+
+
+@pytest.fixture
+def fake_dl(monkeypatch, tmp_path):
+    """Route the downloader to a tmp cache and a deterministic offline `_dl`."""
+    calls = []
+
+    def _fake(ticker, start, end):
+        calls.append((ticker, start, end))
+        stop = (
+            ydl._now().normalize()
+            if end is None
+            else pd.Timestamp(end) - pd.Timedelta(days=1)
+        )
+        idx = pd.bdate_range(start, stop)
+        px = 100 + np.arange(len(idx), dtype=float)
+        return pd.DataFrame(
+            {"Open": px, "High": px + 1, "Low": px - 1, "Close": px, "Volume": 1e6},
+            index=pd.DatetimeIndex(idx, name="Date"),
+        )
+
+    monkeypatch.setattr(ydl, "_dl", _fake)
+    monkeypatch.setattr(ydl, "CACHE_DIR", tmp_path)
+    set_provider("yfinance")  # cache layout of the default provider
+    yield calls
+    set_provider(None)
+
+
+def test_sub_range_is_served_locally(fake_dl, tmp_path):
+    full = ydl.download_stock_data("AAA", start="2023-01-01", end="2023-12-31")
+    sub = ydl.download_stock_data("AAA", start="2023-03-01", end="2023-06-01")
+
+    assert len(fake_dl) == 1
+    assert sub.index.min() >= pd.Timestamp("2023-03-01")
+    assert sub.index.max() < pd.Timestamp("2023-06-01")
+    pd.testing.assert_frame_equal(
+        sub, full.loc["2023-03-01":"2023-05-31"], check_freq=False
+    )
+    assert [p.name for p in tmp_path.glob("*.parquet")] == ["AAA.parquet"]
+
+
+def test_range_growth_fetches_only_head_and_tail(fake_dl):
+    ydl.download_stock_data("AAA", start="2023-03-01", end="2023-06-01")
+    df = ydl.download_stock_data("AAA", start="2023-01-01", end="2023-09-01")
+
+    assert len(fake_dl) == 3
+    _, head_start, head_end = fake_dl[1]
+    _, tail_start, tail_end = fake_dl[2]
+    assert head_start == "2023-01-01" and head_end <= "2023-03-03"
+    assert tail_start >= "2023-05-31" and tail_end == "2023-09-01"
+    assert df.index.is_monotonic_increasing and df.index.is_unique
+
+    # The widened range is now fully local
+    ydl.download_stock_data("AAA", start="2023-02-01", end="2023-08-01")
+    assert len(fake_dl) == 3
+
+
+def test_latest_series_appends_tail_once_per_day(fake_dl, monkeypatch):
+    monkeypatch.setattr(ydl, "_now", lambda: pd.Timestamp("2024-03-01 09:00"))
+    first = ydl.download_latest("SPY", start="2024-01-01")
+    assert len(fake_dl) == 1
+
+    # Same day: no network at all
+    again = ydl.download_latest("SPY", start="2024-01-15")
+    assert len(fake_dl) == 1
+    assert again.index.min() >= pd.Timestamp("2024-01-15")
+
+    # Next week: only bars from the last cached date onwards are requested
+    monkeypatch.setattr(ydl, "_now", lambda: pd.Timestamp("2024-03-08 18:00"))
+    later = ydl.download_latest("SPY", start="2024-01-01")
+    assert fake_dl[-1] == ("SPY", first.index[-1].strftime("%Y-%m-%d"), None)
+    assert later.index[-1] == pd.Timestamp("2024-03-08")
+    assert list(ydl.CACHE_DIR.glob("*.parquet")) == [ydl.CACHE_DIR / "SPY.parquet"]
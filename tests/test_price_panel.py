@@ -0,0 +1,59 @@
+# File: tests/test_price_panel.py
+
+import numpy as np
+import pandas as pd
+
+from tradingbot.data.panel import PricePanel, write_panel_dataset
+from tradingbot.signals.cross_sectional import compute_return_matrix
+
+
+def _frames():
+    idx = pd.bdate_range("2023-01-02", periods=30, name="Date")
+    out = {}
+    for k, t in enumerate(["AAA", "BBB", "^VIX"]):
+        px = 100 + k + np.arange(len(idx), dtype=float)
+        out[t] = pd.DataFrame(
+            {"Open": px, "High": px + 1, "Low": px - 1, "Close": px, "Volume": 1e6},
+            index=idx,
+        )
+    out["BBB"] = out["BBB"].iloc[10:]  # lists mid-sample
+    return out
+
+
+def test_from_frames_aligns_on_union_calendar():
+    panel = PricePanel.from_frames(_frames())
+    assert panel.shape == (30, 3)
+    close = panel["Close"]
+    assert np.isnan(close[:10, 1]).all() and not np.isnan(close[10:, 1]).any()
+    pd.testing.assert_frame_equal(
+        panel.ticker_frame("BBB"), _frames()["BBB"], check_freq=False
+    )
+
+
+def test_dataset_roundtrip_with_projection(tmp_path):
+    frames = _frames()
+    write_panel_dataset(frames, tmp_path / "panel")
+
+    panel = PricePanel.load(tmp_path / "panel", tickers=["^VIX", "AAA"])
+    assert panel.tickers == ["^VIX", "AAA"]
+    assert list(panel.fields) == ["Close"]  # other fields never loaded
+    np.testing.assert_array_equal(panel["Close"][:, 1], frames["AAA"]["Close"])
+
+    window = PricePanel.load(
+        tmp_path / "panel",
+        fields=("High", "Low"),
+        start="2023-01-16",
+        end="2023-01-20",
+        dtype=np.float32,
+    )
+    assert window.shape == (4, 3) and window["High"].dtype == np.float32
+
+
+def test_return_matrix_accepts_panel():
+    frames = _frames()
+    pd.testing.assert_frame_equal(
+        compute_return_matrix(PricePanel.from_frames(frames), window=5),
+        compute_return_matrix(frames, window=5),
+        check_freq=False,
+        check_names=False,
+    )
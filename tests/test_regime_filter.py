@@ -1,10 +1,12 @@
 # File: tests/test_regime_filter.py
 import os
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from tradingbot.signals.regime_filter import apply_regime_filter
+from tradingbot.signals.momentum import generate_mom_signal
+from tradingbot.signals.regime_filter import RegimeTimeline, apply_regime_filter
 
 
 def test_apply_regime_filter_integration():
@@ -96,3 +98,122 @@ def test_apply_regime_filter_preserves_non_zero():
             pytest.skip("Data download failed in CI environment")
         else:
             raise
+
+
+def _market(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2020-01-01", periods=n)
+    vix = pd.Series(rng.uniform(10, 40, n), index=dates)
+    spy = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, n))), index=dates)
+    return vix, spy
+
+
+def test_regime_timeline_memoized(monkeypatch):
+    """One regime computation per (start, series) no matter how many tickers."""
+    from tradingbot.signals import regime_filter
+
+    vix, spy = _market()
+    calls = []
+    real = regime_filter.load_regime
+
+    def counting(*args):
+        calls.append(args[0])
+        return real(*args)
+
+    monkeypatch.setattr(regime_filter, "load_regime", counting)
+    RegimeTimeline.clear()
+    index = vix.index[40:]
+    signals = {
+        f"T{i}": pd.Series(np.ones(len(index), dtype=int), index=index)
+        for i in range(20)
+    }
+    filtered = [
+        apply_regime_filter(s, vix_series=vix, spy_series=spy) for s in signals.values()
+    ]
+    assert calls == [str(index[0])[:10]]
+
+    # a changed series is a new version
+    apply_regime_filter(signals["T0"], vix_series=vix * 1.01, spy_series=spy)
+    assert len(calls) == 2
+
+    regime = real(str(index[0])[:10], vix, spy).reindex(index).ffill()
+    expected = signals["T0"].where(regime.isin(("calm", "normal")), 0)
+    for out in filtered:
+        pd.testing.assert_series_equal(out, expected)
+
+
+def test_run_strategy_one_regime_per_start(monkeypatch):
+    from tradingbot.signals import regime_filter
+    from tradingbot.strategy.runner import run_strategy
+
+    vix, spy = _market(seed=1)
+    calls = []
+    real = regime_filter.load_regime
+    monkeypatch.setattr(
+        regime_filter,
+        "load_regime",
+        lambda *a: calls.append(a[0]) or real(*a),
+    )
+    RegimeTimeline.clear()
+    rng = np.random.default_rng(2)
+    data = {
+        f"T{i}": pd.DataFrame(
+            {"Close": 50 * np.exp(np.cumsum(rng.normal(0, 0.02, len(vix))))},
+            index=vix.index,
+        )
+        for i in range(10)
+    }
+    data["LATE"] = data["T0"].iloc[60:]
+    out = run_strategy({"signals": ["momentum"]}, data, spy, vix)
+    assert sorted(calls) == sorted({str(vix.index[0])[:10], str(vix.index[60])[:10]})
+
+    for ticker, df in data.items():
+        sig = generate_mom_signal(df)
+        regime = real(str(df.index[0])[:10], vix, spy).reindex(df.index).ffill()
+        sig = sig.where(regime.isin(("calm", "normal")), 0)
+        pd.testing.assert_series_equal(
+            out[ticker], sig.where(sig >= 0, 0), check_freq=False, check_names=False
+        )
+
+
+def test_downloaded_regime_fetches_once_per_day(monkeypatch):
+    """Without series, repeated filters share one download per calendar day."""
+    from tradingbot.signals import regime_filter
+
+    dates = pd.bdate_range("2024-01-01", periods=80)
+    rng = np.random.default_rng(9)
+    market = {
+        "vix": pd.Series(rng.uniform(10, 40, len(dates)), dates, name="VIX"),
+        "spy": pd.Series(rng.uniform(0.05, 0.4, len(dates)), dates, name="SPY_vol"),
+    }
+    fetches = []
+
+    def _fake(name):
+        def load(start):
+            fetches.append(name)
+            return market[name]
+
+        return load
+
+    today = {"day": pd.Timestamp("2024-04-19")}
+    monkeypatch.setattr(regime_filter, "load_vix", _fake("vix"))
+    monkeypatch.setattr(regime_filter, "load_spy_vol", _fake("spy"))
+    monkeypatch.setattr(regime_filter, "_today", lambda: today["day"])
+    RegimeTimeline.clear()
+
+    sig = pd.Series(1, index=dates)
+    for _ in range(5):
+        apply_regime_filter(sig)
+    assert sorted(fetches) == ["spy", "vix"]
+    first = RegimeTimeline.load(str(dates[0].date()))
+
+    # The next day's call downloads again and sees the new bars
+    later = pd.bdate_range(dates[-1], periods=6)[1:]
+    for name, value in (("vix", 45.0), ("spy", 0.45)):
+        extra = pd.Series(value, index=later, name=market[name].name)
+        market[name] = pd.concat([market[name], extra])
+    today["day"] += pd.Timedelta(days=1)
+    second = RegimeTimeline.load(str(dates[0].date()))
+    assert second is not first and len(fetches) == 4
+    assert second.regime.index[-1] == later[-1]
+    RegimeTimeline.clear()
@@ -0,0 +1,110 @@
+# File: tests/test_signal_events.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingbot.backtest.vbt_runner import run_backtest
+from tradingbot.data.providers import SyntheticProvider
+from tradingbot.signals.events import (
+    SignalEvents,
+    day_major,
+    decode_signals,
+    encode_signals,
+)
+from tradingbot.strategy.runner import backtest_with_atr
+
+DATES = pd.bdate_range("2024-01-01", periods=8)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [0, 1, 1, 1, 0, 0, -1, -1],
+        [1, 1, 0, 0, 0, 0, 0, 1],
+        [0] * 8,
+        [1.0, np.nan, 1.0, 0.5, 0.5, 0.0, 0.0, 0.0],
+        [np.nan, np.nan, 1.0, 1.0, 0.0, np.nan, 0.0, 1.0],
+    ],
+)
+def test_round_trip_and_transitions(values):
+    dense = pd.Series(values, index=DATES, name="AAA")
+    ev = SignalEvents.from_dense(dense)
+    prev = dense.shift(fill_value=0)
+    assert len(ev) == int(((dense != prev) & ~(dense.isna() & prev.isna())).sum())
+    pd.testing.assert_series_equal(ev.to_dense(), dense)
+    np.testing.assert_array_equal(
+        [ev.value_at(i) for i in range(len(DATES))], dense.to_numpy()
+    )
+
+    up, down = ev.transitions()
+    step = dense.diff()
+    assert up.tolist() == np.flatnonzero(step > 0).tolist()
+    assert down.tolist() == np.flatnonzero(step < 0).tolist()
+
+
+def test_run_backtest_events_match_dense_with_leading_nan():
+    df = SyntheticProvider(seed=4).fetch("AAA", "2021-01-01", "2022-12-31")
+    rng = np.random.default_rng(3)
+    signal = pd.Series((rng.random(len(df)) < 0.05).cumsum() % 2, df.index)
+    signal = signal.astype(float)
+    signal.iloc[:30] = np.nan  # warm-up
+    signal.iloc[30] = 1.0  # NaN -> 1 is not an entry
+    signal.iloc[200:210] = np.nan
+
+    dense = run_backtest(df["Close"], signal)
+    events = run_backtest(df["Close"], SignalEvents.from_dense(signal))
+    assert dense.trades.count() == events.trades.count()
+    assert dense.total_return() == pytest.approx(events.total_return())
+
+
+def test_reindex_fills_missing_dates_with_zero():
+    dense = pd.Series([1, 1, 1, 0], index=DATES[[0, 1, 3, 5]])
+    ev = SignalEvents.from_dense(dense).reindex(DATES)
+    expected = dense.reindex(DATES).fillna(0).astype(dense.dtype)
+    pd.testing.assert_series_equal(ev.to_dense(), expected)
+
+
+def test_encode_decode_and_day_major():
+    signals = {
+        "B": pd.Series([0, 1, 1, 0, 0, 0, 0, 0], index=DATES),
+        "A": pd.Series([1, 1, 0, 0, 0, 1, 1, 1], index=DATES),
+        "Z": pd.Series([1] * 8, index=DATES),  # not in the universe
+    }
+    events = encode_signals(signals)
+    for t, s in decode_signals(events).items():
+        pd.testing.assert_series_equal(s, signals[t])
+
+    day, col, value = day_major(events, DATES, ["A", "B"])
+    assert list(zip(day, col, value)) == [
+        (0, 0, 1.0),
+        (1, 1, 1.0),
+        (2, 0, 0.0),
+        (3, 1, 0.0),
+        (5, 0, 1.0),
+    ]
+
+
+def test_backtest_with_atr_accepts_events():
+    provider = SyntheticProvider(seed=5)
+    data = {t: provider.fetch(t, "2021-01-01", "2022-12-31") for t in "ABCD"}
+    data["C"] = data["C"].iloc[60:]  # late listing
+    rng = np.random.default_rng(2)
+    signals = {
+        t: pd.Series((rng.random(len(df)) < 0.05).cumsum() % 2, index=df.index)
+        for t, df in data.items()
+    }
+    vix = pd.Series(18.0, index=data["A"].index)
+
+    dense = backtest_with_atr(
+        {"signals_dict": signals}, data, return_fills=True, vix_series=vix
+    )
+    sparse = backtest_with_atr(
+        {"signals_dict": encode_signals(signals)},
+        data,
+        return_fills=True,
+        vix_series=vix,
+    )
+    pd.testing.assert_series_equal(sparse[0], dense[0])
+    pd.testing.assert_frame_equal(sparse[1], dense[1])
+    assert not dense[1].empty
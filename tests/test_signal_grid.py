@@ -0,0 +1,49 @@
+# File: tests/test_signal_grid.py
+
+import numpy as np
+import pandas as pd
+
+from tradingbot.backtest.metrics import backtest_metrics, backtest_metrics_grid
+from tradingbot.data.providers import SyntheticProvider
+from tradingbot.signals.grid import expand_grid, mom_signal_grid, mr_signal_grid
+from tradingbot.signals.mean_reversion import generate_mr_signal
+from tradingbot.signals.momentum import generate_mom_signal
+
+
+def _df():
+    return SyntheticProvider(seed=21).fetch("GRID", "2020-01-01", "2022-12-31")
+
+
+def test_grid_points_match_single_generators():
+    df = _df()
+    mr = expand_grid({"enter_thresh": [-0.5, -1.0, -1.5], "window": [20, 40]})
+    sig = mr_signal_grid(df["Close"], mr["enter_thresh"], mr["window"])
+    assert sig.dtype == np.int8 and sig.shape == (6, len(df), 1)
+    for p, row in enumerate(mr.itertuples()):
+        ref = generate_mr_signal(df, enter_thresh=row.enter_thresh, window=[row.window])
+        np.testing.assert_array_equal(sig[p, :, 0], ref[row.window])
+
+    mom = expand_grid({"long_thresh": [0.0, 0.02], "window": [21, 63]})
+    for vol_adj in (False, True):
+        sig = mom_signal_grid(
+            df["Close"], mom["long_thresh"], mom["window"], use_vol_adjust=vol_adj
+        )
+        for p, row in enumerate(mom.itertuples()):
+            ref = generate_mom_signal(
+                df,
+                long_thresh=row.long_thresh,
+                window=[row.window],
+                use_vol_adjust=vol_adj,
+            )
+            np.testing.assert_array_equal(sig[p, :, 0], ref[row.window])
+
+
+def test_backtest_metrics_grid_matches_per_signal_metrics():
+    df = _df()
+    mr = expand_grid({"enter_thresh": [-0.5, -1.0], "window": [10, 10]})
+    sig = mr_signal_grid(df["Close"], mr["enter_thresh"], mr["window"])[:, :, 0]
+    grid = backtest_metrics_grid(df["Close"], sig)
+    assert len(grid) == len(sig)
+    for p in range(len(sig)):
+        ref = backtest_metrics(df["Close"], pd.Series(sig[p], index=df.index))
+        assert grid.iloc[p].to_dict() == ref
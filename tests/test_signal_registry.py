@@ -0,0 +1,161 @@
+# File: tests/test_signal_registry.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingbot.data.panel import PricePanel
+from tradingbot.data.providers import SyntheticProvider
+from tradingbot.features import graph as fg
+from tradingbot.signals import registry
+from tradingbot.signals.mean_reversion import generate_mr_signal
+from tradingbot.signals.momentum import generate_mom_signal
+from tradingbot.strategy.plan import REGIMES, build_plan
+from tradingbot.strategy.runner import run_strategy, run_strategy_panel
+
+
+@pytest.fixture
+def market():
+    provider = SyntheticProvider(seed=11)
+    frames = {t: provider.fetch(t, "2020-01-01", "2021-12-31") for t in "ABCD"}
+    dates = pd.bdate_range("2019-01-01", "2022-01-31")
+    rng = np.random.default_rng(4)
+    vix = pd.Series(rng.uniform(10, 40, len(dates)), index=dates)
+    spy = pd.Series(300 * np.exp(rng.normal(0, 0.01, len(dates)).cumsum()), dates)
+    return frames, spy, vix
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    """Isolated registry for tests that register plugins."""
+    monkeypatch.setattr(registry, "_PLUGINS", dict(registry._PLUGINS))
+    monkeypatch.setattr(registry, "_LAZY", dict(registry._LAZY))
+    return registry
+
+
+def test_build_plan_validates_configs():
+    with pytest.raises(ValueError, match="Unknown signal type"):
+        build_plan({"signals": ["carry"]})
+    with pytest.raises(ValueError, match="exactly one"):
+        build_plan({"signals": ["momentum", "x"], "cross_sectional": True})
+    with pytest.raises(ValueError, match="Unknown parameter 'windw'"):
+        build_plan({"signals": [{"name": "momentum", "windw": 5}]})
+    with pytest.raises(ValueError, match="top_n"):
+        build_plan({"signals": ["momentum"], "cross_sectional": True, "top_n": 0})
+    with pytest.raises(ValueError, match="non-empty"):
+        build_plan({"signals": []})
+
+
+def test_default_parameters_request_the_builtin_features():
+    plan = build_plan({"signals": ["momentum", "mean_reversion"]})
+    assert plan.requests() == [fg.cumulative_return(21), fg.rolling_zscore(20)]
+    plan = build_plan({"signals": ["mean_reversion"], "cross_sectional": True})
+    assert plan.metric == (fg.trailing_return(5), False)
+
+
+@pytest.mark.parametrize(
+    "entry, generate",
+    [
+        (
+            {"name": "momentum", "window": 10, "long_thresh": 0.0},
+            lambda df: generate_mom_signal(df, window=10, long_thresh=0.0),
+        ),
+        (
+            {"name": "mean_reversion", "window": 15, "enter_thresh": -1.0},
+            lambda df: generate_mr_signal(df, enter_thresh=-1.0, window=15),
+        ),
+        (
+            {"name": "mean_reversion", "hold": True, "exit_thresh": 0.5},
+            lambda df: generate_mr_signal(df, exit_thresh=0.5, hold=True),
+        ),
+    ],
+)
+def test_parameters_reach_the_generator(market, entry, generate):
+    frames, spy, vix = market
+    cfg = {"signals": [entry], "allowed_regimes": list(REGIMES)}
+    signals = run_strategy(cfg, frames, spy, vix)
+    for ticker, df in frames.items():
+        expected = generate(df).rename(ticker)
+        pd.testing.assert_series_equal(
+            signals[ticker], expected, check_dtype=False, check_freq=False
+        )
+
+
+def test_registered_plugin_runs_in_panel_and_dict_mode(plugins, market):
+    frames, spy, vix = market
+    plugins.register_signal(
+        registry.SignalPlugin(
+            name="above_mean",
+            params={"window": 30},
+            features=lambda window, **_: {
+                "close": fg.field("Close"),
+                "mean": fg.rolling_mean(fg.field("Close"), window),
+            },
+            panel=lambda f, **_: (f["close"] > f["mean"]).astype(int),
+        )
+    )
+    assert "above_mean" in plugins.available_signals()
+    cfg = {
+        "signals": [{"name": "above_mean", "window": 10}, "momentum"],
+        "allowed_regimes": list(REGIMES),
+    }
+    signals = run_strategy(cfg, frames, spy, vix)
+    for ticker, df in frames.items():
+        above = (df["Close"] > df["Close"].rolling(10).mean()).astype(int)
+        expected = above & generate_mom_signal(df)
+        assert (signals[ticker] == expected).all()
+
+    panel = run_strategy_panel(cfg, PricePanel.from_frames(frames), spy, vix)
+    for ticker in frames:
+        assert (panel[ticker].to_numpy() == signals[ticker].to_numpy()).all()
+
+    with pytest.raises(ValueError, match="already registered"):
+        plugins.register_signal(plugins.get_signal("above_mean"))
+    with pytest.raises(ValueError, match="cross-sectional metric"):
+        build_plan({"signals": ["above_mean"], "cross_sectional": True})
+
+
+def test_lazy_plugins_are_imported_on_first_lookup(plugins):
+    plugins._PLUGINS.pop("momentum", None)
+    plugins._LAZY["momentum"] = "tradingbot.signals.momentum:MOMENTUM"
+    plugins.register_lazy("mom_alias", "tradingbot.signals.momentum:MOMENTUM")
+    assert {"momentum", "mom_alias"} <= set(plugins.available_signals())
+    assert plugins.get_signal("momentum").params["window"] == 21
+    assert "momentum" in plugins._PLUGINS
+    with pytest.raises(ValueError, match="not 'mom_alias'"):
+        plugins.get_signal("mom_alias")
+
+
+def test_masked_config_skips_signal_evaluation(plugins, market):
+    frames, spy, vix = market
+
+    def fail(*args, **kwargs):
+        raise AssertionError("masked signals must not be evaluated")
+
+    plugins.register_signal(registry.SignalPlugin("never", {}, fail, fail))
+    for cfg in (
+        {"signals": ["never"], "allowed_regimes": []},
+        {"signals": ["momentum", "never"], "allowed_regimes": ["sideways"]},
+    ):
+        plan = build_plan(cfg)
+        assert plan.masked and plan.requests() == []
+        signals = run_strategy(cfg, frames, spy, vix)
+        for ticker, df in frames.items():
+            assert signals[ticker].index.equals(df.index)
+            assert (signals[ticker] == 0).all()
+
+
+def test_concurrent_evaluation_matches_serial(market):
+    frames, spy, vix = market
+    cfg = {
+        "signals": [
+            "momentum",
+            "mean_reversion",
+            {"name": "momentum", "window": 5, "use_vol_adjust": True},
+        ],
+        "long_short": True,
+    }
+    serial = run_strategy(cfg, frames, spy, vix, max_workers=1)
+    threaded = run_strategy(cfg, frames, spy, vix, max_workers=3)
+    for ticker in frames:
+        pd.testing.assert_series_equal(threaded[ticker], serial[ticker])
@@ -0,0 +1,78 @@
+# File: tests/test_strategy_panel.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingbot.data.panel import PricePanel
+from tradingbot.data.providers import SyntheticProvider
+from tradingbot.strategy.runner import (
+    run_strategy,
+    run_strategy_panel,
+    signals_to_dict,
+)
+
+CONFIGS = [
+    {"signals": ["momentum"]},
+    {"signals": ["momentum", "mean_reversion"], "long_short": True},
+    {"signals": ["mean_reversion"], "allowed_regimes": ["calm"]},
+    {"signals": ["momentum"], "cross_sectional": True, "top_n": 2},
+]
+
+
+@pytest.fixture
+def market():
+    provider = SyntheticProvider(seed=17)
+    frames = {t: provider.fetch(t, "2020-01-01", "2022-06-30") for t in "ABCDE"}
+    dates = pd.bdate_range("2019-01-01", "2022-07-29")
+    rng = np.random.default_rng(1)
+    vix = pd.Series(rng.uniform(10, 40, len(dates)), index=dates)
+    spy = pd.Series(300 * np.exp(rng.normal(0, 0.01, len(dates)).cumsum()), dates)
+    return frames, spy, vix
+
+
+@pytest.mark.parametrize("cfg", CONFIGS)
+def test_panel_mode_matches_per_ticker_runner(market, cfg):
+    frames, spy, vix = market
+    panel = PricePanel.from_frames(frames)
+    signals = run_strategy_panel(cfg, panel, spy, vix)
+    assert signals.shape == panel.shape
+    assert list(signals.columns) == panel.tickers
+
+    expected = run_strategy(cfg, frames, spy, vix)
+    adapted = signals_to_dict(signals)
+    assert list(adapted) == list(expected)
+    for ticker, sig in expected.items():
+        pd.testing.assert_series_equal(adapted[ticker], sig, check_freq=False)
+
+
+def test_adapter_keeps_each_tickers_own_dates(market):
+    frames, spy, vix = market
+    frames["E"] = frames["E"].iloc[100:]
+    panel = PricePanel.from_frames(frames)
+    signals = signals_to_dict(
+        run_strategy_panel({"signals": ["momentum"]}, panel, spy, vix), panel
+    )
+    assert signals["E"].index.equals(frames["E"].index)
+    assert signals["A"].index.equals(frames["A"].index)
+
+
+def test_cross_sectional_skips_warm_up_and_unlisted_dates(market):
+    frames, spy, vix = market
+    frames["E"] = frames["E"].iloc[100:]
+    cfg = {
+        "signals": [{"name": "momentum", "rank_window": 20}],
+        "cross_sectional": True,
+        "top_n": 2,
+        "allowed_regimes": ["calm", "normal", "turbulent"],
+    }
+    panel = PricePanel.from_frames(frames)
+    signals = run_strategy_panel(cfg, panel, spy, vix)
+    assert (signals.iloc[:20] == 0).all().all()
+    assert (signals["E"].iloc[:120] == 0).all()
+    assert (signals.iloc[20:].sum(axis=1) == 2).all()
+
+    per_ticker = run_strategy(cfg, frames, spy, vix)
+    assert all((sig.iloc[:20] == 0).all() for sig in per_ticker.values())
+    assert (per_ticker["E"].iloc[:20] == 0).all()
+    assert per_ticker["A"].iloc[20:].sum() > 0
@@ -0,0 +1,69 @@
+# File: tests/test_window_tensors.py
+
+import numpy as np
+import pytest
+
+from tradingbot.data.panel import PricePanel
+from tradingbot.data.providers import SyntheticProvider
+from tradingbot.features.tensors import WindowTensorBuilder
+
+
+def _panel():
+    provider = SyntheticProvider(seed=9)
+    frames = {t: provider.fetch(t, "2020-01-01", "2021-06-30") for t in "ABCDE"}
+    frames["E"] = frames["E"].iloc[40:]  # late listing
+    panel = PricePanel.from_frames(frames)
+    panel.fields["Close"][100, 1] = np.nan  # missing bar
+    return panel
+
+
+def test_windows_are_views_with_causal_labels():
+    panel = _panel()
+    builder = WindowTensorBuilder(panel, lookback=10, horizon=3)
+    feats, label = builder.base(slice(0, 5))
+    windows = builder.windows(feats)
+    assert feats.dtype == windows.dtype == np.float32
+    assert windows.shape == (5, len(panel.dates) - 9, 10, 4)
+    assert np.shares_memory(windows, feats)
+
+    close = panel.fields["Close"]
+    j, s = 2, 50
+    t = s + 9
+    np.testing.assert_array_equal(windows[j, s], feats[j, s : t + 1])
+    np.testing.assert_allclose(label[j, t], close[t + 3, j] / close[t, j] - 1, 1e-6)
+
+    # changing bars after t moves the label but never the window
+    before = windows[j, s].copy()
+    panel.fields["Close"][t + 1 :, j] *= 1.5
+    feats2, _ = builder.base(slice(0, 5))
+    np.testing.assert_array_equal(builder.windows(feats2)[j, s], before)
+
+
+def test_batches_drop_incomplete_samples_and_match_full_build():
+    panel = _panel()
+    builder = WindowTensorBuilder(panel, lookback=10, horizon=1, tickers_per_chunk=2)
+    full = builder.build()
+    assert np.isfinite(full.X).all() and np.isfinite(full.y).all()
+    assert full.X.shape[1:] == (10, 4)
+
+    # no window of ticker B contains the missing bar (date 100 + its return)
+    b_dates = full.dates[full.tickers == "B"]
+    bad = panel.dates[100:102]
+    ends = panel.dates.get_indexer(b_dates)
+    assert not any(((ends >= 100) & (ends - 9 <= 101)))
+    assert not set(bad) & set(b_dates)
+    # E starts 40 bars late: first window ends after its first return
+    e_first = panel.dates.get_loc(full.dates[full.tickers == "E"][0])
+    assert e_first == 40 + 10
+
+    parts = list(builder.batches(batch_size=100))
+    assert max(len(p.y) for p in parts) == 100
+    np.testing.assert_array_equal(np.concatenate([p.X for p in parts]), full.X)
+    one_chunk = WindowTensorBuilder(panel, lookback=10, tickers_per_chunk=50).build()
+    np.testing.assert_array_equal(one_chunk.X, full.X)
+    np.testing.assert_array_equal(one_chunk.y, full.y)
+
+
+def test_rejects_unknown_features():
+    with pytest.raises(ValueError, match="Unknown feature"):
+        WindowTensorBuilder(_panel(), features=["rsi"])